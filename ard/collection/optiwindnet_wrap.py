@@ -1,27 +1,80 @@
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import hashlib
+
 import networkx as nx
+import numba
 import numpy as np
-
-from optiwindnet.mesh import make_planar_embedding
-from optiwindnet.interarraylib import L_from_site
-from optiwindnet.heuristics import EW_presolver
-from optiwindnet.MILP import OWNWarmupFailed, solver_factory, ModelOptions
+import scipy.sparse
+import scipy.sparse.csgraph
 
 from . import templates
 
+# optiwindnet (and its solver/mesh stack) is imported on first use
+make_planar_embedding = None
+L_from_site = None
+EW_presolver = None
+OWNWarmupFailed = None
+solver_factory = None
+ModelOptions = None
+PathFinder = None
+G_from_S = None
+
+
+def _import_optiwindnet():
+    """Import the optiwindnet functionality used here, once, into the module."""
+    global make_planar_embedding, L_from_site, EW_presolver
+    global OWNWarmupFailed, solver_factory, ModelOptions, PathFinder, G_from_S
+    if make_planar_embedding is not None:
+        return
+    from optiwindnet.mesh import make_planar_embedding as _make_planar_embedding
+    from optiwindnet.interarraylib import L_from_site, G_from_S
+    from optiwindnet.pathfinding import PathFinder
+    from optiwindnet.heuristics import EW_presolver
+    from optiwindnet.MILP import OWNWarmupFailed, solver_factory, ModelOptions
+
+    # set last, as it flags the import as complete
+    make_planar_embedding = _make_planar_embedding
+
+
+# number of distinct problem instances whose mesh/presolve results and solutions
+# are retained
+_PROBLEM_CACHE_SIZE = 4
+
+# edges shorter than this are treated as zero-length (no gradient contribution)
+_ZERO_LENGTH_TOL = 1e-8
+
 
 def _own_L_from_inputs(inputs: dict, discrete_inputs: dict) -> nx.Graph:
+    _import_optiwindnet()
     T = len(inputs["x_turbines"])
     R = len(inputs["x_substations"])
     name_case = "farm"
     if discrete_inputs["x_border"] is not None:
-        B = len(discrete_inputs["x_border"])
+        x_border = discrete_inputs["x_border"]
+        y_border = discrete_inputs["y_border"]
     else:
-        B = 0
-    VertexC = np.empty((R + T + B, 2), dtype=float)
-    VertexC[:T, 0] = inputs["x_turbines"]
-    VertexC[:T, 1] = inputs["y_turbines"]
-    VertexC[-R:, 0] = inputs["x_substations"]
-    VertexC[-R:, 1] = inputs["y_substations"]
+        x_border = y_border = np.empty(0)
+    B = len(x_border)
+    # vertices are ordered as turbines, border, substations
+    VertexC = np.column_stack(
+        (
+            np.concatenate(
+                [
+                    np.ravel(inputs["x_turbines"]),
+                    np.ravel(x_border),
+                    np.ravel(inputs["x_substations"]),
+                ]
+            ),
+            np.concatenate(
+                [
+                    np.ravel(inputs["y_turbines"]),
+                    np.ravel(y_border),
+                    np.ravel(inputs["y_substations"]),
+                ]
+            ),
+        )
+    ).astype(float, copy=False)
     site = dict(
         T=T,
         R=R,
@@ -30,13 +83,327 @@ def _own_L_from_inputs(inputs: dict, discrete_inputs: dict) -> nx.Graph:
         VertexC=VertexC,
     )
     if B > 0:
-        VertexC[T:-R, 0] = discrete_inputs["x_border"]
-        VertexC[T:-R, 1] = discrete_inputs["y_border"]
         site["B"] = B
         site["border"] = np.arange(T, T + B)
     return L_from_site(**site)
 
 
+def _own_problem_key(L: nx.Graph, capacity: int) -> bytes:
+    """
+    Build a content-addressable key for the location graph of a problem.
+
+    The planar embedding and the set of available links carry edge lengths, so
+    the key covers the exact vertex coordinates in addition to the vertex counts,
+    the border indices and the cable capacity: only a layout that was already
+    evaluated (e.g. revisited by a line search) reuses the cached results.
+
+    Parameters
+    ----------
+    L : nx.Graph
+        the location graph of the problem instance
+    capacity : int
+        the maximum number of turbines per string
+
+    Returns
+    -------
+    bytes
+        a digest identifying the problem instance
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(
+        np.ascontiguousarray(
+            [L.graph["T"], L.graph["R"], L.graph.get("B", 0), capacity],
+            dtype=np.int64,
+        ).tobytes()
+    )
+    border = L.graph.get("border")
+    if border is not None:
+        hasher.update(np.ascontiguousarray(border, dtype=np.int64).tobytes())
+    hasher.update(np.ascontiguousarray(L.graph["VertexC"], dtype=float).tobytes())
+    return hasher.digest()
+
+
+def _own_G_to_csr(G: nx.Graph) -> tuple:
+    """
+    Pack the routeset graph into compressed sparse row (CSR) adjacency arrays.
+
+    Node labels are shifted by `R` so that the substations (negative labels) map
+    to the first rows of the arrays.
+
+    Parameters
+    ----------
+    G : nx.Graph
+        the routeset graph returned by the optiwindnet solver
+
+    Returns
+    -------
+    indptr : np.ndarray
+        a 1D int array of row offsets into `indices`, with length `N_nodes + 1`
+    indices : np.ndarray
+        a 1D int array of the (shifted) neighbor labels of each node
+    lengths : np.ndarray
+        a 1D float array of the length of the edge to each neighbor
+    loads : np.ndarray
+        a 1D float array of the load of the edge to each neighbor
+    """
+    R = G.graph["R"]
+    num_edges = G.number_of_edges()
+    edges = np.fromiter(
+        (n for uv in G.edges for n in uv), dtype=np.int64, count=2 * num_edges
+    ).reshape(-1, 2)
+    edges += R
+    lengths = np.fromiter(
+        (length for *_, length in G.edges(data="length")),
+        dtype=float,
+        count=num_edges,
+    )
+    loads = np.fromiter(
+        (load for *_, load in G.edges(data="load")), dtype=float, count=num_edges
+    )
+    # each undirected edge appears once in each direction
+    src = np.concatenate((edges[:, 0], edges[:, 1]))
+    dst = np.concatenate((edges[:, 1], edges[:, 0]))
+    order = np.argsort(src, kind="stable")
+    indptr = np.searchsorted(src[order], np.arange(max(G.nodes) + R + 2), side="left")
+    return indptr, dst[order], np.tile(lengths, 2)[order], np.tile(loads, 2)[order]
+
+
+def _own_feeder_entries(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    loads: np.ndarray,
+    S_edges: np.ndarray,
+    S_load: np.ndarray,
+    T: int,
+    R: int,
+) -> np.ndarray:
+    """
+    Find the first hop of every detoured feeder in the routeset adjacency arrays.
+
+    A detoured feeder leaves its turbine through the only non-turbine neighbor
+    whose edge carries the feeder's load, so the links from turbines to detour
+    nodes are indexed by (turbine, load) and looked up for all feeders at once.
+
+    Parameters
+    ----------
+    indptr, indices, loads : np.ndarray
+        the routeset adjacency arrays produced by `_own_G_to_csr`
+    S_edges : np.ndarray
+        a 2D int array of the edges of the solution topology `S`
+    S_load : np.ndarray
+        a 1D float array of the `load` attribute of the edges of `S`
+    T : int
+        the number of turbines
+    R : int
+        the number of substations
+
+    Returns
+    -------
+    np.ndarray
+        a 1D int array with, for each edge of `S`, the position in `indices` of
+        the first hop of its detoured route, or -1 if it is not a detoured feeder
+    """
+    feeder_hops = np.full((S_edges.shape[0],), -1, dtype=np.int64)
+    rows = np.repeat(np.arange(indptr.size - 1), np.diff(indptr))
+    entry_k = np.flatnonzero((rows >= R) & (rows < T + R) & (indices >= T + R))
+    if entry_k.size == 0:
+        return feeder_hops
+    entry_keys = rows[entry_k] * (T + 1) + loads[entry_k].astype(np.int64)
+    order = np.argsort(entry_keys)
+    entry_keys, entry_k = entry_keys[order], entry_k[order]
+    # feeders are the edges of S with a substation (negative label) endpoint
+    query_keys = (S_edges.max(axis=1) + R) * (T + 1) + S_load.astype(np.int64)
+    pos = np.minimum(np.searchsorted(entry_keys, query_keys), entry_keys.size - 1)
+    is_detour = (S_edges.min(axis=1) < 0) & (entry_keys[pos] == query_keys)
+    feeder_hops[is_detour] = entry_k[pos[is_detour]]
+    return feeder_hops
+
+
+@numba.njit(cache=True)
+def _own_detour_lengths(
+    indices, lengths, first_hops, turbines, hop_pairs, hop_lengths, T, R
+):
+    """
+    Walk a batch of detoured feeder routes from their turbines to the substation.
+
+    Detour nodes have exactly two neighbors, tabulated in `hop_pairs`, so each
+    step of a walk reads one row and keeps the neighbor it did not come from.
+
+    Parameters
+    ----------
+    indices, lengths : np.ndarray
+        the routeset adjacency arrays produced by `_own_G_to_csr`
+    first_hops : np.ndarray
+        a 1D int array of the positions in `indices` of the first hops
+    turbines : np.ndarray
+        a 1D int array of the turbines at the far end of the feeders
+    hop_pairs : np.ndarray
+        a 2D int array of the (shifted) neighbors of each detour node
+    hop_lengths : np.ndarray
+        a 2D float array of the lengths of the edges in `hop_pairs`
+    T : int
+        the number of turbines
+    R : int
+        the number of substations
+
+    Returns
+    -------
+    np.ndarray
+        a 1D float array of the lengths of the detoured feeder routes
+    """
+    detour_lengths = np.empty(first_hops.size)
+    for f in range(first_hops.size):
+        length = lengths[first_hops[f]]
+        prev_hop, cur_hop = turbines[f] + R, indices[first_hops[f]]
+        while cur_hop >= T + R:
+            row = cur_hop - T - R
+            side = 1 if hop_pairs[row, 0] == prev_hop else 0
+            length += hop_lengths[row, side]
+            prev_hop, cur_hop = cur_hop, hop_pairs[row, side]
+        detour_lengths[f] = length
+    return detour_lengths
+
+
+@numba.njit(cache=True)
+def _own_length_gradients(u, v, Vx, Vy, gradients_x, gradients_y):
+    """
+    Accumulate the gradient of the total edge length w.r.t. the vertex positions.
+
+    Each edge adds its unit vector to the gradient of endpoint `u` and subtracts
+    it from that of endpoint `v`; zero-length edges contribute nothing.
+
+    Parameters
+    ----------
+    u, v : np.ndarray
+        1D int arrays of the (non-negative) vertex indices of the edge endpoints
+    Vx, Vy : np.ndarray
+        1D float arrays of the vertex coordinates
+    gradients_x, gradients_y : np.ndarray
+        1D float arrays, accumulated in place, with the length of `Vx`
+    """
+    for k in range(u.size):
+        dx = Vx[u[k]] - Vx[v[k]]
+        dy = Vy[u[k]] - Vy[v[k]]
+        norm = np.sqrt(dx * dx + dy * dy)
+        if norm <= _ZERO_LENGTH_TOL:
+            continue
+        dx /= norm
+        dy /= norm
+        gradients_x[u[k]] += dx
+        gradients_x[v[k]] -= dx
+        gradients_y[u[k]] += dy
+        gradients_y[v[k]] -= dy
+
+
+def _own_race_solvers(
+    solver,
+    solver_names: list,
+    P: nx.PlanarEmbedding,
+    A: nx.Graph,
+    capacity: int,
+    model_options: "ModelOptions",
+    S_warm: nx.Graph | None,
+    solver_options: dict,
+) -> tuple:
+    """
+    Solve the same collection problem with several MILP backends at once.
+
+    The already set-up `solver` races one freshly created solver per name in
+    `solver_names`, each in its own thread and with the same warm start. The
+    first backend to return a solution wins; the remaining ones are not
+    interruptible, so they run on (up to their time limit) in the returned
+    executor, which must be shut down before `solver` is used again.
+
+    Parameters
+    ----------
+    solver : optiwindnet.MILP.Solver
+        a solver on which `set_problem` has already been called
+    solver_names : list
+        the names of the additional backends to race against `solver`
+    P : nx.PlanarEmbedding
+        the planar embedding of the problem
+    A : nx.Graph
+        the graph of available links of the problem
+    capacity : int
+        the maximum number of turbines per string
+    model_options : ModelOptions
+        the optiwindnet MILP model options
+    S_warm : nx.Graph or None
+        the warm start solution topology, if any
+    solver_options : dict
+        keyword arguments for `Solver.solve`
+
+    Returns
+    -------
+    S : nx.Graph
+        the solution topology of the winning backend
+    G : nx.Graph
+        the routeset of the winning backend
+    executor : ThreadPoolExecutor
+        the executor still running the losing backends
+    """
+
+    def _solve(solver, name=None):
+        if name is not None:
+            solver = solver_factory(name)
+            try:
+                solver.set_problem(P, A, capacity, model_options, warmstart=S_warm)
+            except OWNWarmupFailed:
+                solver.set_problem(P, A, capacity, model_options)
+        solver.solve(**solver_options)
+        return solver.get_solution()
+
+    executor = ThreadPoolExecutor(max_workers=1 + len(solver_names))
+    futures = [executor.submit(_solve, solver)] + [
+        executor.submit(_solve, None, name) for name in solver_names
+    ]
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return *future.result(), executor
+    # every backend failed: report the error from the primary solver
+    executor.shutdown()
+    return *futures[0].result(), executor
+
+
+def _own_length_lower_bound(A: nx.Graph) -> float:
+    """
+    Compute a lower bound on the total cable length of a collection system.
+
+    Every feasible network is a spanning tree of the turbines and the substations
+    contracted into a single node, so the minimum spanning tree over the available
+    links (and the shortest turbine-to-substation distances) bounds it from below.
+
+    Parameters
+    ----------
+    A : nx.Graph
+        the graph of available links of the problem
+
+    Returns
+    -------
+    float
+        the length of the minimum spanning tree
+    """
+    T = A.graph["T"]
+    edges = np.array(
+        [
+            (u, v, length)
+            for u, v, length in A.edges(data="length")
+            if 0 <= u < T and 0 <= v < T
+        ]
+    ).reshape(-1, 3)
+    # node T stands for all substations
+    rows = np.concatenate((edges[:, 0], np.arange(T)))
+    cols = np.concatenate((edges[:, 1], np.full(T, T)))
+    weights = np.concatenate((edges[:, 2], A.graph["d2roots"][:T].min(axis=1)))
+    graph = scipy.sparse.coo_array(
+        (weights, (rows.astype(int), cols.astype(int))), shape=(T + 1, T + 1)
+    )
+    return scipy.sparse.csgraph.minimum_spanning_tree(graph).sum()
+
+
 class OptiwindnetCollection(templates.CollectionTemplate):
     """
     Component class for modeling optiwindnet-optimized energy collection systems.
@@ -90,6 +457,10 @@ class OptiwindnetCollection(templates.CollectionTemplate):
         """Initialization of OM component."""
         super().initialize()
         self.S_previous: nx.Graph | None = None
+        self._S_previous_signature: tuple | None = None
+        self._problem_cache: OrderedDict = OrderedDict()
+        self._solvers: dict = {}
+        self._race_executor: ThreadPoolExecutor | None = None
 
     def setup(self):
         """Setup of OM component."""
@@ -98,9 +469,19 @@ class OptiwindnetCollection(templates.CollectionTemplate):
     def setup_partials(self):
         """Setup of OM component gradients."""
 
+        # the output is a scalar, so each partial is a single (dense) row
+        self.declare_partials(
+            ["total_length_cables"],
+            ["x_turbines", "y_turbines"],
+            rows=np.zeros(self.N_turbines, dtype=int),
+            cols=np.arange(self.N_turbines),
+            method="exact",
+        )
         self.declare_partials(
             ["total_length_cables"],
-            ["x_turbines", "y_turbines", "x_substations", "y_substations"],
+            ["x_substations", "y_substations"],
+            rows=np.zeros(self.N_substations, dtype=int),
+            cols=np.arange(self.N_substations),
             method="exact",
         )
 
@@ -115,6 +496,8 @@ class OptiwindnetCollection(templates.CollectionTemplate):
         Computation for the OptiWindNet collection system design
         """
 
+        _import_optiwindnet()
+
         max_turbines_per_string = self.modeling_options["collection"][
             "max_turbines_per_string"
         ]
@@ -124,24 +507,233 @@ class OptiwindnetCollection(templates.CollectionTemplate):
         L = _own_L_from_inputs(inputs, discrete_inputs)
         T = L.graph["T"]
 
-        # create planar embedding and set of available links
-        P, A = make_planar_embedding(L)
+        key = _own_problem_key(L, max_turbines_per_string)
+
+        # each cached problem instance holds its mesh and presolve results and, when
+        # solutions are cached, the solution itself
+        cache_solutions = self.modeling_options["collection"].get(
+            "cache_solutions", True
+        )
+        cache_topology = self.modeling_options["collection"].get("cache_topology", True)
+        entry = self._problem_cache.get(key)
+        if entry is not None:
+            self._problem_cache.move_to_end(key)
+
+        # skip the solve entirely if this problem instance was just solved
+        if cache_solutions and entry is not None and entry[3] is not None:
+            S, G, G_csr, terse_links, length_cables, load_cables = entry[3]
+            self._pack_outputs(
+                S,
+                G,
+                G_csr,
+                terse_links.copy(),
+                length_cables.copy(),
+                load_cables.copy(),
+                outputs,
+                discrete_outputs,
+            )
+            return
+
+        # create planar embedding and set of available links, reusing the cached
+        # mesh and presolve results when this problem instance was seen before
+        if cache_topology and entry is not None:
+            P, A, S_presolve, _ = entry
+        else:
+            P, A = make_planar_embedding(L)
+            S_presolve = None
 
-        solver = solver_factory(solver_name)
+        # reuse the solver backend across calls (set_problem rebuilds the model)
+        if solver_name not in self._solvers:
+            self._solvers[solver_name] = solver_factory(solver_name)
 
         model_options = self.modeling_options["collection"]["model_options"]
-        # start from previous solution if available, else from heuristic if it fits
-        if self.S_previous is not None:
-            S_warm = self.S_previous
-        elif (
+        use_presolver = (
             model_options.get("topology") == "branched"
             and model_options.get("feeder_limit") == "unlimited"
             and model_options.get("feeder_route") == "segmented"
+        )
+        # the previous solution is only a candidate warm start for the same problem
+        # size and cable capacity
+        persist_warmstart = self.modeling_options["collection"].get(
+            "persist_warmstart", True
+        )
+        signature = (T, L.graph["R"], max_turbines_per_string)
+        # start from previous solution if available, else from heuristic if it fits
+        if (
+            persist_warmstart
+            and self.S_previous is not None
+            and self._S_previous_signature == signature
         ):
-            S_warm = EW_presolver(A, capacity=max_turbines_per_string)
+            S_warm = self.S_previous
+        elif use_presolver:
+            if S_presolve is None:
+                S_presolve = EW_presolver(A, capacity=max_turbines_per_string)
+            S_warm = S_presolve
         else:
             S_warm = None
 
+        # accept the heuristic solution outright if it is provably good enough
+        S = None
+        accept_pct = self.modeling_options["collection"].get(
+            "accept_heuristic_if_within_pct"
+        )
+        if accept_pct is not None and use_presolver:
+            if S_presolve is None:
+                S_presolve = EW_presolver(A, capacity=max_turbines_per_string)
+            G_presolve = PathFinder(
+                G_from_S(S_presolve, A), P, A, branched=True
+            ).create_detours()
+            if G_presolve.size(weight="length") <= (
+                1.0 + 0.01 * accept_pct
+            ) * _own_length_lower_bound(A):
+                S, G = S_presolve, G_presolve
+
+        if S is None:
+            S, G, S_presolve = self._solve_milp(
+                solver_name,
+                P,
+                A,
+                max_turbines_per_string,
+                model_options,
+                S_warm,
+                S_presolve,
+                use_presolver,
+            )
+
+        self.S_previous = S
+        self._S_previous_signature = signature
+
+        # extract the outputs
+        terse_links = np.zeros((T,), dtype=np.int_)
+        length_cables = np.zeros((T,))
+        load_cables = np.zeros((T,))
+
+        R = L.graph["R"]
+        # gather the edge data of S as arrays
+        num_links = S.number_of_edges()
+        S_edges = np.fromiter(
+            (n for uv in S.edges for n in uv), dtype=np.int64, count=2 * num_links
+        ).reshape(-1, 2)
+        S_reverse = np.fromiter(
+            (rev for *_, rev in S.edges(data="reverse")), dtype=bool, count=num_links
+        )
+        S_load = np.fromiter(
+            (load for *_, load in S.edges(data="load")), dtype=float, count=num_links
+        )
+        u, v = S_edges.min(axis=1), S_edges.max(axis=1)
+
+        # convert the graph to array representing the tree (edges i->terse[i])
+        i = np.where(S_reverse, u, v)
+        terse_links[i] = np.where(S_reverse, v, u)
+        load_cables[i] = S_load
+
+        # links (u, v) that are not feeders have length data in A
+        is_feeder = u < 0
+        length_cables[i[~is_feeder]] = [
+            A[s][t]["length"] for s, t in zip(u[~is_feeder], v[~is_feeder])
+        ]
+        # feeders <u, v> either have a straight route or are segmented (detoured)
+        G_csr = _own_G_to_csr(G)
+        indptr, indices, lengths, loads = G_csr
+        feeder_hops = _own_feeder_entries(indptr, indices, loads, S_edges, S_load, T, R)
+        is_straight = is_feeder & (feeder_hops < 0)
+        length_cables[i[is_straight]] = A.graph["d2roots"][
+            v[is_straight], u[is_straight] + R
+        ]
+        is_detour = feeder_hops >= 0
+        if np.any(is_detour):
+            # both neighbors of each detour node (labels from T + R on)
+            first = indptr[T + R : -1]
+            second = np.minimum(first + 1, indices.size - 1)
+            length_cables[i[is_detour]] = _own_detour_lengths(
+                indices,
+                lengths,
+                feeder_hops[is_detour],
+                v[is_detour],
+                np.column_stack((indices[first], indices[second])),
+                np.column_stack((lengths[first], lengths[second])),
+                T,
+                R,
+            )
+
+        if cache_topology or cache_solutions:
+            solution = (
+                (
+                    S,
+                    G,
+                    G_csr,
+                    terse_links.copy(),
+                    length_cables.copy(),
+                    load_cables.copy(),
+                )
+                if cache_solutions
+                else None
+            )
+            self._problem_cache[key] = (P, A, S_presolve, solution)
+            while len(self._problem_cache) > _PROBLEM_CACHE_SIZE:
+                self._problem_cache.popitem(last=False)
+
+        self._pack_outputs(
+            S,
+            G,
+            G_csr,
+            terse_links,
+            length_cables,
+            load_cables,
+            outputs,
+            discrete_outputs,
+        )
+
+    def _solve_milp(
+        self,
+        solver_name: str,
+        P: nx.PlanarEmbedding,
+        A: nx.Graph,
+        max_turbines_per_string: int,
+        model_options: dict,
+        S_warm: nx.Graph | None,
+        S_presolve: nx.Graph | None,
+        use_presolver: bool,
+    ) -> tuple:
+        """
+        Set up and solve the collection system MILP.
+
+        Parameters
+        ----------
+        solver_name : str
+            the name of the primary optiwindnet solver backend
+        P : nx.PlanarEmbedding
+            the planar embedding of the problem
+        A : nx.Graph
+            the graph of available links of the problem
+        max_turbines_per_string : int
+            the maximum number of turbines per string
+        model_options : dict
+            the optiwindnet MILP model options
+        S_warm : nx.Graph or None
+            the warm start solution topology, if any
+        S_presolve : nx.Graph or None
+            the heuristic solution topology, if already computed
+        use_presolver : bool
+            whether the heuristic is applicable to the model options
+
+        Returns
+        -------
+        S : nx.Graph
+            the solution topology
+        G : nx.Graph
+            the routeset of the solution
+        S_presolve : nx.Graph or None
+            the heuristic solution topology, if computed
+        """
+
+        # wait for the losers of the previous race, so that the backends are idle
+        # and earlier races do not compete with this solve for the CPU
+        if self._race_executor is not None:
+            self._race_executor.shutdown(wait=True)
+            self._race_executor = None
+
+        solver = self._solvers[solver_name]
         try:
             solver.set_problem(
                 P,
@@ -151,65 +743,93 @@ class OptiwindnetCollection(templates.CollectionTemplate):
                 warmstart=S_warm,
             )
         except OWNWarmupFailed:
-            # the previous solution is no longer feasible
-            solver.set_problem(
+            # the previous solution is no longer feasible: retry from the heuristic
+            if S_warm is self.S_previous and use_presolver:
+                if S_presolve is None:
+                    S_presolve = EW_presolver(A, capacity=max_turbines_per_string)
+                S_warm = S_presolve
+            else:
+                S_warm = None
+            try:
+                solver.set_problem(
+                    P,
+                    A,
+                    max_turbines_per_string,
+                    ModelOptions(**model_options),
+                    warmstart=S_warm,
+                )
+            except OWNWarmupFailed:
+                solver.set_problem(
+                    P,
+                    A,
+                    max_turbines_per_string,
+                    ModelOptions(**model_options),
+                )
+
+        # do the branch-and-bound MILP search, optionally racing other backends
+        solver_options = self.modeling_options["collection"]["solver_options"]
+        concurrent_solvers = [
+            name
+            for name in self.modeling_options["collection"].get(
+                "concurrent_solvers", []
+            )
+            if name != solver_name
+        ]
+        if concurrent_solvers:
+            S, G, self._race_executor = _own_race_solvers(
+                solver,
+                concurrent_solvers,
                 P,
                 A,
                 max_turbines_per_string,
                 ModelOptions(**model_options),
+                S_warm,
+                solver_options,
             )
+        else:
+            solver.solve(**solver_options)
+            S, G = solver.get_solution()
+        return S, G, S_presolve
 
-        # do the branch-and-bound MILP search
-        info = solver.solve(**self.modeling_options["collection"]["solver_options"])
-        S, G = solver.get_solution()
-        self.S_previous = S
-
-        # extract the outputs
-        terse_links = np.zeros((T,), dtype=np.int_)
-        length_cables = np.zeros((T,))
-        load_cables = np.zeros((T,))
-
-        d2roots = A.graph["d2roots"]
-        # convert the graph to array representing the tree (edges i->terse[i])
-        for u, v, edgeD in S.edges(data=True):
-            u, v = (u, v) if u < v else (v, u)
-            i, target = (u, v) if edgeD["reverse"] else (v, u)
-            terse_links[i] = target
-            load = edgeD["load"]
-            load_cables[i] = load
-            if u < 0:
-                # u is a substation
-                if v in G[u]:
-                    # feeder <u, v> has a straight route
-                    length_cables[i] = d2roots[v, u]
-                else:
-                    # feeder <u, v> is segmented (detoured route)
-                    v_neighbors = G[v]
-                    for cur_hop in v_neighbors:
-                        if cur_hop >= T and v_neighbors[cur_hop]["load"] == load:
-                            break
-                    length_cables[i] = v_neighbors[cur_hop]["length"]
-                    prev_hop = v
-                    while cur_hop >= T:
-                        s, t = G[cur_hop]
-                        cur_hop, prev_hop = (s if t == prev_hop else t), cur_hop
-                        length_cables[i] += G[cur_hop][prev_hop]["length"]
-            else:
-                # link (u, v) is not a feeder, so A has length data
-                length_cables[i] = A[u][v]["length"]
+    def _pack_outputs(
+        self,
+        S,
+        G,
+        G_csr,
+        terse_links,
+        length_cables,
+        load_cables,
+        outputs,
+        discrete_outputs,
+    ):
+        """Set the component outputs from a collection system solution."""
 
-        # pack and ship
         self.graph = G
+        self._G_csr = G_csr
+        indptr, indices, lengths, _ = G_csr
+        # edge endpoints (mapped to their vertex coordinates) for compute_partials,
+        # taking each undirected edge of the adjacency arrays once
+        rows = np.repeat(np.arange(indptr.size - 1), np.diff(indptr))
+        is_forward = rows < indices
+        R = G.graph["R"]
+        edges_uv = np.column_stack((rows[is_forward], indices[is_forward])) - R
+        fnT = G.graph.get("fnT")
+        self._edges_uv = fnT[edges_uv] if fnT is not None else edges_uv
+        # contiguous per-coordinate copies of the vertex positions for the gradient
+        VertexC = G.graph["VertexC"]
+        self._Vx = np.ascontiguousarray(VertexC[:, 0])
+        self._Vy = np.ascontiguousarray(VertexC[:, 1])
         discrete_outputs["graph"] = G  # TODO: remove for terse links, below!
         discrete_outputs["terse_links"] = terse_links
         discrete_outputs["length_cables"] = length_cables
         discrete_outputs["load_cables"] = load_cables
         discrete_outputs["max_load_cables"] = S.graph["max_load"]
-        # TODO: remove this assert after enough testing
-        assert (
-            abs(length_cables.sum() - G.size(weight="length")) < 1e-7
-        ), f"difference: {length_cables.sum() - G.size(weight='length')}"
-        outputs["total_length_cables"] = length_cables.sum()
+        total_length_cables = length_cables.sum()
+        # TODO: remove this check after enough testing
+        if __debug__:
+            difference = total_length_cables - 0.5 * lengths.sum()
+            assert abs(difference) < 1e-7, f"difference: {difference}"
+        outputs["total_length_cables"] = total_length_cables
 
     def compute_partials(self, inputs, J, discrete_inputs=None):
 
@@ -217,29 +837,20 @@ class OptiwindnetCollection(templates.CollectionTemplate):
         G = self.graph
         T = G.graph["T"]
         R = G.graph["R"]
-        VertexC = G.graph["VertexC"]
-        gradients = np.zeros_like(VertexC)
-
-        fnT = G.graph.get("fnT")
-        if fnT is not None:
-            _u, _v = fnT[np.array(G.edges)].T
-        else:
-            _u, _v = np.array(G.edges).T
-        vec = VertexC[_u] - VertexC[_v]
-        norm = np.hypot(*vec.T)
-        # suppress the contributions of zero-length edges
-        norm[np.isclose(norm, 0.0)] = 1.0
-        vec /= norm[:, None]
+        N = self._Vx.size
+        gradients_x = np.zeros((N,))
+        gradients_y = np.zeros((N,))
 
-        np.add.at(gradients, _u, vec)
-        np.subtract.at(gradients, _v, vec)
+        # substations have negative labels: wrap them to the end of the arrays
+        _u, _v = (self._edges_uv % N).T
+        _own_length_gradients(_u, _v, self._Vx, self._Vy, gradients_x, gradients_y)
 
         # wind turbines
-        J["total_length_cables", "x_turbines"] = gradients[:T, 0]
-        J["total_length_cables", "y_turbines"] = gradients[:T, 1]
+        J["total_length_cables", "x_turbines"] = gradients_x[:T]
+        J["total_length_cables", "y_turbines"] = gradients_y[:T]
 
         # substations
-        J["total_length_cables", "x_substations"] = gradients[-R:, 0]
-        J["total_length_cables", "y_substations"] = gradients[-R:, 1]
+        J["total_length_cables", "x_substations"] = gradients_x[-R:]
+        J["total_length_cables", "y_substations"] = gradients_y[-R:]
 
         return J
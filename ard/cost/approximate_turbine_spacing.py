@@ -1,3 +1,4 @@
+import numpy as np
 import openmdao.api as om
 
 
@@ -8,20 +9,22 @@ class SpacingApproximations(om.ExplicitComponent):
 
     Inputs
     ------
-    total_length_cables : float
-        Total length of cables in meters.
+    total_length_cables : np.ndarray
+        Total length of cables in meters, one entry per batch member.
 
     Outputs
     -------
-    primary_turbine_spacing_diameters : float
+    primary_turbine_spacing_diameters : np.ndarray
         Approximation of spacing between turbines in diameters for use in cost estimation using LandBOSSE.
-    secondary_spacing_diameters : float
+    secondary_spacing_diameters : np.ndarray
         Approximation of spacing between rows of turbines in diameters for use in cost estimation using LandBOSSE.
 
     Options
     -------
     modeling_options : dict
         Dictionary of modeling options including at least ["farm"]["N_turbines"] and ["turbine"]["geometry"]["diameter_rotor"]
+    n_batch : int
+        Number of cable lengths handled by each compute call (default 1).
     """
 
     def initialize(self):
@@ -29,61 +32,66 @@ class SpacingApproximations(om.ExplicitComponent):
         self.options.declare(
             "modeling_options", types=dict, desc="Ard modeling options"
         )
+        self.options.declare(
+            "n_batch", default=1, types=int, desc="number of cable lengths per call"
+        )
 
     def setup(self):
         """Set up the inputs and outputs."""
+
+        # the conversion from cable length to spacing is fixed by the options
+        N_turbines = self.options["modeling_options"]["layout"]["N_turbines"]
+        rotor_diameter_m = self.options["modeling_options"]["windIO_plant"][
+            "wind_farm"
+        ]["turbine"]["rotor_diameter"]
+        self._inv_denom = 1.0 / (rotor_diameter_m * N_turbines)
+
+        n_batch = self.options["n_batch"]
         self.add_input(
-            "total_length_cables", val=0.0, units="m", desc="Total cable length"
+            "total_length_cables",
+            val=np.zeros(n_batch),
+            units="m",
+            desc="Total cable length",
         )
         self.add_output(
             "primary_turbine_spacing_diameters",
-            val=0.0,
+            val=np.zeros(n_batch),
             units=None,
             desc="Turbine spacing",
         )
         self.add_output(
             "secondary_turbine_spacing_diameters",
-            val=0.0,
+            val=np.zeros(n_batch),
             units=None,
             desc="Row spacing",
         )
 
     def setup_partials(self):
         """Declare partial derivatives."""
-        N_turbines = self.options["modeling_options"]["layout"]["N_turbines"]
-        rotor_diameter_m = self.options["modeling_options"]["windIO_plant"][
-            "wind_farm"
-        ]["turbine"]["rotor_diameter"]
 
         # Partial derivative of primary_turbine_spacing_diameters w.r.t. total_length_cables are constant
-        const_partial = 1.0 / (rotor_diameter_m * N_turbines)
+        # and each batch member only depends on its own cable length; with no
+        # compute_partials override, OpenMDAO skips that call when linearizing
+        n_batch = self.options["n_batch"]
+        const_partial = np.full(n_batch, self._inv_denom)
         self.declare_partials(
             "primary_turbine_spacing_diameters",
             "total_length_cables",
+            rows=np.arange(n_batch),
+            cols=np.arange(n_batch),
             val=const_partial,
         )
         self.declare_partials(
             "secondary_turbine_spacing_diameters",
             "total_length_cables",
+            rows=np.arange(n_batch),
+            cols=np.arange(n_batch),
             val=const_partial,
         )
 
     def compute(self, inputs, outputs):
         """Compute the turbine spacing."""
-        total_length_cables = inputs["total_length_cables"]
-        N_turbines = self.options["modeling_options"]["layout"]["N_turbines"]
-        rotor_diameter_m = self.options["modeling_options"]["windIO_plant"][
-            "wind_farm"
-        ]["turbine"]["rotor_diameter"]
-
         # Calculate turbine and row spacing
-        outputs["primary_turbine_spacing_diameters"] = total_length_cables / (
-            rotor_diameter_m * N_turbines
-        )
-        outputs["secondary_turbine_spacing_diameters"] = total_length_cables / (
-            rotor_diameter_m * N_turbines
-        )
-
-    def compute_partials(self, inputs, partials):
-        "partials are constant, so no calculations needed here"
-        pass
+        spacing_diameters = inputs["total_length_cables"] * self._inv_denom
+        outputs["primary_turbine_spacing_diameters"] = spacing_diameters
+        outputs["secondary_turbine_spacing_diameters"] = spacing_diameters
@@ -1,3 +1,10 @@
+from collections import OrderedDict
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import csv
+import hashlib
+import json
 from pathlib import Path
 import shutil
 import warnings
@@ -13,6 +20,184 @@ from ORBIT.core.library import default_library
 from ORBIT.core.library import initialize_library
 
 from ard.cost.wisdem_wrap import ORBIT_setup_latents
+from ard.cost.wisdem_wrap import add_latent_ivc
+
+# ORBIT's default library, which is copied for each case
+_PATH_LIBRARY_DEFAULT = Path(default_library).absolute()
+
+# number of ORBIT runs remembered by each ORBITWisdemDetail instance
+_ORBIT_RESULT_CACHE_SIZE = 64
+
+# columns of the ORBIT custom array layout CSV
+_ORBIT_LOCATION_COLUMNS = (
+    "id",
+    "substation_id",
+    "name",
+    "longitude",
+    "latitude",
+    "string",
+    "order",
+    "cable_length",
+    "bury_speed",
+)
+
+
+# (name, value, units) of the ORBIT inputs defaulted by ORBITDetail
+_ORBIT_INPUT_DEFAULTS = (
+    ("wtiv", "example_wtiv", None),
+    ("feeder", "example_feeder", None),
+    # ("num_feeders", 1, None),
+    # ("num_towing", 1, None),
+    # ("num_station_keeping", 3, None),
+    # ("oss_install_vessel", "example_heavy_lift_vessel", None),
+    ("site_distance", 40.0, "km"),
+    ("site_distance_to_landfall", 40.0, "km"),
+    ("interconnection_distance", 40.0, "km"),
+    ("plant_turbine_spacing", 7, None),
+    ("plant_row_spacing", 7, None),
+    ("plant_substation_distance", 1, "km"),
+    # ("num_port_cranes", 1, None),
+    # ("num_assembly_lines", 1, None),
+    ("takt_time", 170.0, "h"),
+    ("port_cost_per_month", 2e6, "USD/mo"),
+    ("construction_insurance", 44.0, "USD/kW"),
+    ("construction_financing", 183.0, "USD/kW"),
+    ("contingency", 316.0, "USD/kW"),
+    ("commissioning_cost_kW", 44.0, "USD/kW"),
+    ("decommissioning_cost_kW", 58.0, "USD/kW"),
+    ("site_auction_price", 100e6, "USD"),
+    ("site_assessment_cost", 50e6, "USD"),
+    ("construction_plan_cost", 1e6, "USD"),
+    ("installation_plan_cost", 2.5e5, "USD"),
+    ("boem_review_cost", 0.0, "USD"),
+)
+
+
+def _iter_orbit_location_records(
+    edges_to_process,
+    edges_inclsub,
+    X_turbines,
+    Y_turbines,
+    X_substations,
+    Y_substations,
+):
+    """
+    yield the rows of an ORBIT custom array layout, in traversal order
+
+    Parameters
+    ----------
+    edges_to_process : list
+        all edges of the collection system graph, sorted by node
+    edges_inclsub : list
+        the sorted edges with a substation node, each of which starts a string
+    X_turbines : np.array
+        the cartesian X locations, in kilometers, of the turbines
+    Y_turbines : np.array
+        the cartesian Y locations, in kilometers, of the turbines
+    X_substations : np.array
+        the cartesian X locations, in kilometers, of the substations
+    Y_substations : np.array
+        the cartesian Y locations, in kilometers, of the substations
+
+    Yields
+    ------
+    tuple
+        one record per substation or turbine, ordered as `_ORBIT_LOCATION_COLUMNS`
+    """
+
+    # index the edges by node (keeping the sorted order) and track processed edges
+    edges_by_node = defaultdict(list)
+    for edge in edges_to_process:
+        edges_by_node[edge[0]].append(edge)
+        edges_by_node[edge[1]].append(edge)
+    edges_processed = set()
+    mark_processed = edges_processed.add
+
+    # one traversal stack for all the strings, with its methods bound locally
+    stack = []
+    push = stack.append
+    pop = stack.pop
+
+    # format the element names once, up front
+    turbine_ids = [f"t{i:03d}" for i in range(len(X_turbines))]
+    substation_ids = [f"oss{i:01d}" for i in range(len(X_substations))]
+
+    # gather the coordinates in bulk so the traversal indexes plain lists
+    # instead of boxing a numpy scalar per lookup
+    x_turbines = np.asarray(X_turbines, dtype=float).tolist()
+    y_turbines = np.asarray(Y_turbines, dtype=float).tolist()
+    x_substations = (np.asarray(X_substations, dtype=float) / 1.0e3).tolist()
+    y_substations = (np.asarray(Y_substations, dtype=float) / 1.0e3).tolist()
+
+    idx_string = 0
+    substations_added = set()
+
+    for edge in edges_inclsub:  # every edge w/ a substation starts a string
+
+        # get the substation id as a one-liner
+        substation_index = len(X_substations) + (edge[0] if edge[0] < 0 else edge[1])
+        # get the substation name
+        substation_name = substation_id = substation_ids[substation_index]
+
+        # add the substation to the dataset
+        if substation_id not in substations_added:
+            substations_added.add(substation_id)
+            yield (
+                substation_id,
+                substation_id,
+                substation_name,
+                x_substations[substation_index],
+                y_substations[substation_index],
+                None,
+                None,
+                None,
+                None,
+            )
+
+        # depth-first traversal of the edges downstream of the substation: the
+        # first edge out of a turbine continues its string, any other edge starts
+        # a new string (string index None) numbered when it is reached
+        push((edge, substation_index - len(X_substations), idx_string, 0))
+        while stack:
+            edge, turbine_origination, string, order = pop()
+            if string is None:
+                idx_string += 1
+                string = idx_string
+
+            # get the target turbine index
+            turbine_tgt_index = edge[0] if edge[0] != turbine_origination else edge[1]
+            # get the turbine name
+            turbine_name = turbine_id = turbine_ids[turbine_tgt_index]
+
+            # add the turbine to the dataset
+            yield (
+                turbine_id,
+                substation_id,
+                turbine_name,
+                x_turbines[turbine_tgt_index],
+                y_turbines[turbine_tgt_index],
+                string,
+                order,
+                0.0,  # cable length: ORBIT computes automatically
+                0.0,  # bury speed: ORBIT computes automatically
+            )
+
+            # mark this edge as processed
+            mark_processed(edge)
+
+            # get the set of remaining edges that include the terminal turbine
+            edges_turbine = [
+                e for e in edges_by_node[turbine_tgt_index] if e not in edges_processed
+            ]
+
+            # push in reverse so that the edges are handled in order
+            for new_string, edge_next in reversed(list(enumerate(edges_turbine))):
+                if new_string:
+                    push((edge_next, turbine_tgt_index, None, 0))
+                else:
+                    push((edge_next, turbine_tgt_index, string, order + 1))
+
+        idx_string += 1
 
 
 def generate_orbit_location_from_graph(
@@ -22,6 +207,7 @@ def generate_orbit_location_from_graph(
     X_substations,
     Y_substations,
     allow_branching_approximation=False,
+    out_path=None,
 ):
     """
     go from a optiwindnet graph to an ORBIT input CSV
@@ -45,24 +231,23 @@ def generate_orbit_location_from_graph(
         the cartesian X locations, in kilometers, of the substations
     Y_substations : np.array
         the cartesian Y locations, in kilometers, of the substations
+    allow_branching_approximation : bool, optional
+        if True, approximate a branched graph by a radial one instead of raising
+    out_path : str or pathlib.Path, optional
+        if given, the rows are streamed directly to a CSV file at this path and
+        no dataframe is built
 
     Returns
     -------
-    pandas.DataFrame
-        a dataframe formatted for ORBIT to specify a farm layout
-
-    Raises
-    ------
-    RecursionError
-        if the recursive setup seems to be stuck in a loop
+    pandas.DataFrame or None
+        a dataframe formatted for ORBIT to specify a farm layout, or None if the
+        layout was written to `out_path`
     """
 
     # get all edges, sorted by the first node then the second node
-    edges_to_process = [edge for edge in graph.edges]
-    edges_to_process.sort(key=lambda x: (x[0], x[1]))
-    # get the edges with a negative index node (a substation)
+    edges_to_process = sorted(graph.edges, key=lambda x: (x[0], x[1]))
+    # get the edges with a negative index node (a substation), already sorted
     edges_inclsub = [edge for edge in edges_to_process if edge[0] < 0 or edge[1] < 0]
-    edges_inclsub.sort(key=lambda x: (x[0], x[1]))
 
     # check to see if any nodes appear more than twice
     # (i.e. once destination and possibly one source)
@@ -96,100 +281,62 @@ def generate_orbit_location_from_graph(
                 "approximation."
             )
 
-    # data for ORBIT
-    data_orbit = {
-        "id": [],
-        "substation_id": [],
-        "name": [],
-        "longitude": [],
-        "latitude": [],
-        "string": [],
-        "order": [],
-        "cable_length": [],
-        "bury_speed": [],
-    }
-
-    idx_string = 0
-    order = 0
-
-    for edge in edges_inclsub:  # every edge w/ a substation starts a string
-
-        def handle_edge(
-            edge, turbine_origination, idx_string, order, recursion_level=0
-        ):
-            # recursively handle the edges
-
-            if recursion_level > 10:  # for safe recursion
-                raise RecursionError("Recursion limit reached")
-
-            # get the target turbine index
-            turbine_tgt_index = edge[0] if edge[0] != turbine_origination else edge[1]
-            # get the turbine name
-            turbine_name = turbine_id = f"t{turbine_tgt_index:03d}"
+    records_orbit = _iter_orbit_location_records(
+        edges_to_process,
+        edges_inclsub,
+        X_turbines,
+        Y_turbines,
+        X_substations,
+        Y_substations,
+    )
 
-            # add the turbine to the dataset
-            data_orbit["id"].append(turbine_id)
-            data_orbit["substation_id"].append(substation_id)
-            data_orbit["name"].append(turbine_name)
-            data_orbit["longitude"].append(X_turbines[turbine_tgt_index])
-            data_orbit["latitude"].append(Y_turbines[turbine_tgt_index])
-            data_orbit["string"].append(int(idx_string))
-            data_orbit["order"].append(int(order))
-            data_orbit["cable_length"].append(0)  # ORBIT computes automatically
-            data_orbit["bury_speed"].append(0)  # ORBIT computes automatically
-
-            # pop this edge out of the edges list
-            edges_to_process.remove(edge)
+    # write the rows straight to the CSV as they are produced
+    if out_path is not None:
+        with open(out_path, "w", newline="") as file_orbit:
+            writer = csv.writer(file_orbit, lineterminator="\n")
+            writer.writerow(_ORBIT_LOCATION_COLUMNS)
+            writer.writerows(records_orbit)
+        return None
 
-            # get the set of remaining edges that include the terminal turbine
-            edges_turbine = [e for e in edges_to_process if (turbine_tgt_index in e)]
+    # string and order are integers, left blank for the substations
+    df_orbit = pd.DataFrame.from_records(
+        list(records_orbit), columns=_ORBIT_LOCATION_COLUMNS
+    ).astype({"string": "Int64", "order": "Int64"})
 
-            order += 1
+    return df_orbit
 
-            for new_string, edge_next in enumerate(edges_turbine):
-                if new_string:
-                    idx_string += 1
-                    order = 0
-                idx_string, order = handle_edge(
-                    edge_next,
-                    turbine_tgt_index,
-                    idx_string,
-                    order,
-                    recursion_level=recursion_level + 1,
-                )
 
-            return idx_string, order
+def _run_orbit_project(config, path_library=None):
+    """
+    run one ORBIT project and gather its headline results
 
-        # get the substation id as a one-liner
-        substation_index = len(X_substations) + (edge[0] if edge[0] < 0 else edge[1])
-        # get the substation name
-        substation_name = substation_id = f"oss{substation_index:01d}"
+    Parameters
+    ----------
+    config : dict
+        a complete ORBIT configuration dictionary
+    path_library : pathlib.Path, optional
+        the ORBIT library to use, if one is not already initialized
 
-        # add the substation to the dataset
-        if not substation_id in data_orbit["id"]:
-            data_orbit["id"].append(substation_id)
-            data_orbit["substation_id"].append(substation_id)
-            data_orbit["name"].append(substation_name)
-            data_orbit["longitude"].append(X_substations[substation_index] / 1.0e3)
-            data_orbit["latitude"].append(Y_substations[substation_index] / 1.0e3)
-            data_orbit["string"].append(None)
-            data_orbit["order"].append(None)
-            data_orbit["cable_length"].append(None)
-            data_orbit["bury_speed"].append(None)
-
-        # handle the edge that we get
-        idx_string, order = handle_edge(
-            edge, substation_index - len(X_substations), idx_string, order
-        )
+    Returns
+    -------
+    dict
+        the capex, installation, and capacity results of the project
+    """
 
-        order = 0
-        idx_string += 1
+    if path_library is not None:
+        initialize_library(path_library)
 
-    df_orbit = pd.DataFrame(data_orbit).fillna("")
-    df_orbit.string = [int(v) if v != "" else "" for v in df_orbit.string]
-    df_orbit.order = [int(v) if v != "" else "" for v in df_orbit.order]
+    project = orbit_wisdem.ProjectManager(config)
+    project.run()
 
-    return df_orbit
+    return {
+        "bos_capex": project.bos_capex,
+        "soft_capex": project.soft_capex,
+        "project_capex": project.project_capex,
+        "installation_time": project.installation_time,
+        "installation_capex": project.installation_capex,
+        "capacity": project.capacity,
+    }
 
 
 class ORBITDetail(orbit_wisdem.Orbit):
@@ -220,34 +367,8 @@ class ORBITDetail(orbit_wisdem.Orbit):
         self.N_turbines = self.modeling_options["layout"]["N_turbines"]
         self.N_substations = self.modeling_options["layout"]["N_substations"]
 
-        self.set_input_defaults("wtiv", "example_wtiv")
-        self.set_input_defaults("feeder", "example_feeder")
-        # self.set_input_defaults("num_feeders", 1)
-        # self.set_input_defaults("num_towing", 1)
-        # self.set_input_defaults("num_station_keeping", 3)
-        # self.set_input_defaults(
-        #    "oss_install_vessel", "example_heavy_lift_vessel",
-        # )
-        self.set_input_defaults("site_distance", 40.0, units="km")
-        self.set_input_defaults("site_distance_to_landfall", 40.0, units="km")
-        self.set_input_defaults("interconnection_distance", 40.0, units="km")
-        self.set_input_defaults("plant_turbine_spacing", 7)
-        self.set_input_defaults("plant_row_spacing", 7)
-        self.set_input_defaults("plant_substation_distance", 1, units="km")
-        # self.set_input_defaults("num_port_cranes", 1)
-        # self.set_input_defaults("num_assembly_lines", 1)
-        self.set_input_defaults("takt_time", 170.0, units="h")
-        self.set_input_defaults("port_cost_per_month", 2e6, units="USD/mo")
-        self.set_input_defaults("construction_insurance", 44.0, units="USD/kW")
-        self.set_input_defaults("construction_financing", 183.0, units="USD/kW")
-        self.set_input_defaults("contingency", 316.0, units="USD/kW")
-        self.set_input_defaults("commissioning_cost_kW", 44.0, units="USD/kW")
-        self.set_input_defaults("decommissioning_cost_kW", 58.0, units="USD/kW")
-        self.set_input_defaults("site_auction_price", 100e6, units="USD")
-        self.set_input_defaults("site_assessment_cost", 50e6, units="USD")
-        self.set_input_defaults("construction_plan_cost", 1e6, units="USD")
-        self.set_input_defaults("installation_plan_cost", 2.5e5, units="USD")
-        self.set_input_defaults("boem_review_cost", 0.0, units="USD")
+        for name, val, units in _ORBIT_INPUT_DEFAULTS:
+            self.set_input_defaults(name, val, units=units)
 
         self.add_subsystem(
             "orbit",
@@ -267,6 +388,8 @@ class ORBITWisdemDetail(orbit_wisdem.OrbitWisdem):
     """ORBIT-WISDEM Fixed Substructure API, modified for detailed layouts"""
 
     _path_library = None
+    _libraries_copied = set()  # (default library, local copy) pairs already copied
+    _layout_signatures = {}  # layout CSV path -> signature of the inputs it holds
 
     def initialize(self):
         super().initialize()
@@ -275,6 +398,12 @@ class ORBITWisdemDetail(orbit_wisdem.OrbitWisdem):
         self.options.declare("modeling_options")
         self.options.declare("approximate_branches", default=False)
 
+        # results of previous ORBIT runs, keyed by a hash of their configuration
+        self._result_cache = OrderedDict()
+        self._layout_signature = None
+        self._config_compiled = None  # config handed from compute to the superclass
+        self._phase_idx = None  # position of ArraySystemDesign in the phases
+
     def setup(self):
         """Define all the inputs."""
 
@@ -296,18 +425,24 @@ class ORBITWisdemDetail(orbit_wisdem.OrbitWisdem):
         self.add_input("y_substations", np.zeros((self.N_substations,)), units="km")
 
         # copy the default ORBIT library to a local directory under case_files
-        path_library_default = Path(default_library).absolute()
+        path_library_default = _PATH_LIBRARY_DEFAULT
         self._path_library = (
             Path("case_files") / self.options["case_title"] / "ORBIT_library"
         ).absolute()
-        if path_library_default.exists():
-            shutil.copytree(
-                path_library_default, self._path_library, dirs_exist_ok=True
-            )
-        else:
+        if not path_library_default.exists():
             raise FileNotFoundError(
                 f"Can not find default ORBIT library at {path_library_default}."
             )
+        # only copy once per process, unless the copy has been removed since
+        key_library = (str(path_library_default), str(self._path_library))
+        if (
+            key_library not in ORBITWisdemDetail._libraries_copied
+            or not self._path_library.exists()
+        ):
+            shutil.copytree(
+                path_library_default, self._path_library, dirs_exist_ok=True
+            )
+            ORBITWisdemDetail._libraries_copied.add(key_library)
 
     def compile_orbit_config_file(
         self,
@@ -317,6 +452,11 @@ class ORBITWisdemDetail(orbit_wisdem.OrbitWisdem):
         discrete_outputs,
     ):
 
+        # the superclass compute asks for the config that compute just built
+        if self._config_compiled is not None:
+            config, self._config_compiled = self._config_compiled, None
+            return config
+
         config = super().compile_orbit_config_file(
             inputs,
             outputs,
@@ -332,14 +472,20 @@ class ORBITWisdemDetail(orbit_wisdem.OrbitWisdem):
             "row_spacing": inputs["plant_row_spacing"],
         }
 
-        # switch to the custom array system design
-        if not ("ArraySystemDesign" in config["design_phases"]):
-            raise KeyError(
-                "I assumed that 'ArraySystemDesign' would be in the config. Something changed."
-            )
-        config["design_phases"][
-            config["design_phases"].index("ArraySystemDesign")
-        ] = "CustomArraySystemDesign"
+        # switch to the custom array system design, only searching for the
+        # phase when it is not where it was on the previous call
+        design_phases = config["design_phases"]
+        if (
+            self._phase_idx is None
+            or self._phase_idx >= len(design_phases)
+            or design_phases[self._phase_idx] != "ArraySystemDesign"
+        ):
+            if not ("ArraySystemDesign" in design_phases):
+                raise KeyError(
+                    "I assumed that 'ArraySystemDesign' would be in the config. Something changed."
+                )
+            self._phase_idx = design_phases.index("ArraySystemDesign")
+        design_phases[self._phase_idx] = "CustomArraySystemDesign"
 
         # add a turbine location csv on the config
         basename_farm_location = "wisdem_detailed_array"
@@ -357,15 +503,34 @@ class ORBITWisdemDetail(orbit_wisdem.OrbitWisdem):
             self._path_library / "cables" / (basename_farm_location + ".csv")
         )
 
-        # generate the csv data needed to locate the farm elements
-        generate_orbit_location_from_graph(
-            discrete_inputs["graph"],
-            inputs["x_turbines"],
-            inputs["y_turbines"],
-            inputs["x_substations"],
-            inputs["y_substations"],
-            allow_branching_approximation=self.options["approximate_branches"],
-        ).to_csv(path_farm_location, index=False)
+        # only regenerate the csv when the graph or the locations have changed
+        layout_signature = (
+            tuple(discrete_inputs["graph"].edges),
+            np.asarray(inputs["x_turbines"]).tobytes(),
+            np.asarray(inputs["y_turbines"]).tobytes(),
+            np.asarray(inputs["x_substations"]).tobytes(),
+            np.asarray(inputs["y_substations"]).tobytes(),
+            self.options["approximate_branches"],
+        )
+        key_layout = str(path_farm_location)
+        if (
+            ORBITWisdemDetail._layout_signatures.get(key_layout) != layout_signature
+            or not path_farm_location.exists()
+        ):
+            # forget the old signature in case the write fails part way
+            ORBITWisdemDetail._layout_signatures.pop(key_layout, None)
+            # generate the csv data needed to locate the farm elements
+            generate_orbit_location_from_graph(
+                discrete_inputs["graph"],
+                inputs["x_turbines"],
+                inputs["y_turbines"],
+                inputs["x_substations"],
+                inputs["y_substations"],
+                allow_branching_approximation=self.options["approximate_branches"],
+                out_path=path_farm_location,
+            )
+            ORBITWisdemDetail._layout_signatures[key_layout] = layout_signature
+        self._layout_signature = layout_signature
 
         self._orbit_config = config  # reinstall- probably not needed due to reference
         return config  # and return
@@ -377,13 +542,109 @@ class ORBITWisdemDetail(orbit_wisdem.OrbitWisdem):
         if self._path_library:
             initialize_library(self._path_library)
 
-        # send it back to the superclass compute
-        super().compute(
+        # reuse the results of a previous run with an identical configuration
+        config = self.compile_orbit_config_file(
             inputs,
             outputs,
             discrete_inputs,
             discrete_outputs,
         )
+        key_result = self._orbit_result_key(config)
+        if key_result in self._result_cache:
+            self._result_cache.move_to_end(key_result)
+            values_cached, discrete_values_cached = self._result_cache[key_result]
+            for name, value in values_cached.items():
+                outputs[name] = value
+            for name, value in discrete_values_cached.items():
+                discrete_outputs[name] = copy.deepcopy(value)
+            return
+
+        # send it back to the superclass compute, which runs on the config above
+        self._config_compiled = config
+        try:
+            super().compute(
+                inputs,
+                outputs,
+                discrete_inputs,
+                discrete_outputs,
+            )
+        finally:
+            self._config_compiled = None
+
+        # remember the results, evicting the least recently used
+        self._result_cache[key_result] = (
+            {name: np.copy(outputs[name]) for name in outputs.keys()},
+            {name: copy.deepcopy(value) for name, value in discrete_outputs.items()},
+        )
+        if len(self._result_cache) > _ORBIT_RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    @classmethod
+    def run_batch(cls, configs, path_library=None, max_workers=None):
+        """
+        run independent ORBIT projects in parallel worker processes
+
+        ORBIT is pure python and holds the GIL, so the projects are spread
+        over processes. Each config must be self-contained: a custom array
+        layout should be given as a `location_data` dataframe (e.g. from
+        `generate_orbit_location_from_graph`), since the layout CSV written by
+        `compile_orbit_config_file` is shared and only holds the latest layout.
+
+        Parameters
+        ----------
+        configs : list of dict
+            the ORBIT configuration dictionaries to run
+        path_library : pathlib.Path, optional
+            the ORBIT library for the workers, if not already initialized
+        max_workers : int, optional
+            the number of worker processes, by default one per CPU
+
+        Returns
+        -------
+        list of dict
+            the headline results of each project, in the order of `configs`
+        """
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    _run_orbit_project,
+                    configs,
+                    [path_library] * len(configs),
+                )
+            )
+
+    def _orbit_result_key(self, config):
+        """
+        hash an ORBIT configuration and the layout it points to
+
+        Parameters
+        ----------
+        config : dict
+            the ORBIT configuration dictionary to be run
+
+        Returns
+        -------
+        bytes
+            a digest that is identical for identical ORBIT runs
+        """
+
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(
+            json.dumps(
+                config,
+                sort_keys=True,
+                default=lambda value: (
+                    value.tolist() if hasattr(value, "tolist") else str(value)
+                ),
+            ).encode()
+        )
+        # the config only names the layout csv, so hash what the csv was built from
+        edges, *coordinates, approximate_branches = self._layout_signature
+        hasher.update(repr((edges, approximate_branches)).encode())
+        for coordinate_bytes in coordinates:
+            hasher.update(coordinate_bytes)
+        return hasher.digest()
 
 
 class ORBITDetailedGroup(om.Group):
@@ -404,18 +665,17 @@ class ORBITDetailedGroup(om.Group):
             modeling_options=self.options["modeling_options"]
         )
 
-        # create source independent variable components for LandBOSSE inputs
-        for key, meta in variable_mapping.items():
-            if key in ["number_of_turbines", "number_of_blades", "num_mooring_lines"]:
-                comp = om.IndepVarComp()
-                comp.add_discrete_output(name=key, val=meta["val"])
-                self.add_subsystem(f"IVC_orbit_{key}", comp, promotes=["*"])
-            else:
-                self.add_subsystem(
-                    f"IVC_orbit_{key}",
-                    om.IndepVarComp(key, val=meta["val"], units=meta["units"]),
-                    promotes=["*"],
-                )
+        # create one source independent variable component for ORBIT inputs
+        add_latent_ivc(
+            self,
+            "IVC_orbit",
+            variable_mapping,
+            discrete_keys=[
+                "number_of_turbines",
+                "number_of_blades",
+                "num_mooring_lines",
+            ],
+        )
 
         # add orbit
         self.add_subsystem(
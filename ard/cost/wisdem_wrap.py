@@ -1,13 +1,160 @@
-import warnings
+from collections import OrderedDict
+import copy
+import hashlib
+import pickle
 import numpy as np
 
 import openmdao.api as om
 from wisdem.plant_financese.plant_finance import PlantFinance as PlantFinance_orig
 from wisdem.landbosse.landbosse_omdao.landbosse import LandBOSSE as LandBOSSE_orig
+from wisdem.landbosse.landbosse_omdao.landbosse import LandBOSSE_API
 from wisdem.orbit.orbit_api import Orbit as Orbit_orig
+from wisdem.orbit.orbit_api import OrbitWisdem
 
 from ard.cost.approximate_turbine_spacing import SpacingApproximations
 
+# cost keys that mark an offshore fixed-bottom or floating LandBOSSE setup
+_OFFSHORE_FIXED_KEYS = frozenset(
+    (
+        "monopile_mass",
+        "monopile_cost",
+    )
+)
+_OFFSHORE_FLOATING_KEYS = frozenset(
+    (
+        "num_mooring_lines",
+        "mooring_line_mass",
+        "mooring_line_diameter",
+        "mooring_line_length",
+        "anchor_mass",
+        "floating_substructure_cost",
+    )
+)
+
+# number of input/output sets remembered by each memoized WISDEM component
+_COMPUTE_CACHE_SIZE = 8
+
+
+class _HashMemoizedCompute:
+    """
+    Mixin that skips `compute` when the inputs repeat a recent call.
+
+    The continuous inputs are hashed by their bytes and the discrete inputs by
+    their pickle, and the outputs of the last `_COMPUTE_CACHE_SIZE` distinct
+    input sets are kept. Discrete inputs that cannot be pickled disable the
+    cache for that call rather than risk a false hit. Some WISDEM components
+    (e.g. LandBOSSE with its project data tables) modify discrete inputs in
+    place, so the wrapped `compute` is given copies of the inputs named in
+    `_mutated_discrete_inputs`.
+    """
+
+    _mutated_discrete_inputs = ()  # discrete inputs the compute edits in place
+
+    def setup(self):
+        """Reset the cache, then set up the wrapped component."""
+        self._compute_cache = OrderedDict()
+        super().setup()
+
+    def _compute_key(self, inputs, discrete_inputs):
+        hasher = hashlib.blake2b(digest_size=16)
+        for name in inputs.keys():
+            hasher.update(np.ascontiguousarray(inputs[name]).tobytes())
+        if discrete_inputs:
+            try:
+                hasher.update(
+                    pickle.dumps(
+                        sorted(discrete_inputs.items()),
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                )
+            except Exception:
+                return None
+        return hasher.digest()
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        """Reuse the outputs of a recent identical call, or compute them."""
+
+        key = self._compute_key(inputs, discrete_inputs)
+        if key is not None and key in self._compute_cache:
+            self._compute_cache.move_to_end(key)
+            values_cached, discrete_values_cached = self._compute_cache[key]
+            for name, value in values_cached.items():
+                outputs[name][...] = value
+            for name, value in discrete_values_cached.items():
+                discrete_outputs[name] = copy.deepcopy(value)
+            return
+
+        if discrete_inputs is None and discrete_outputs is None:
+            super().compute(inputs, outputs)
+        else:
+            discrete_inputs = dict(discrete_inputs.items())
+            for name in self._mutated_discrete_inputs:
+                if name in discrete_inputs:
+                    discrete_inputs[name] = copy.deepcopy(discrete_inputs[name])
+            super().compute(inputs, outputs, discrete_inputs, discrete_outputs)
+
+        if key is not None:
+            self._compute_cache[key] = (
+                {name: np.copy(outputs[name]) for name in outputs.keys()},
+                {
+                    name: copy.deepcopy(value)
+                    for name, value in (
+                        discrete_outputs.items() if discrete_outputs is not None else ()
+                    )
+                },
+            )
+            if len(self._compute_cache) > _COMPUTE_CACHE_SIZE:
+                self._compute_cache.popitem(last=False)
+
+
+class LandBOSSEArdComp(_HashMemoizedCompute, LandBOSSE_API):
+    """WISDEM's LandBOSSE API component, skipping repeated computations."""
+
+    # the project data tables, which LandBOSSE passes to its modules by reference
+    _mutated_discrete_inputs = (
+        "site_facility_building_area_df",
+        "components",
+        "crane_specs",
+        "cable_specs",
+        "equip_price",
+        "crew_price",
+        "material_price",
+        "rsmeans",
+        "equip",
+        "crew",
+        "weather_window",
+    )
+
+
+class OrbitArdComp(_HashMemoizedCompute, OrbitWisdem):
+    """WISDEM's ORBIT API component, skipping repeated computations."""
+
+
+class PlantFinance(_HashMemoizedCompute, PlantFinance_orig):
+    """WISDEM's PlantFinance component, skipping repeated computations."""
+
+
+class LandBOSSE(LandBOSSE_orig):
+    """WISDEM's LandBOSSE group, running the memoized LandBOSSE component."""
+
+    def add_subsystem(self, name, subsys, *args, **kwargs):
+        # WISDEM's setup adds the component: make it the memoized one in place,
+        # which keeps its options and any other state
+        if type(subsys) is LandBOSSE_API:
+            subsys.__class__ = LandBOSSEArdComp
+        return super().add_subsystem(name, subsys, *args, **kwargs)
+
+
+class ORBIT(Orbit_orig):
+    """WISDEM's ORBIT group, running the memoized ORBIT component."""
+
+    def add_subsystem(self, name, subsys, *args, **kwargs):
+        # WISDEM's setup adds the component: make it the memoized one in place,
+        # which keeps its options and any other state
+        if type(subsys) is OrbitWisdem:
+            subsys.__class__ = OrbitArdComp
+        return super().add_subsystem(name, subsys, *args, **kwargs)
+
 
 class LandBOSSEWithSpacingApproximations(om.Group):
     """
@@ -77,23 +224,18 @@ class LandBOSSEGroup(om.Group):
             modeling_options=self.options["modeling_options"]
         )
 
-        # create source independent variable components for LandBOSSE inputs
-        for key, meta in variable_mapping.items():
-            if key in ["num_turbines", "number_of_blades"]:
-                comp = om.IndepVarComp()
-                comp.add_discrete_output(name=key, val=meta["val"])
-                self.add_subsystem(f"IVC_landbosse_{key}", comp, promotes=["*"])
-            else:
-                self.add_subsystem(
-                    f"IVC_landbosse_{key}",
-                    om.IndepVarComp(key, val=meta["val"], units=meta["units"]),
-                    promotes=["*"],
-                )
+        # create one source independent variable component for LandBOSSE inputs
+        add_latent_ivc(
+            self,
+            "IVC_landbosse",
+            variable_mapping,
+            discrete_keys=["num_turbines", "number_of_blades"],
+        )
 
         # add landbosse
         self.add_subsystem(
             "landbosse",
-            LandBOSSE_orig(),
+            LandBOSSE(),
             promotes=[
                 "total_capex",
                 "total_capex_kW",
@@ -123,23 +265,22 @@ class ORBITGroup(om.Group):
             modeling_options=self.options["modeling_options"]
         )
 
-        # create source independent variable components for LandBOSSE inputs
-        for key, meta in variable_mapping.items():
-            if key in ["number_of_turbines", "number_of_blades", "num_mooring_lines"]:
-                comp = om.IndepVarComp()
-                comp.add_discrete_output(name=key, val=meta["val"])
-                self.add_subsystem(f"IVC_orbit_{key}", comp, promotes=["*"])
-            else:
-                self.add_subsystem(
-                    f"IVC_orbit_{key}",
-                    om.IndepVarComp(key, val=meta["val"], units=meta["units"]),
-                    promotes=["*"],
-                )
+        # create one source independent variable component for ORBIT inputs
+        add_latent_ivc(
+            self,
+            "IVC_orbit",
+            variable_mapping,
+            discrete_keys=[
+                "number_of_turbines",
+                "number_of_blades",
+                "num_mooring_lines",
+            ],
+        )
 
         # add orbit
         self.add_subsystem(
             "orbit",
-            Orbit_orig(
+            ORBIT(
                 floating=self.options["modeling_options"]["floating"],
                 jacket=self.options["modeling_options"].get("jacket"),
                 jacket_legs=self.options["modeling_options"].get("jacket_legs"),
@@ -174,25 +315,18 @@ class FinanceSEGroup(om.Group):
             modeling_options=self.options["modeling_options"]
         )
 
-        # create source independent variable components for LandBOSSE inputs
-        for key, meta in variable_mapping.items():
-            if key in [
-                "turbine_number",
-            ]:
-                comp = om.IndepVarComp()
-                comp.add_discrete_output(name=key, val=meta["val"])
-                self.add_subsystem(f"IVC_financese_{key}", comp, promotes=["*"])
-            else:
-                self.add_subsystem(
-                    f"IVC_financese_{key}",
-                    om.IndepVarComp(key, val=meta["val"], units=meta["units"]),
-                    promotes=["*"],
-                )
+        # create one source independent variable component for FinanceSE inputs
+        add_latent_ivc(
+            self,
+            "IVC_financese",
+            variable_mapping,
+            discrete_keys=["turbine_number"],
+        )
 
         # add financese #TODO check promotes
         self.add_subsystem(
             "financese",
-            PlantFinance_orig(),
+            PlantFinance(),
             promotes=[
                 "offset_tcc_per_kW",
                 "plant_aep_in",
@@ -241,16 +375,29 @@ class TurbineCapitalCosts(om.ExplicitComponent):
 
     def setup_partials(self):
         """Derivative setup for OM component."""
-        # complex step for simple gradients
-        self.declare_partials("*", "*", method="cs")
+        # analytic gradients of the product
+        self.declare_partials(
+            "tcc", ["machine_rating", "tcc_per_kW", "offset_tcc_per_kW"]
+        )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         """Computation for the OM compoent."""
+        # Unpack parameters as scalars (complex-step safe), so no temporary
+        # arrays are made
+        t_rating = inputs["machine_rating"][0]
+        n_turbine = int(discrete_inputs["turbine_number"])
+        tcc_per_kW = inputs["tcc_per_kW"][0] + inputs["offset_tcc_per_kW"][0]
+        outputs["tcc"][0] = n_turbine * tcc_per_kW * t_rating
+
+    def compute_partials(self, inputs, J, discrete_inputs=None):
+        """Derivatives for the OM component."""
         # Unpack parameters
         t_rating = inputs["machine_rating"]
         n_turbine = discrete_inputs["turbine_number"]
         tcc_per_kW = inputs["tcc_per_kW"] + inputs["offset_tcc_per_kW"]
-        outputs["tcc"] = n_turbine * tcc_per_kW * t_rating
+        J["tcc", "machine_rating"] = n_turbine * tcc_per_kW
+        J["tcc", "tcc_per_kW"] = n_turbine * t_rating
+        J["tcc", "offset_tcc_per_kW"] = n_turbine * t_rating
 
 
 class OperatingExpenses(om.ExplicitComponent):
@@ -285,16 +432,120 @@ class OperatingExpenses(om.ExplicitComponent):
 
     def setup_partials(self):
         """Derivative setup for OM component."""
-        # complex step for simple gradients
-        self.declare_partials("*", "*", method="cs")
+        # analytic gradients of the product
+        self.declare_partials("opex", ["machine_rating", "opex_per_kW"])
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         """Computation for the OM compoent."""
+        # Unpack parameters as scalars (complex-step safe), so no temporary
+        # arrays are made
+        t_rating = inputs["machine_rating"][0]
+        n_turbine = int(discrete_inputs["turbine_number"])
+        opex_per_kW = inputs["opex_per_kW"][0]
+        outputs["opex"][0] = n_turbine * opex_per_kW * t_rating
+
+    def compute_partials(self, inputs, J, discrete_inputs=None):
+        """Derivatives for the OM component."""
         # Unpack parameters
         t_rating = inputs["machine_rating"]
         n_turbine = discrete_inputs["turbine_number"]
         opex_per_kW = inputs["opex_per_kW"]
-        outputs["opex"] = n_turbine * opex_per_kW * t_rating
+        J["opex", "machine_rating"] = n_turbine * opex_per_kW
+        J["opex", "opex_per_kW"] = n_turbine * t_rating
+
+
+def add_latent_ivc(group, name, variable_mapping, discrete_keys=()):
+    """
+    Add a single independent variable component for a set of latent variables.
+
+    Parameters
+    ----------
+    group : openmdao.api.Group
+        the group to add the independent variable component to
+    name : str
+        the name of the independent variable component subsystem
+    variable_mapping : dict
+        a mapping from variable names to dicts with "val" and "units" entries,
+        as returned by the *_setup_latents functions
+    discrete_keys : iterable of str, optional
+        the variable names that should be discrete outputs
+
+    Returns
+    -------
+    openmdao.api.IndepVarComp
+        the independent variable component, promoted into the group
+    """
+
+    comp = om.IndepVarComp()
+    for key, meta in variable_mapping.items():
+        if key in discrete_keys:
+            comp.add_discrete_output(name=key, val=meta["val"])
+        else:
+            comp.add_output(key, val=meta["val"], units=meta["units"])
+
+    return group.add_subsystem(name, comp, promotes=["*"])
+
+
+def _LandBOSSE_base_latents(modeling_options: dict) -> dict:
+    """
+    Build the LandBOSSE latent variables shared by every kind of plant.
+
+    Parameters
+    ----------
+    modeling_options : dict
+        a modeling options dictionary
+
+    Returns
+    -------
+    dict
+        a mapping from variable names to dicts with "val" and "units" entries
+    """
+
+    costs = modeling_options["costs"]
+    turbine = modeling_options["windIO_plant"]["wind_farm"]["turbine"]
+
+    return {
+        "num_turbines": {
+            "val": modeling_options["layout"]["N_turbines"],
+            "units": None,
+        },
+        "turbine_rating_MW": {
+            "val": turbine["performance"]["rated_power"] / 1.0e6,
+            "units": "MW",
+        },
+        "hub_height_meters": {
+            "val": turbine["hub_height"],
+            "units": "m",
+        },
+        "rotor_diameter_m": {
+            "val": turbine["rotor_diameter"],
+            "units": "m",
+        },
+        "number_of_blades": {
+            "val": costs["num_blades"],
+            "units": None,
+        },
+        "tower_mass": {
+            "val": costs["tower_mass"],
+            "units": "t",
+        },
+        "nacelle_mass": {
+            "val": costs["nacelle_mass"],
+            "units": "t",
+        },
+        "blade_mass": {
+            "val": costs["blade_mass"],
+            "units": "t",
+        },
+        "commissioning_cost_kW": {
+            "val": costs["commissioning_cost_kW"],
+            "units": "USD/kW",
+        },
+        "decommissioning_cost_kW": {
+            "val": costs["decommissioning_cost_kW"],
+            "units": "USD/kW",
+        },
+    }
 
 
 def LandBOSSE_setup_latents(modeling_options: dict) -> None:
@@ -310,150 +561,88 @@ def LandBOSSE_setup_latents(modeling_options: dict) -> None:
         a modeling options dictionary
     """
 
-    # Define the mapping between OpenMDAO variable names and modeling_options keys
-    offshore_fixed_keys = [
-        "monopile_mass",
-        "monopile_cost",
-    ]
+    # bind the option subtree that the plant-specific entries draw from
+    costs = modeling_options["costs"]
 
-    offshore_floating_keys = [
-        "num_mooring_lines",
-        "mooring_line_mass",
-        "mooring_line_diameter",
-        "mooring_line_length",
-        "anchor_mass",
-        "floating_substructure_cost",
-    ]
-
-    def _base_common():
-        return {
-            "num_turbines": {
-                "val": modeling_options["layout"]["N_turbines"],
-                "units": None,
-            },
-            "turbine_rating_MW": {
-                "val": modeling_options["windIO_plant"]["wind_farm"]["turbine"][
-                    "performance"
-                ]["rated_power"]
-                / 1.0e6,
-                "units": "MW",
-            },
-            "hub_height_meters": {
-                "val": modeling_options["windIO_plant"]["wind_farm"]["turbine"][
-                    "hub_height"
-                ],
-                "units": "m",
-            },
-            "rotor_diameter_m": {
-                "val": modeling_options["windIO_plant"]["wind_farm"]["turbine"][
-                    "rotor_diameter"
-                ],
-                "units": "m",
-            },
-            "number_of_blades": {
-                "val": modeling_options["costs"]["num_blades"],
-                "units": None,
-            },
-            "tower_mass": {
-                "val": modeling_options["costs"]["tower_mass"],
-                "units": "t",
-            },
-            "nacelle_mass": {
-                "val": modeling_options["costs"]["nacelle_mass"],
-                "units": "t",
-            },
-            "blade_mass": {
-                "val": modeling_options["costs"]["blade_mass"],
-                "units": "t",
-            },
-            "commissioning_cost_kW": {
-                "val": modeling_options["costs"]["commissioning_cost_kW"],
-                "units": "USD/kW",
-            },
-            "decommissioning_cost_kW": {
-                "val": modeling_options["costs"]["decommissioning_cost_kW"],
-                "units": "USD/kW",
-            },
-        }
-
-    if any(key in modeling_options["costs"] for key in offshore_fixed_keys):
-        variable_mapping = _base_common()
+    # Define the mapping between OpenMDAO variable names and modeling_options
+    # keys: the shared base, plus the entries for the kind of plant
+    variable_mapping = _LandBOSSE_base_latents(modeling_options)
+
+    if not costs.keys().isdisjoint(_OFFSHORE_FIXED_KEYS):
         variable_mapping.update(
             {
                 "monopile_mass": {
-                    "val": modeling_options["costs"]["monopile_mass"],
+                    "val": costs["monopile_mass"],
                     "units": "kg",
                 },
                 "monopile_cost": {
-                    "val": modeling_options["costs"]["monopile_cost"],
+                    "val": costs["monopile_cost"],
                     "units": "USD",
                 },
             }
         )
-    elif any(key in modeling_options["costs"] for key in offshore_floating_keys):
-        variable_mapping = _base_common()
+    elif not costs.keys().isdisjoint(_OFFSHORE_FLOATING_KEYS):
         variable_mapping.update(
             {
                 "num_mooring_lines": {
-                    "val": modeling_options["costs"]["num_mooring_lines"],
+                    "val": costs["num_mooring_lines"],
                     "units": None,
                 },
                 "mooring_line_mass": {
-                    "val": modeling_options["costs"]["mooring_line_mass"],
+                    "val": costs["mooring_line_mass"],
                     "units": "kg",
                 },
                 "mooring_line_diameter": {
-                    "val": modeling_options["costs"]["mooring_line_diameter"],
+                    "val": costs["mooring_line_diameter"],
                     "units": "m",
                 },
                 "mooring_line_length": {
-                    "val": modeling_options["costs"]["mooring_line_length"],
+                    "val": costs["mooring_line_length"],
                     "units": "m",
                 },
                 "anchor_mass": {
-                    "val": modeling_options["costs"]["anchor_mass"],
+                    "val": costs["anchor_mass"],
                     "units": "kg",
                 },
                 "floating_substructure_cost": {
-                    "val": modeling_options["costs"]["floating_substructure_cost"],
+                    "val": costs["floating_substructure_cost"],
                     "units": "USD",
                 },
             }
         )
     else:
-        variable_mapping = _base_common()
         variable_mapping.update(
             {
                 "rated_thrust_N": {
-                    "val": modeling_options["costs"]["rated_thrust_N"],
+                    "val": costs["rated_thrust_N"],
                     "units": "N",
                 },
                 "gust_velocity_m_per_s": {
-                    "val": modeling_options["costs"]["gust_velocity_m_per_s"],
+                    "val": costs["gust_velocity_m_per_s"],
                     "units": "m/s",
                 },
                 "blade_surface_area": {
-                    "val": modeling_options["costs"]["blade_surface_area"],
+                    "val": costs["blade_surface_area"],
                     "units": "m**2",
                 },
                 "hub_mass": {
-                    "val": modeling_options["costs"]["hub_mass"],
+                    "val": costs["hub_mass"],
                     "units": "kg",
                 },
                 "foundation_height": {
-                    "val": modeling_options["costs"]["foundation_height"],
+                    "val": costs["foundation_height"],
                     "units": "m",
                 },
                 "trench_len_to_substation_km": {
-                    "val": modeling_options["costs"]["trench_len_to_substation_km"],
+                    "val": costs["trench_len_to_substation_km"],
                     "units": "km",
                 },
                 "distance_to_interconnect_mi": {
-                    "val": modeling_options["costs"]["distance_to_interconnect_mi"],
+                    "val": costs["distance_to_interconnect_mi"],
                     "units": "mi",
                 },
                 "interconnect_voltage_kV": {
-                    "val": modeling_options["costs"]["interconnect_voltage_kV"],
+                    "val": costs["interconnect_voltage_kV"],
                     "units": "kV",
                 },
             }
@@ -475,11 +664,13 @@ def ORBIT_setup_latents(modeling_options: dict) -> None:
         a modeling options dictionary
     """
 
+    # bind the option subtrees that the mapping draws from
+    costs = modeling_options["costs"]
+    turbine = modeling_options["windIO_plant"]["wind_farm"]["turbine"]
+
     variable_mapping = {
         "turbine_rating": {
-            "val": modeling_options["windIO_plant"]["wind_farm"]["turbine"][
-                "performance"
-            ]["rated_power"],
+            "val": turbine["performance"]["rated_power"],
             "units": "W",
         },
         "site_depth": {"val": modeling_options["site_depth"], "units": "m"},
@@ -488,101 +679,97 @@ def ORBIT_setup_latents(modeling_options: dict) -> None:
             "units": None,
         },
         "number_of_blades": {
-            "val": modeling_options["costs"]["num_blades"],
+            "val": costs["num_blades"],
             "units": None,
         },
         "hub_height": {
-            "val": modeling_options["windIO_plant"]["wind_farm"]["turbine"][
-                "hub_height"
-            ],
+            "val": turbine["hub_height"],
             "units": "m",
         },
         "turbine_rotor_diameter": {
-            "val": modeling_options["windIO_plant"]["wind_farm"]["turbine"][
-                "rotor_diameter"
-            ],
+            "val": turbine["rotor_diameter"],
             "units": "m",
         },
         "tower_length": {
-            "val": modeling_options["costs"]["tower_length"],
+            "val": costs["tower_length"],
             "units": "m",
         },
-        "tower_mass": {"val": modeling_options["costs"]["tower_mass"], "units": "t"},
+        "tower_mass": {"val": costs["tower_mass"], "units": "t"},
         "nacelle_mass": {
-            "val": modeling_options["costs"]["nacelle_mass"],
+            "val": costs["nacelle_mass"],
             "units": "t",
         },
-        "blade_mass": {"val": modeling_options["costs"]["blade_mass"], "units": "t"},
+        "blade_mass": {"val": costs["blade_mass"], "units": "t"},
         "turbine_capex": {
-            "val": modeling_options["costs"]["turbine_capex"],
+            "val": costs["turbine_capex"],
             "units": "USD/kW",
         },
         "site_mean_windspeed": {
-            "val": modeling_options["costs"]["site_mean_windspeed"],
+            "val": costs["site_mean_windspeed"],
             "units": "m/s",
         },
         "turbine_rated_windspeed": {
-            "val": modeling_options["costs"]["turbine_rated_windspeed"],
+            "val": costs["turbine_rated_windspeed"],
             "units": "m/s",
         },
         "commissioning_cost_kW": {
-            "val": modeling_options["costs"]["commissioning_cost_kW"],
+            "val": costs["commissioning_cost_kW"],
             "units": "USD/kW",
         },
         "decommissioning_cost_kW": {
-            "val": modeling_options["costs"]["decommissioning_cost_kW"],
+            "val": costs["decommissioning_cost_kW"],
             "units": "USD/kW",
         },
         "plant_substation_distance": {
-            "val": modeling_options["costs"]["plant_substation_distance"],
+            "val": costs["plant_substation_distance"],
             "units": "km",
         },
         "interconnection_distance": {
-            "val": modeling_options["costs"]["interconnection_distance"],
+            "val": costs["interconnection_distance"],
             "units": "km",
         },
         "site_distance": {
-            "val": modeling_options["costs"]["site_distance"],
+            "val": costs["site_distance"],
             "units": "km",
         },
         "site_distance_to_landfall": {
-            "val": modeling_options["costs"]["site_distance_to_landfall"],
+            "val": costs["site_distance_to_landfall"],
             "units": "km",
         },
         "port_cost_per_month": {
-            "val": modeling_options["costs"]["port_cost_per_month"],
+            "val": costs["port_cost_per_month"],
             "units": "USD/month",
         },
         "construction_insurance": {
-            "val": modeling_options["costs"]["construction_insurance"],
+            "val": costs["construction_insurance"],
             "units": "USD/kW",
         },
         "construction_financing": {
-            "val": modeling_options["costs"]["construction_financing"],
+            "val": costs["construction_financing"],
             "units": "USD/kW",
         },
         "contingency": {
-            "val": modeling_options["costs"]["contingency"],
+            "val": costs["contingency"],
             "units": "USD/kW",
         },
         "site_auction_price": {
-            "val": modeling_options["costs"]["site_auction_price"],
+            "val": costs["site_auction_price"],
             "units": "USD",
         },
         "site_assessment_cost": {
-            "val": modeling_options["costs"]["site_assessment_cost"],
+            "val": costs["site_assessment_cost"],
             "units": "USD",
         },
         "construction_plan_cost": {
-            "val": modeling_options["costs"]["construction_plan_cost"],
+            "val": costs["construction_plan_cost"],
             "units": "USD",
         },
         "installation_plan_cost": {
-            "val": modeling_options["costs"]["installation_plan_cost"],
+            "val": costs["installation_plan_cost"],
             "units": "USD",
         },
         "boem_review_cost": {
-            "val": modeling_options["costs"]["boem_review_cost"],
+            "val": costs["boem_review_cost"],
             "units": "USD",
         },
     }
@@ -592,35 +779,35 @@ def ORBIT_setup_latents(modeling_options: dict) -> None:
         variable_mapping.update(
             {
                 "num_mooring_lines": {
-                    "val": modeling_options["costs"]["num_mooring_lines"],
+                    "val": costs["num_mooring_lines"],
                     "units": None,
                 },
                 "mooring_line_mass": {
-                    "val": modeling_options["costs"]["mooring_line_mass"],
+                    "val": costs["mooring_line_mass"],
                     "units": "kg",
                 },
                 "mooring_line_diameter": {
-                    "val": modeling_options["costs"]["mooring_line_diameter"],
+                    "val": costs["mooring_line_diameter"],
                     "units": "m",
                 },
                 "mooring_line_length": {
-                    "val": modeling_options["costs"]["mooring_line_length"],
+                    "val": costs["mooring_line_length"],
                     "units": "m",
                 },
                 "anchor_mass": {
-                    "val": modeling_options["costs"]["anchor_mass"],
+                    "val": costs["anchor_mass"],
                     "units": "kg",
                 },
                 "transition_piece_mass": {
-                    "val": modeling_options["costs"]["transition_piece_mass"],
+                    "val": costs["transition_piece_mass"],
                     "units": "t",
                 },
                 "transition_piece_cost": {
-                    "val": modeling_options["costs"]["transition_piece_cost"],
+                    "val": costs["transition_piece_cost"],
                     "units": "USD",
                 },
                 "floating_substructure_cost": {
-                    "val": modeling_options["costs"]["floating_substructure_cost"],
+                    "val": costs["floating_substructure_cost"],
                     "units": "USD",
                 },
             }
@@ -630,27 +817,27 @@ def ORBIT_setup_latents(modeling_options: dict) -> None:
         variable_mapping.update(
             {
                 "monopile_mass": {
-                    "val": modeling_options["costs"]["monopile_mass"],
+                    "val": costs["monopile_mass"],
                     "units": "t",
                 },
                 "monopile_cost": {
-                    "val": modeling_options["costs"]["monopile_cost"],
+                    "val": costs["monopile_cost"],
                     "units": "USD",
                 },
                 "monopile_length": {
-                    "val": modeling_options["costs"]["monopile_length"],
+                    "val": costs["monopile_length"],
                     "units": "m",
                 },
                 "monopile_diameter": {
-                    "val": modeling_options["costs"]["monopile_diameter"],
+                    "val": costs["monopile_diameter"],
                     "units": "m",
                 },
                 "transition_piece_mass": {
-                    "val": modeling_options["costs"]["transition_piece_mass"],
+                    "val": costs["transition_piece_mass"],
                     "units": "t",
                 },
                 "transition_piece_cost": {
-                    "val": modeling_options["costs"]["transition_piece_cost"],
+                    "val": costs["transition_piece_cost"],
                     "units": "USD",
                 },
             }
@@ -692,6 +879,10 @@ def FinanceSE_setup_latents(modeling_options):
         a modeling options dictionary
     """
 
+    # bind the option subtrees that the mapping draws from
+    costs = modeling_options["costs"]
+    turbine = modeling_options["windIO_plant"]["wind_farm"]["turbine"]
+
     # Define the mapping between OpenMDAO variable names and modeling_options keys
     variable_mapping = {
         "turbine_number": {
@@ -699,17 +890,15 @@ def FinanceSE_setup_latents(modeling_options):
             "units": None,
         },
         "machine_rating": {
-            "val": modeling_options["windIO_plant"]["wind_farm"]["turbine"][
-                "performance"
-            ]["rated_power"],
+            "val": turbine["performance"]["rated_power"],
             "units": "W",
         },
         "tcc_per_kW": {
-            "val": modeling_options["costs"]["tcc_per_kW"],
+            "val": costs["tcc_per_kW"],
             "units": "USD/kW",
         },
         "opex_per_kW": {
-            "val": modeling_options["costs"]["opex_per_kW"],
+            "val": costs["opex_per_kW"],
             "units": "USD/kW/year",
         },
     }
@@ -3,9 +3,6 @@ import copy
 
 import numpy as np
 
-import floris
-import floris.turbine_library.turbine_utilities
-
 import ard.farm_aero.templates as templates
 
 
@@ -38,6 +35,8 @@ def create_FLORIS_turbine_from_windIO(
         if the windIO file is in an apparently invalid state
     """
 
+    import floris.turbine_library.turbine_utilities  # deferred, heavy to import
+
     # extract the turbine... assuming a single one for now
     windIOturbine = windIOplant["wind_farm"]["turbine"]
 
@@ -184,17 +183,41 @@ class FLORISFarmComponent:
     -------
     case_title : str
         a "title" for the case, used to disambiguate runs in practice
+    fd_step : float
+        the step size for the forward-difference partials (default: 1e-6)
+    dump_yaml_every_compute : bool
+        whether to dump the FLORIS inputs to YAML on every compute, rather than
+        once at cleanup (default: False)
+    operation_model : str
+        the FLORIS turbine operation model, or None to use "peak-shaving" if a
+        peak shaving fraction is given in the FLORIS modeling options and the
+        turbine's own model otherwise (default: None)
     """
 
     def initialize(self):
         """Initialization-time FLORIS management."""
         self.options.declare("case_title")
+        self.options.declare("fd_step", default=1.0e-6)
+        self.options.declare("dump_yaml_every_compute", default=False)
+        self.options.declare("operation_model", default=None)
 
     def setup(self):
         """Setup-time FLORIS management."""
 
-        # set up FLORIS
-        self.fmodel = floris.FlorisModel("defaults")
+        import floris  # deferred, heavy to import
+
+        # set up FLORIS, splitting the wind conditions across a pool of workers
+        # if requested and not already running under a parallel driver
+        n_workers = self.modeling_options.get("floris", {}).get("n_workers", 1)
+        if (n_workers > 1) and (self.comm.size == 1):
+            self.fmodel = floris.ParFlorisModel(
+                "defaults",
+                interface="multiprocessing",
+                max_workers=n_workers,
+                n_wind_condition_splits=n_workers,
+            )
+        else:
+            self.fmodel = floris.FlorisModel("defaults")
         data_path = self.options["data_path"]
         self.fmodel.set(
             turbine_type=[
@@ -210,10 +233,33 @@ class FLORISFarmComponent:
             ),
         )
 
+        # the operation model is fixed, so bind it once
+        operation_model = self.options["operation_model"]
+        if (operation_model is None) and (
+            "peak_shaving_fraction" in self.modeling_options.get("floris", {})
+        ):
+            operation_model = "peak-shaving"
+        if operation_model is not None:
+            self.fmodel.set_operation_model(operation_model)
+
+        # air density and rotor area are fixed for the (single) windIO turbine,
+        # so precompute the factor taking the velocity squared to thrust
+        rotor_diameter = self.fmodel.core.farm.turbine_definitions[0]["rotor_diameter"]
+        self.thrust_factor = (
+            0.5
+            * self.fmodel.core.flow_field.air_density
+            * np.pi
+            * rotor_diameter**2
+            / 4
+        )
+
         self.case_title = self.options["case_title"]
         self.dir_floris = Path("case_files", self.case_title, "floris_inputs")
         self.dir_floris.mkdir(parents=True, exist_ok=True)
 
+        # no layout or yaw has been run yet
+        self.inputs_key = None
+
     def compute(self, inputs):
         """
         Compute-time FLORIS management.
@@ -224,10 +270,96 @@ class FLORISFarmComponent:
 
         raise NotImplementedError("compute must be specialized,")
 
+    def cleanup(self):
+        """Cleanup-time FLORIS management."""
+        # dump the yaml of the last run once, unless it was dumped every compute
+        if getattr(self, "inputs_key", None) is None:
+            return
+        if not self.options["dump_yaml_every_compute"]:
+            FLORISFarmComponent.dump_floris_yamlfile(self, self.dir_floris)
+
+    def switch_operation_model(self, operation_model):
+        """
+        Switch the FLORIS turbine operation model mid-run.
+
+        Parameters
+        ----------
+        operation_model : str
+            the FLORIS turbine operation model to switch to
+        """
+        self.fmodel.set_operation_model(operation_model)
+        self.inputs_key = None  # the last run no longer stands
+
     def setup_partials(self):
         """Derivative setup for OM component."""
-        # for FLORIS, no derivatives. use FD because FLORIS is cheap
-        self.declare_partials("*", "*", method="fd")
+        # for FLORIS, no derivatives: FD them in compute_partials so that the
+        # perturbed runs can reuse the wind conditions and the baseline
+        self.declare_partials("*", ["x_turbines", "y_turbines", "yaw_turbines"])
+
+    def compute_partials(self, inputs, partials):
+        """
+        Forward-difference partials of a FLORIS farm.
+
+        The baseline is the set of outputs stored by the last `compute` call,
+        so each perturbation only pushes the perturbed layout or yaw angles
+        into FLORIS and re-runs the wake solve. The model is solved once more
+        at the baseline inputs at the end, so `fmodel` is left consistent.
+        """
+
+        step = self.options["fd_step"]
+        outputs_baseline = self.outputs_baseline
+
+        # perturb copies of the inputs one entry at a time
+        x_turbines = np.array(inputs["x_turbines"])
+        y_turbines = np.array(inputs["y_turbines"])
+        yaw_turbines = np.array(inputs["yaw_turbines"])
+        for name_wrt, value_wrt in [
+            ("x_turbines", x_turbines),
+            ("y_turbines", y_turbines),
+            ("yaw_turbines", yaw_turbines),
+        ]:
+            for idx in range(value_wrt.size):
+                value_wrt[idx] += step
+                self.fmodel.set(
+                    layout_x=x_turbines,
+                    layout_y=y_turbines,
+                    yaw_angles=np.tile(yaw_turbines, (self.fmodel.n_findex, 1)),
+                )
+                self.fmodel.run()
+                value_wrt[idx] -= step
+
+                outputs_perturbed = FLORISFarmComponent.get_outputs(self)
+                for name_of, value_of in outputs_perturbed.items():
+                    partials[name_of, name_wrt][:, idx] = (
+                        np.ravel(value_of) - np.ravel(outputs_baseline[name_of])
+                    ) / step
+
+        # put the FLORIS model back in the baseline state, re-running it so that
+        # its solve results match the baseline inputs again
+        self.fmodel.set(
+            layout_x=x_turbines,
+            layout_y=y_turbines,
+            yaw_angles=np.tile(yaw_turbines, (self.fmodel.n_findex, 1)),
+        )
+        self.fmodel.run()
+
+    def get_inputs_key(self, inputs):
+        """Get a key identifying the layout and yaw inputs of a FLORIS run."""
+        return b"".join(
+            inputs[name].tobytes()
+            for name in ["x_turbines", "y_turbines", "yaw_turbines"]
+        )
+
+    def get_outputs(self):
+        """Get the OM component outputs from the last FLORIS run."""
+        outputs = {
+            "AEP_farm": FLORISFarmComponent.get_AEP_farm(self),
+            "power_farm": FLORISFarmComponent.get_power_farm(self),
+        }
+        if self.options["modeling_options"]["aero"]["return_turbine_output"]:
+            outputs["power_turbines"] = FLORISFarmComponent.get_power_turbines(self)
+            outputs["thrust_turbines"] = FLORISFarmComponent.get_thrust_turbines(self)
+        return outputs
 
     def get_AEP_farm(self):
         """Get the AEP of a FLORIS farm."""
@@ -238,39 +370,58 @@ class FLORISFarmComponent:
         return self.fmodel.get_farm_power()
 
     def get_power_turbines(self):
-        """Get the turbine powers of a FLORIS farm at each wind condition."""
-        return self.fmodel.get_turbine_powers().T
+        """
+        Get the turbine powers of a FLORIS farm at each wind condition.
+
+        Returns
+        -------
+        np.ndarray
+            C-contiguous array of shape (N_turbines, N_conditions), so that the
+            conditions seen by a single turbine are stored sequentially
+        """
+        return np.ascontiguousarray(self.fmodel.get_turbine_powers().T)
 
     def get_thrust_turbines(self):
-        """Get the turbine thrusts of a FLORIS farm at each wind condition."""
+        """
+        Get the turbine thrusts of a FLORIS farm at each wind condition.
+
+        Returns
+        -------
+        np.ndarray
+            C-contiguous array of shape (N_turbines, N_conditions), laid out
+            like the output of `get_power_turbines`
+        """
+        import floris  # deferred, heavy to import
+
         # FLORIS computes the thrust precursors, compute and return thrust
         # use pure FLORIS to get these values for consistency
 
         # prepare to unpack thrust data that is not pre-computed in FLORIS
         CT_turbines = self.fmodel.get_turbine_thrust_coefficients()
         V_turbines = self.fmodel.turbine_average_velocities
-        rho_floris = self.fmodel.core.flow_field.air_density
-        A_floris = np.pi * self.fmodel.core.farm.rotor_diameters**2 / 4
 
         # unpacking procedure
         # from FLORIS's floris_model.py:564 at a6fc5d35aa32614edc450dc399c42af60a816887
-        thrust_turbines = CT_turbines * (0.5 * rho_floris * A_floris * V_turbines**2)
+        thrust_turbines = CT_turbines * self.thrust_factor
+        thrust_turbines *= V_turbines
+        thrust_turbines *= V_turbines
         if isinstance(self.fmodel.wind_data, floris.WindRose) or isinstance(
             self.fmodel.wind_data, floris.WindRoseWRG
         ):
+            # densify straight into the turbine-major layout
             thrust_turbines_densified = np.full(
                 (
-                    np.prod(self.fmodel.wind_data.freq_table.shape),
                     self.fmodel.core.farm.n_turbines,
+                    np.prod(self.fmodel.wind_data.freq_table.shape),
                 ),
                 0.0,
             )
-            thrust_turbines_densified[self.fmodel.wind_data.non_zero_freq_mask, :] = (
-                thrust_turbines
+            thrust_turbines_densified[:, self.fmodel.wind_data.non_zero_freq_mask] = (
+                thrust_turbines.T
             )
-            return thrust_turbines_densified.T
+            return thrust_turbines_densified
         else:
-            return thrust_turbines.T
+            return np.ascontiguousarray(thrust_turbines.T)
 
     def dump_floris_yamlfile(self, dir_output=None):
         """
@@ -297,6 +448,15 @@ class FLORISBatchPower(templates.BatchFarmPowerTemplate, FLORISFarmComponent):
     case_title : str
         a "title" for the case, used to disambiguate runs in practice (inherited
         from `FLORISFarmComponent`)
+    fd_step : float
+        the step size for the forward-difference partials (inherited from
+        `FLORISFarmComponent`)
+    dump_yaml_every_compute : bool
+        whether to dump the FLORIS inputs to YAML on every compute; otherwise
+        they are not dumped (inherited from `FLORISFarmComponent`)
+    operation_model : str
+        the FLORIS turbine operation model (inherited from
+        `FLORISFarmComponent`)
     modeling_options : dict
         a modeling options dictionary (inherited via
         `templates.BatchFarmPowerTemplate`)
@@ -341,47 +501,52 @@ class FLORISBatchPower(templates.BatchFarmPowerTemplate, FLORISFarmComponent):
         FLORISFarmComponent.initialize(self)  # FLORIS superclass
 
     def setup(self):
+        import floris  # deferred, heavy to import
+
         super().setup()  # run super class script first!
         FLORISFarmComponent.setup(self)  # setup a FLORIS run
 
-    def setup_partials(self):
-        FLORISFarmComponent.setup_partials(self)
-
-    def compute(self, inputs, outputs):
-
-        # generate the list of conditions for evaluation
+        # generate the list of conditions for evaluation, which is fixed, so
+        # hand it to FLORIS once
         self.time_series = floris.TimeSeries(
             wind_directions=np.degrees(np.array(self.wind_query.wind_directions)),
             wind_speeds=np.array(self.wind_query.wind_speeds),
             turbulence_intensities=np.array(self.wind_query.turbulence_intensities),
         )
+        self.fmodel.set(wind_data=self.time_series)
+
+    def setup_partials(self):
+        FLORISFarmComponent.setup_partials(self)
+
+    def compute_partials(self, inputs, partials):
+        FLORISFarmComponent.compute_partials(self, inputs, partials)
+
+    def compute(self, inputs, outputs):
+
+        # if the layout and yaw are unchanged since the last run, reuse it
+        inputs_key = FLORISFarmComponent.get_inputs_key(self, inputs)
+        if inputs_key == self.inputs_key:
+            for name, value in self.outputs_baseline.items():
+                outputs[name] = value
+            return
 
         # set up and run the floris model
         self.fmodel.set(
             layout_x=inputs["x_turbines"],
             layout_y=inputs["y_turbines"],
-            wind_data=self.time_series,
-            yaw_angles=np.array([inputs["yaw_turbines"]]),
-            reference_wind_height=(
-                self.wind_query.reference_height
-                if hasattr(self.wind_query, "reference_height")
-                else None
-            ),
+            yaw_angles=np.tile(inputs["yaw_turbines"], (self.fmodel.n_findex, 1)),
         )
-        if "peak_shaving_fraction" in self.modeling_options.get("floris", {}):
-            self.fmodel.set_operation_model("peak-shaving")
-
         self.fmodel.run()
 
         # dump the yaml to re-run this case on demand
-        # FLORISFarmComponent.dump_floris_yamlfile(self, self.dir_floris)
+        if self.options["dump_yaml_every_compute"]:
+            FLORISFarmComponent.dump_floris_yamlfile(self, self.dir_floris)
 
-        # FLORIS computes the powers
-        outputs["AEP_farm"] = FLORISFarmComponent.get_AEP_farm(self)
-        outputs["power_farm"] = FLORISFarmComponent.get_power_farm(self)
-        if self.options["modeling_options"]["aero"]["return_turbine_output"]:
-            outputs["power_turbines"] = FLORISFarmComponent.get_power_turbines(self)
-            outputs["thrust_turbines"] = FLORISFarmComponent.get_thrust_turbines(self)
+        # FLORIS computes the powers, keep them as the baseline for partials
+        self.outputs_baseline = FLORISFarmComponent.get_outputs(self)
+        self.inputs_key = inputs_key
+        for name, value in self.outputs_baseline.items():
+            outputs[name] = value
 
 
 class FLORISAEP(templates.FarmAEPTemplate):
@@ -398,6 +563,15 @@ class FLORISAEP(templates.FarmAEPTemplate):
     case_title : str
         a "title" for the case, used to disambiguate runs in practice (inherited
         from `FLORISFarmComponent`)
+    fd_step : float
+        the step size for the forward-difference partials (inherited from
+        `FLORISFarmComponent`)
+    dump_yaml_every_compute : bool
+        whether to dump the FLORIS inputs to YAML on every compute, rather than
+        once at cleanup (inherited from `FLORISFarmComponent`)
+    operation_model : str
+        the FLORIS turbine operation model (inherited from
+        `FLORISFarmComponent`)
     modeling_options : dict
         a modeling options dictionary (inherited via
         `templates.FarmAEPTemplate`)
@@ -446,36 +620,45 @@ class FLORISAEP(templates.FarmAEPTemplate):
         super().setup()  # run super class script first!
         FLORISFarmComponent.setup(self)  # setup a FLORIS run
 
+        # the wind rose is fixed, so hand it to FLORIS once
+        self.fmodel.set(wind_data=self.wind_query)
+
     def setup_partials(self):
         super().setup_partials()
 
     def compute(self, inputs, outputs):
 
+        # if the layout and yaw are unchanged since the last run, reuse it
+        inputs_key = FLORISFarmComponent.get_inputs_key(self, inputs)
+        if inputs_key == self.inputs_key:
+            for name, value in self.outputs_baseline.items():
+                outputs[name] = value
+            return
+
         # set up and run the floris model
         self.fmodel.set(
             layout_x=inputs["x_turbines"],
             layout_y=inputs["y_turbines"],
-            wind_data=self.wind_query,
-            yaw_angles=np.array([inputs["yaw_turbines"]]),
-            reference_wind_height=(
-                self.wind_query.reference_height
-                if hasattr(self.wind_query, "reference_height")
-                else None
-            ),
+            yaw_angles=np.tile(inputs["yaw_turbines"], (self.fmodel.n_findex, 1)),
         )
-        if "peak_shaving_fraction" in self.modeling_options.get("floris", {}):
-            self.fmodel.set_operation_model("peak-shaving")
-
         self.fmodel.run()
 
         # dump the yaml to re-run this case on demand
-        FLORISFarmComponent.dump_floris_yamlfile(self, self.dir_floris)
+        if self.options["dump_yaml_every_compute"]:
+            FLORISFarmComponent.dump_floris_yamlfile(self, self.dir_floris)
 
-        # FLORIS computes the powers
-        outputs["AEP_farm"] = FLORISFarmComponent.get_AEP_farm(self)
-        outputs["power_farm"] = FLORISFarmComponent.get_power_farm(self)
-        outputs["power_turbines"] = FLORISFarmComponent.get_power_turbines(self)
-        outputs["thrust_turbines"] = FLORISFarmComponent.get_thrust_turbines(self)
+        # FLORIS computes the powers, keep them as the baseline for partials
+        self.outputs_baseline = FLORISFarmComponent.get_outputs(self)
+        self.inputs_key = inputs_key
+        for name, value in self.outputs_baseline.items():
+            outputs[name] = value
 
     def setup_partials(self):
         FLORISFarmComponent.setup_partials(self)
+
+    def compute_partials(self, inputs, partials):
+        FLORISFarmComponent.compute_partials(self, inputs, partials)
+
+    def cleanup(self):
+        super().cleanup()
+        FLORISFarmComponent.cleanup(self)
@@ -4,8 +4,6 @@ import numpy as np
 
 import openmdao.api as om
 
-import floris
-
 
 def create_windresource_from_windIO(
     windIOdict: dict,
@@ -39,6 +37,8 @@ def create_windresource_from_windIO(
         if an unimplemented case is found
     """
 
+    import floris  # deferred, heavy to import
+
     if not "site" in windIOdict:  # make sure the site is specified
         raise KeyError("No site specified in windIO plant dictionary.")
     if "energy_resource" not in windIOdict["site"]:
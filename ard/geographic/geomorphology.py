@@ -1,12 +1,84 @@
 from os import PathLike
 from pathlib import Path
 
+import numba
 import numpy as np
 from scipy.interpolate import SmoothBivariateSpline
 
 import openmdao.api as om
 
 
+def _as_grid_data(data_in, dtype, copy=True):
+    """
+    Get gridded data as a C-contiguous array of a given dtype.
+
+    Parameters
+    ----------
+    data_in : np.ndarray
+        the gridded data
+    dtype : type
+        the floating point type to store the data in
+    copy : bool, optional
+        whether to always copy the data; if False, the data is aliased when it is
+        already C-contiguous and of the given dtype
+
+    Returns
+    -------
+    np.ndarray
+        the gridded data, as a C-contiguous array of the given dtype
+    """
+    if copy:
+        return np.array(data_in, dtype=dtype, order="C")
+    return np.ascontiguousarray(data_in, dtype=dtype)
+
+
+@numba.njit(cache=True)
+def _interpolate_bilinear(x_coord, y_coord, z_data, x_query, y_query):
+    """
+    Bilinearly interpolate rectilinear gridded data and its gradient.
+
+    Queries outside of the grid are linearly extrapolated from the nearest
+    edge cell.
+
+    Parameters
+    ----------
+    x_coord, y_coord : np.ndarray
+        1D arrays of the strictly increasing grid coordinates, each with at least
+        two points
+    z_data : np.ndarray
+        a 2D array of the gridded data, with shape (`x_coord.size`,
+        `y_coord.size`)
+    x_query, y_query : np.ndarray
+        1D arrays of the locations to sample
+
+    Returns
+    -------
+    tuple
+        1D arrays of the data and of its x and y derivatives at the queries
+    """
+    z_query = np.empty(x_query.size)
+    dz_dx = np.empty(x_query.size)
+    dz_dy = np.empty(x_query.size)
+    for k in range(x_query.size):
+        # find the cell containing the query
+        i = min(max(np.searchsorted(x_coord, x_query[k]) - 1, 0), x_coord.size - 2)
+        j = min(max(np.searchsorted(y_coord, y_query[k]) - 1, 0), y_coord.size - 2)
+        hx = x_coord[i + 1] - x_coord[i]
+        hy = y_coord[j + 1] - y_coord[j]
+        tx = (x_query[k] - x_coord[i]) / hx
+        ty = (y_query[k] - y_coord[j]) / hy
+
+        # blend the cell corners, and differentiate the blend
+        z00, z10 = z_data[i, j], z_data[i + 1, j]
+        z01, z11 = z_data[i, j + 1], z_data[i + 1, j + 1]
+        z_query[k] = (1.0 - ty) * ((1.0 - tx) * z00 + tx * z10) + ty * (
+            (1.0 - tx) * z01 + tx * z11
+        )
+        dz_dx[k] = ((1.0 - ty) * (z10 - z00) + ty * (z11 - z01)) / hx
+        dz_dy[k] = ((1.0 - tx) * (z01 - z00) + tx * (z11 - z10)) / hy
+    return z_query, dz_dx, dz_dy
+
+
 class GeomorphologyGridData:
     """
     A class to represent gridded geomorphology data for a given wind farm site
@@ -16,42 +88,65 @@ class GeomorphologyGridData:
     onshore sites.
     """
 
+    dtype = np.float32  # floating point type to store the gridded data in
+
     # alias for meshed data, and promote dimension to 2
-    x_data = np.atleast_2d([0.0])  # x location in km
-    y_data = np.atleast_2d([0.0])  # y location in km
-    z_data = np.atleast_2d([0.0])  # depth in m
+    x_data = np.zeros((1, 1), dtype=dtype)  # x location in km
+    y_data = np.zeros((1, 1), dtype=dtype)  # y location in km
+    z_data = np.zeros((1, 1), dtype=dtype)  # depth in m
+
+    # 1D coordinates of rectilinear grids, which x and y data are then views of
+    x_coord = None  # x coordinates in km, along the first axis of the data
+    y_coord = None  # y coordinates in km, along the second axis of the data
 
     # alias for meshed material data, promote dimension to 2
-    x_material_data = np.atleast_2d([0.0])  # x location in km of material datapoint
-    y_material_data = np.atleast_2d([0.0])  # y location in km of material datapoint
-    material_data = np.atleast_2d(["soil"])  # bed material at each point
+    x_material_data = np.zeros((1, 1), dtype=dtype)  # x location in km of material
+    y_material_data = np.zeros((1, 1), dtype=dtype)  # y location in km of material
+    material_labels = ["soil"]  # bed materials, indexed by material code
+    material_codes = np.atleast_2d(np.uint8(0))  # bed material code at each point
 
     sea_level = 0.0  # sea level in m
 
     _interpolator_device = None  # placeholder for interpolator (for depth evaluation)
 
+    @property
+    def material_data(self):
+        """Bed material at each point, decoded from the material codes."""
+        return np.asarray(self.material_labels)[self.material_codes]
+
+    @material_data.setter
+    def material_data(self, material_data_in):
+        # store the unique materials once and a small integer code per point
+        labels, codes = np.unique(material_data_in, return_inverse=True)
+        self.material_labels = labels.tolist()
+        self.material_codes = codes.astype(np.min_scalar_type(len(labels) - 1)).reshape(
+            np.shape(material_data_in)
+        )
+
     def check_valid_geomorphology(self):
+        """Assert that the geomorphology data is 2D and consistently shaped."""
         assert self.x_data.ndim == 2, "data must be 2D"  # make sure it's 2D first
 
-        assert np.all(
-            self.x_data.shape == self.y_data.shape
-        ), "x and y data must be the same shape"
-        assert np.all(
-            self.x_data.shape == self.z_data.shape
-        ), "x and depth data must be the same shape"
+        # shapes are tuples, so compare them directly rather than through numpy
+        shape = self.x_data.shape
+        assert shape == self.y_data.shape, "x and y data must be the same shape"
+        assert shape == self.z_data.shape, "x and depth data must be the same shape"
 
         return True
 
     def check_valid_material(self):
+        """Assert that the material data is 2D and consistently shaped."""
         assert (
             self.x_material_data.ndim == 2
         ), "data must be 2D"  # make sure it's 2D first
 
-        assert np.all(
-            self.x_material_data.shape == self.y_material_data.shape
+        # shapes are tuples, so compare them directly rather than through numpy
+        shape = self.x_material_data.shape
+        assert (
+            shape == self.y_material_data.shape
         ), "x and y material data must be the same shape"
-        assert np.all(self.x_material_data.shape == self.material_data.shape) or (
-            self.material_data.size == 1
+        assert (shape == self.material_codes.shape) or (
+            self.material_codes.size == 1
         ), "x and material data must be the same shape or material data must be a singleton"
 
         return True
@@ -66,7 +161,8 @@ class GeomorphologyGridData:
             The shape of the geomorphology data.
         """
 
-        self.check_valid_geomorphology()  # ensure that the current data is valid
+        # data is validated when it is set, so trust it here; call
+        # check_valid_geomorphology explicitly after modifying it by hand
         return self.z_data.shape  # data shape
 
     def get_material_shape(self):
@@ -79,14 +175,16 @@ class GeomorphologyGridData:
             The shape of the material data.
         """
 
-        self.check_valid_material()  # ensure that the current data is valid
-        return self.material_data.shape  # data shape
+        # data is validated when it is set, so trust it here; call
+        # check_valid_material explicitly after modifying it by hand
+        return self.material_codes.shape  # data shape
 
     def set_data_values(
         self,
         x_data_in,
         y_data_in,
         z_data_in,
+        copy=True,
     ):
         """
         Set the values of the geomorphology data.
@@ -99,14 +197,19 @@ class GeomorphologyGridData:
             A 2D numpy array indicating the y-dimension locations of the points.
         z_data_in : np.ndarray
             A 2D numpy array indicating the depth at each point.
-        material_data_in : np.ndarray, optional
-            A 2D numpy array indicating the bed material at each point.
+        copy : bool, optional
+            Whether to copy the data that is handed in. If False, the caller
+            hands over ownership: inputs that are already C-contiguous and of
+            the class dtype are aliased, not copied, so later modifications of
+            them (by the caller) will modify this object's data too.
         """
 
-        # set the values that are handed in
-        self.x_data = x_data_in.copy()
-        self.y_data = y_data_in.copy()
-        self.z_data = z_data_in.copy()
+        # set the values that are handed in, as contiguous arrays
+        self.x_coord = self.y_coord = None  # not known to be rectilinear
+        self.x_data = _as_grid_data(x_data_in, self.dtype, copy=copy)
+        self.y_data = _as_grid_data(y_data_in, self.dtype, copy=copy)
+        self.z_data = _as_grid_data(z_data_in, self.dtype, copy=copy)
+        self._interpolator_device = None  # the data has changed, so refit
 
         self.check_valid_geomorphology()  # ensure that the input data is valid
 
@@ -115,6 +218,7 @@ class GeomorphologyGridData:
         x_material_data_in,
         y_material_data_in,
         material_data_in,
+        copy=True,
     ):
         """
         Set the values of the material data.
@@ -127,12 +231,16 @@ class GeomorphologyGridData:
             A 2D numpy array indicating the y-dimension locations of the points.
         material_data_in : np.ndarray
             A 2D numpy array indicating the bed material at each point.
+        copy : bool, optional
+            Whether to copy the location data that is handed in, with the same
+            aliasing behavior as in `set_data_values`. The material data is
+            always encoded, so never aliased.
         """
 
-        # set the values that are handed in
-        self.x_material_data = x_material_data_in.copy()
-        self.y_material_data = y_material_data_in.copy()
-        self.material_data = material_data_in.copy()
+        # set the values that are handed in, as contiguous arrays
+        self.x_material_data = _as_grid_data(x_material_data_in, self.dtype, copy=copy)
+        self.y_material_data = _as_grid_data(y_material_data_in, self.dtype, copy=copy)
+        self.material_data = material_data_in  # encoded, so never aliased
 
         self.check_valid_material()  # ensure that the input data is valid
 
@@ -160,6 +268,11 @@ class GeomorphologyGridData:
             The x locations to sample in km
         y_query : np.array
             The y locations to sample in km
+        return_derivs : bool, optional
+            whether to return the x and y derivatives instead of the depth
+        interp_method : str, optional
+            the interpolation scheme: "spline" (default) for a smooth
+            bivariate spline, or "bilinear" for rectilinear grids
 
         Returns
         -------
@@ -206,6 +319,37 @@ class GeomorphologyGridData:
                 z_query = interpolator_sbs(x_query, y_query, grid=False)
                 return z_query  # just return
 
+        elif interp_method == "bilinear":
+            # or, bilinear interpolation on a rectilinear grid
+
+            if (self.x_coord is not None) and (self.y_coord is not None):
+                x_coord, y_coord = self.x_coord, self.y_coord
+            else:
+                # recover the 1D coordinates of a rectilinear mesh
+                x_coord, y_coord = self.x_data[:, 0], self.y_data[0, :]
+                assert np.all(self.x_data == x_coord[:, np.newaxis]) and np.all(
+                    self.y_data == y_coord[np.newaxis, :]
+                ), "bilinear interpolation requires a rectilinear grid"
+            assert (x_coord.size > 1) and (
+                y_coord.size > 1
+            ), "bilinear interpolation requires at least two points on each axis"
+            assert np.all(np.diff(x_coord) > 0) and np.all(
+                np.diff(y_coord) > 0
+            ), "bilinear interpolation requires increasing grid coordinates"
+
+            # make interpolation
+            z_query, dz_dx, dz_dy = _interpolate_bilinear(
+                x_coord,
+                y_coord,
+                self.z_data,
+                x_query.astype(np.float64),
+                y_query.astype(np.float64),
+            )
+            if return_derivs:
+                return (dz_dx, dz_dy)  # and return
+            else:
+                return z_query  # just return
+
         else:
             raise NotImplementedError(
                 f"{interp_method} interpolation scheme for evaluate not implemented yet. -cfrontin"
@@ -243,8 +387,9 @@ class BathymetryGridData(GeomorphologyGridData):
         with open(file_soil, "r") as f_soil:
             idx_y = 0  # indexer for y coordinate as file is read
 
-            # iterate over lines in the soil file
-            for idx_line, line in enumerate(f_soil.readlines()):
+            # iterate over lines in the soil file, streaming rather than
+            # materializing the whole file
+            for idx_line, line in enumerate(f_soil):
 
                 if idx_line == 0:  # moorpy header line must be first
                     assert line.startswith("--- MoorPy Soil Input File ---")
@@ -268,56 +413,38 @@ class BathymetryGridData(GeomorphologyGridData):
             The path to the bathymetry data file
         """
 
-        # create placeholder objects in function local scope
-        grid_bathy = None
-        x_coord = None
-        y_coord = None
-
         with open(file_bathymetry, "r") as f_bathy:
-            idx_y = 0  # indexer for y coordinate as file is read
-
-            # iterate over lines in the bathymetry file
-            for idx_line, line in enumerate(f_bathy.readlines()):
-
-                if idx_line == 0:  # moorpy header line must be first
-                    assert line.startswith("--- MoorPy Bathymetry Input File ---")
-                    continue
-                if idx_line == 1:  # next line defines the grid size in x
-                    assert line.startswith("nGridX")  # guarantee this is the case
-                    nGridX = int(line.split()[1])  # extract the number
-                    x_coord = np.zeros((nGridX,))  # prepare a coord array
-                    continue
-                if idx_line == 2:  # next line defines the grid size in y
-                    assert line.startswith("nGridY")  # guarantee this is the case
-                    nGridY = int(line.split()[1])  # extract the number
-                    y_coord = np.zeros((nGridY,))  # prepare a coord array
-                    grid_bathy = np.zeros((nGridX, nGridY))  # prepare a grid
-                    continue
-
-                if idx_line == 3:  # next line should define the x coordinates
-                    x_coord_tgt = [float(x) for x in line.split()]  # extract
-                    assert len(x_coord_tgt) == nGridX  # verify length
-                    x_coord = np.array(x_coord_tgt)  # convert to array
-                    continue
 
-                if (
-                    idx_line > 3
-                ):  # all other lines should be y coordinate then gridpoint data
-                    if not line.strip():
-                        continue  # if the line is empty or whitespace, skip it
-
-                    y_coord_tgt = float(line.split()[0])  # extract the y coordinate
-                    bathy_row_tgt = [
-                        float(b) for b in line.split()[1:]
-                    ]  # extract the bathymetry data
-                    assert len(bathy_row_tgt) == nGridX  # verify length
-                    y_coord[idx_y] = y_coord_tgt  # set the y coordinate
-                    grid_bathy[:, idx_y] = bathy_row_tgt  # set the bathymetry data
-                    idx_y += 1  # increment the y indexer
-            assert idx_y == nGridY  # verify that all y coordinates were read
-
-        # save into the geomorphology data object
-        self.y_data, self.x_data = np.meshgrid(y_coord, x_coord)
+            # moorpy header line must be first
+            assert f_bathy.readline().startswith("--- MoorPy Bathymetry Input File ---")
+
+            # next lines define the grid sizes in x and y
+            line = f_bathy.readline()
+            assert line.startswith("nGridX")  # guarantee this is the case
+            nGridX = int(line.split()[1])  # extract the number
+            line = f_bathy.readline()
+            assert line.startswith("nGridY")  # guarantee this is the case
+            nGridY = int(line.split()[1])  # extract the number
+
+            # next line should define the x coordinates, parsed by numpy in C
+            x_coord = np.fromstring(f_bathy.readline(), sep=" ", dtype=self.dtype)
+            assert x_coord.size == nGridX  # verify length
+
+            # all other lines should be y coordinate then gridpoint data, which
+            # numpy can parse in one go (skipping empty lines)
+            data_bathy = np.loadtxt(f_bathy, dtype=self.dtype, ndmin=2)
+
+        # verify that all the y coordinates and gridpoint data were read
+        assert data_bathy.shape == (nGridY, nGridX + 1)
+        y_coord = data_bathy[:, 0]
+        grid_bathy = np.ascontiguousarray(data_bathy[:, 1:].T)
+
+        # save into the geomorphology data object: the grid is rectilinear, so
+        # keep only the 1D coordinates and alias zero-copy meshes of them
+        self.x_coord = x_coord
+        self.y_coord = y_coord
+        self.x_data = np.broadcast_to(x_coord[:, np.newaxis], grid_bathy.shape)
+        self.y_data = np.broadcast_to(y_coord[np.newaxis, :], grid_bathy.shape)
         self.z_data = grid_bathy
 
         self.check_valid_geomorphology()  # make sure the loaded file is legit before exiting
@@ -92,8 +92,8 @@ class ConstantDepthMooringDesign(om.ExplicitComponent):
     wind_query : floris.wind_data.WindRose
         a WindQuery objects that specifies the wind conditions that are to be
         computed
-    bathymetry_data : ard.geographic.BathymetryData
-        a BathymetryData object to specify the bathymetry mesh/sampling
+    bathymetry_data : ard.geographic.BathymetryGridData
+        a BathymetryGridData object to specify the bathymetry mesh/sampling
 
     Inputs
     ------
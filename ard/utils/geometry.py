@@ -1,7 +1,11 @@
+import numba
 import numpy as np
 import jax.numpy as jnp
 import jax
-from ard.utils.mathematics import smooth_max, smooth_min, smooth_norm
+from ard.utils.mathematics import smooth_max, smooth_min, smooth_norm, smooth_norm_vec
+
+# floating point precision of the differentiable polygon constraint calculations
+DTYPE = jnp.float32
 
 
 def get_nearest_polygons(
@@ -30,42 +34,17 @@ def get_nearest_polygons(
         np.ndarray: Region assignments for each turbine.
     """
 
-    # Number of turbines
-    n_points = len(points_x)
-
-    # Number of regions
-    nregions = len(boundary_vertices)
-
-    # Initialize region and status arrays
-    region = -np.ones(n_points, dtype=int)
-
-    # Initialize array to hold distances from each turbine to the closest boundary face
-    turbine_to_region_distance = np.zeros(nregions, dtype=float)
-
-    for i in range(n_points):
-        # Iterate through each region
-        for k in range(nregions):
-            # Get distance to each region
-            ctmp = distance_point_to_polygon_ray_casting(
-                np.array([points_x[i], points_y[i]]),
-                boundary_vertices[k],
-                s=s,
-                shift=tol,
-                return_distance=True,
-            )
-            if ctmp <= 0:  # Negative if in boundary
-                region[i] = k
-                break
-
-            # Check if the point is not in any of the regions
-            else:
-                # Calculate distance to each region
-                turbine_to_region_distance[k] = ctmp
-
-        # Magnitude of the constraint value
-        if region[i] == -1:
-            # Indicate closest region
-            region[i] = np.argmin(turbine_to_region_distance)
+    # Assign each turbine to the first region it is in, or to the closest region if
+    # it is not in any of the regions, by the forward-only numba path (no gradients
+    # are needed) over edges that are built once for all regions
+    region = np.empty(len(points_x), dtype=int)
+    _get_nearest_polygons_numba(
+        np.ascontiguousarray(points_x, dtype=np.float64),
+        np.ascontiguousarray(points_y, dtype=np.float64),
+        *polygon_edges(boundary_vertices, shift=tol),
+        float(s),
+        region,
+    )
 
     return region
 
@@ -77,6 +56,9 @@ def distance_multi_point_to_multi_polygon_ray_casting(
     regions: np.ndarray[int],
     s=700,
     tol=1e-6,
+    backend="jax",
+    c=None,
+    batch_size: int | None = None,
 ) -> np.ndarray:
     """
     Calculate the distance from each point to the nearest point on a polygon or set of polygons using
@@ -91,47 +73,421 @@ def distance_multi_point_to_multi_polygon_ray_casting(
         regions (np.array[int]): Predefined region assignments for each point. Defaults to None.
         s (float, optional): Smoothing factor for smooth max. Defaults to 700.
         tol (float, optional): Tolerance for determining proximity of point to polygon to be considered inside the polygon. Defaults to 1e-6.
-        c (np.ndarray, optional): Preallocated array for constraint values. Defaults to None.
+        backend (str, optional): "jax" for the differentiable (jitted) implementation, or
+            "numba" for a compiled, forward-only implementation in double precision, for
+            callers that do not need gradients. Defaults to "jax".
+        c (np.ndarray, optional): Preallocated array for constraint values, used by the
+            "numba" backend. Defaults to None.
+        batch_size (int, optional): Number of points evaluated together by the "jax"
+            backend, bounding the memory used for the point-to-edge distances. If None,
+            all points are evaluated at once. Defaults to None.
 
     Returns:
         np.ndarray: Constraint values for each turbine.
-        np.ndarray (optional): Region assignments for each turbine (if `return_region` is True).
+    """
+
+    if backend == "jax":
+        return _distance_multi_point_to_multi_polygon_ray_casting_jax(
+            points_x,
+            points_y,
+            boundary_vertices,
+            regions,
+            s=s,
+            tol=tol,
+            batch_size=batch_size,
+        )
+    elif backend != "numba":
+        raise ValueError(f"backend must be 'jax' or 'numba', not '{backend}'.")
+
+    if c is None:
+        c = np.empty(len(points_x), dtype=np.float64)
+
+    _distance_multi_point_to_multi_polygon_ray_casting_numba(
+        np.ascontiguousarray(points_x, dtype=np.float64),
+        np.ascontiguousarray(points_y, dtype=np.float64),
+        *polygon_edges(boundary_vertices, shift=tol),
+        np.asarray(regions, dtype=np.int64),
+        float(s),
+        c,
+    )
+
+    return c
+
+
+def polygon_edges(boundary_vertices: list[np.ndarray], shift: float = 1e-10) -> tuple:
+    """
+    Build a struct-of-arrays representation of the edges of a set of polygons for the
+    forward-only ray casting, precomputing everything that does not depend on the
+    query points. The polygon loops are closed, so that edge j of a polygon runs from
+    its vertex j to its vertex j + 1 (or back to its first vertex, for the last edge).
+
+    Args:
+        boundary_vertices (list[np.ndarray]): Vertices of each polygon (m-by-2 arrays)
+            in counterclockwise order. The polygons do not need to have the same number
+            of vertices.
+        shift (float, optional): Small shift to handle edge cases in the edge slopes.
+            Defaults to 1e-10.
+
+    Returns:
+        tuple: contiguous 1D float64 arrays of the edge start x and y coordinates, the
+            edge end x and y coordinates, the edge vector x and y components, the
+            inverse squared edge lengths (zero for zero-length edges) and the edge
+            slopes, followed by a 1D int array of offsets such that the edges of
+            polygon k are at `offsets[k]:offsets[k + 1]`.
+    """
+
+    starts = np.concatenate(
+        [np.asarray(polygon, dtype=np.float64) for polygon in boundary_vertices]
+    )
+    ends = np.concatenate(
+        [
+            np.roll(np.asarray(polygon, dtype=np.float64), -1, axis=0)
+            for polygon in boundary_vertices
+        ]
+    )
+    offsets = np.cumsum([0] + [len(polygon) for polygon in boundary_vertices])
+
+    starts_x = np.ascontiguousarray(starts[:, 0])
+    starts_y = np.ascontiguousarray(starts[:, 1])
+    ends_x = np.ascontiguousarray(ends[:, 0])
+    ends_y = np.ascontiguousarray(ends[:, 1])
+    vectors_x = ends_x - starts_x
+    vectors_y = ends_y - starts_y
+    lengths_squared = vectors_x**2 + vectors_y**2
+    inv_lengths_squared = np.divide(
+        1.0,
+        lengths_squared,
+        out=np.zeros_like(lengths_squared),
+        where=lengths_squared > 0,
+    )
+    slopes = vectors_y / (vectors_x + shift)
+
+    return (
+        starts_x,
+        starts_y,
+        ends_x,
+        ends_y,
+        vectors_x,
+        vectors_y,
+        inv_lengths_squared,
+        slopes,
+        offsets,
+    )
+
+
+def _distance_multi_point_to_multi_polygon_ray_casting_jax(
+    points_x: np.ndarray[float],
+    points_y: np.ndarray[float],
+    boundary_vertices: list[list[np.ndarray]],
+    regions: np.ndarray[int],
+    s=700,
+    tol=1e-6,
+    batch_size=None,
+) -> np.ndarray:
+    """
+    The JAX implementation of `distance_multi_point_to_multi_polygon_ray_casting`.
     """
 
     # Combine points_x and points_y into a single array of points
     points = jnp.stack([points_x, points_y], axis=1)
 
-    # Determine the maximum number of vertices in any polygon
-    max_vertices = max(len(polygon) for polygon in boundary_vertices)
-
-    # Pad all polygons to have the same number of vertices
-    def pad_polygon(polygon):
-        padding = max_vertices - len(polygon)
-        return jnp.pad(polygon, ((0, padding), (0, 0)))
+    # Close each polygon once, then pad all polygons to the same number of edges
+    # with zero-length edges at their first vertex, which never cross the ray and
+    # are masked out of the distance
+    polygon_edges_jax = [prepare_polygon(polygon) for polygon in boundary_vertices]
+    n_edges = jnp.array([len(edge_starts) for edge_starts, _ in polygon_edges_jax])
+    max_edges = max(len(edge_starts) for edge_starts, _ in polygon_edges_jax)
+
+    def pad_edges(edges):
+        padding = jnp.broadcast_to(edges[0][0], (max_edges - len(edges[0]), 2))
+        return jnp.concatenate([edges[0], padding]), jnp.concatenate(
+            [edges[1], padding]
+        )
 
-    padded_boundary_vertices = jnp.stack(
-        [pad_polygon(polygon) for polygon in boundary_vertices]
+    padded_edge_starts, padded_edge_ends = (
+        jnp.stack(padded)
+        for padded in zip(*[pad_edges(edges) for edges in polygon_edges_jax])
     )
 
     # Define a function to compute the distance for a single point and its assigned region
     def compute_distance(point, region_idx):
-        vertices = padded_boundary_vertices[region_idx]
-        return distance_point_to_polygon_ray_casting(
+        return distance_point_to_polygon_edges_ray_casting(
             point=point,
-            vertices=vertices,
+            edge_starts=padded_edge_starts[region_idx],
+            edge_ends=padded_edge_ends[region_idx],
             s=s,
             shift=tol,
             return_distance=True,
+            edge_mask=jnp.arange(max_edges) < n_edges[region_idx],
         )
 
-    # Vectorize the computation over all points
-    distances = jax.vmap(compute_distance, in_axes=(0, 0))(points, regions)
+    # Vectorize the computation over all points, or over batches of points
+    if batch_size is None:
+        distances = jax.vmap(compute_distance, in_axes=(0, 0))(points, regions)
+    else:
+        distances = jax.lax.map(
+            lambda inputs: compute_distance(*inputs),
+            (points, regions),
+            batch_size=batch_size,
+        )
 
     return distances
 
 
-distance_multi_point_to_multi_polygon_ray_casting = jax.jit(
-    distance_multi_point_to_multi_polygon_ray_casting
+_distance_multi_point_to_multi_polygon_ray_casting_jax = jax.jit(
+    _distance_multi_point_to_multi_polygon_ray_casting_jax,
+    static_argnames=["batch_size"],
+)
+
+
+@numba.njit(cache=True)
+def _distance_point_to_polygon_edges_numba(
+    px,
+    py,
+    start,
+    n_edges,
+    starts_x,
+    starts_y,
+    ends_x,
+    vectors_x,
+    vectors_y,
+    inv_lengths_squared,
+    slopes,
+    s,
+    distances,
+):
+    """
+    Signed distance from a point to the polygon with edges `start:start + n_edges`
+    of the struct-of-arrays edges from `polygon_edges`, in scalar arithmetic.
+
+    Follows `distance_point_to_polygon_ray_casting` edge by edge: the ray-casting
+    parity gives the sign, and the smooth minimum (as in `smooth_min`) of the smooth
+    distances to the edges gives the magnitude. `distances` is a work array with
+    room for at least `n_edges` values.
+    """
+    buf_squared = 1e-24  # matches the default buffer of `smooth_norm`
+
+    intersection_counter = 0
+    distance_min = np.inf
+    idx_min = 0
+    for j in range(n_edges):
+        ax = starts_x[start + j]
+        ay = starts_y[start + j]
+        bx = ends_x[start + j]
+
+        # count the edge if the point is below it
+        if ((ax <= px) and (px < bx)) or ((ax >= px) and (px > bx)):
+            if py < slopes[start + j] * (px - ax) + ay:
+                intersection_counter += 1
+
+        # smooth distance to the closest point on the edge
+        dx = vectors_x[start + j]
+        dy = vectors_y[start + j]
+        projection = ((px - ax) * dx + (py - ay) * dy) * inv_lengths_squared[start + j]
+        projection = min(max(projection, 0.0), 1.0)
+        ex = px - (ax + projection * dx)
+        ey = py - (ay + projection * dy)
+        distances[j] = np.sqrt(buf_squared + ex * ex + ey * ey)
+        if distances[j] < distance_min:
+            distance_min = distances[j]
+            idx_min = j
+
+    # smooth minimum of the edge distances (LogSumExp around the minimum)
+    sum_exponential = 0.0
+    for j in range(n_edges):
+        if j != idx_min:
+            sum_exponential += np.exp(-s * (distances[j] - distance_min))
+    c = distance_min - np.log(1.0 + sum_exponential) / s
+
+    # negative if inside
+    if intersection_counter % 2 == 1:
+        c = -c
+    return c
+
+
+@numba.njit(cache=True, parallel=True)
+def _distance_multi_point_to_multi_polygon_ray_casting_numba(
+    points_x,
+    points_y,
+    starts_x,
+    starts_y,
+    ends_x,
+    ends_y,
+    vectors_x,
+    vectors_y,
+    inv_lengths_squared,
+    slopes,
+    offsets,
+    regions,
+    s,
+    c,
+):
+    """
+    The numba implementation of `distance_multi_point_to_multi_polygon_ray_casting`,
+    which writes the signed distance of each point to its region into `c`.
+
+    Args:
+        points_x (np.ndarray): points x coordinates.
+        points_y (np.ndarray): points y coordinates.
+        starts_x, ..., offsets (np.ndarray): the polygon edges, from `polygon_edges`.
+        regions (np.ndarray): region (polygon) assignment of each point.
+        s (float): Smoothing factor for the smoothmin function.
+        c (np.ndarray): Output array for the signed distances.
+    """
+    max_edges = np.max(np.diff(offsets))
+    for i in numba.prange(len(points_x)):
+        distances = np.empty(max_edges)  # work space, private to the thread
+        start = offsets[regions[i]]
+        c[i] = _distance_point_to_polygon_edges_numba(
+            points_x[i],
+            points_y[i],
+            start,
+            offsets[regions[i] + 1] - start,
+            starts_x,
+            starts_y,
+            ends_x,
+            vectors_x,
+            vectors_y,
+            inv_lengths_squared,
+            slopes,
+            s,
+            distances,
+        )
+
+
+@numba.njit(cache=True, parallel=True)
+def _get_nearest_polygons_numba(
+    points_x,
+    points_y,
+    starts_x,
+    starts_y,
+    ends_x,
+    ends_y,
+    vectors_x,
+    vectors_y,
+    inv_lengths_squared,
+    slopes,
+    offsets,
+    s,
+    region,
+):
+    """
+    The numba implementation of `get_nearest_polygons`, which writes the region
+    assignment of each point into `region`.
+
+    Each point is assigned to the first region that it is in, or else to the region
+    with the smallest signed distance. The regions are visited in order of the
+    distance from the point to their axis-aligned bounding box, and are skipped
+    without ray casting when that distance shows that they can neither contain the
+    point nor be closer to it than the best region so far.
+
+    Args:
+        points_x (np.ndarray): points x coordinates.
+        points_y (np.ndarray): points y coordinates.
+        starts_x, ..., offsets (np.ndarray): the polygon edges, from `polygon_edges`.
+        s (float): Smoothing factor for the smoothmin function.
+        region (np.ndarray): Output array for the region assignments.
+    """
+    n_regions = len(offsets) - 1
+
+    # bounding box of each region, and the most that the smooth minimum of its edge
+    # distances can undercut the true distance
+    xmin = np.empty(n_regions)
+    xmax = np.empty(n_regions)
+    ymin = np.empty(n_regions)
+    ymax = np.empty(n_regions)
+    smoothing_bound = np.empty(n_regions)
+    for k in range(n_regions):
+        xmin[k] = np.min(starts_x[offsets[k] : offsets[k + 1]])
+        xmax[k] = np.max(starts_x[offsets[k] : offsets[k + 1]])
+        ymin[k] = np.min(starts_y[offsets[k] : offsets[k + 1]])
+        ymax[k] = np.max(starts_y[offsets[k] : offsets[k + 1]])
+        smoothing_bound[k] = np.log(offsets[k + 1] - offsets[k]) / s
+
+    smoothing_bound_max = np.max(smoothing_bound)
+
+    max_edges = np.max(np.diff(offsets))
+    for i in numba.prange(len(points_x)):
+        # work space, private to the thread
+        distances = np.empty(max_edges)
+        distances_bbox = np.empty(n_regions)
+        px = points_x[i]
+        py = points_y[i]
+
+        # visit the regions nearest bounding box first (a stable sort, so that
+        # regions which may contain the point are still visited in order)
+        for k in range(n_regions):
+            distances_bbox[k] = max(
+                0.0, xmin[k] - px, px - xmax[k], ymin[k] - py, py - ymax[k]
+            )
+        order = np.argsort(distances_bbox, kind="mergesort")
+
+        distance_best = np.inf
+        region[i] = -1
+        for k in order:
+            # all the remaining regions are certainly further away than the best
+            if distances_bbox[k] - smoothing_bound_max > distance_best:
+                break
+            # skip the region if it is certainly further away than the best so far
+            if distances_bbox[k] - smoothing_bound[k] > distance_best:
+                continue
+
+            distance = _distance_point_to_polygon_edges_numba(
+                px,
+                py,
+                offsets[k],
+                offsets[k + 1] - offsets[k],
+                starts_x,
+                starts_y,
+                ends_x,
+                vectors_x,
+                vectors_y,
+                inv_lengths_squared,
+                slopes,
+                s,
+                distances,
+            )
+            if distance <= 0:  # negative if in the region, so take it
+                region[i] = k
+                break
+            # otherwise keep the closest region, the first one in case of a tie
+            if (distance < distance_best) or (
+                distance == distance_best and k < region[i]
+            ):
+                distance_best = distance
+                region[i] = k
+
+
+def distance_multi_point_to_polygon_ray_casting(
+    points: jnp.ndarray,
+    vertices: jnp.ndarray,
+    s: float = 700,
+    shift: float = 1e-10,
+) -> jnp.ndarray:
+    """
+    Determines the signed distance from each of a set of points to a single polygon
+    using the ray-casting approach of `distance_point_to_polygon_ray_casting`,
+    vectorized over the points.
+
+    Args:
+        points (jnp.ndarray): Points of interest (Nx2 array).
+        vertices (jnp.ndarray): Vertices of the polygon (Mx2 array) in counterclockwise order.
+        s (float, optional): Smoothing factor for the smoothmin function. Defaults to 700.
+        shift (float, optional): Small shift to handle edge cases. Defaults to 1e-10.
+
+    Returns:
+        jnp.ndarray: Signed distance for each point. Negative if inside, positive if outside.
+    """
+    edge_starts, edge_ends = prepare_polygon(vertices)
+    return jax.vmap(
+        lambda point: distance_point_to_polygon_edges_ray_casting(
+            point, edge_starts, edge_ends, s=s, shift=shift, return_distance=True
+        )
+    )(points)
+
+
+distance_multi_point_to_polygon_ray_casting = jax.jit(
+    distance_multi_point_to_polygon_ray_casting
 )
 
 
@@ -164,62 +520,101 @@ def distance_point_to_polygon_ray_casting(
     Returns:
         float: Signed distance or inside/outside status. Negative if inside, positive if outside.
     """
-    # Ensure inputs are JAX arrays with explicit data types
-    point = jnp.asarray(point, dtype=jnp.float32)
-    vertices = jnp.asarray(vertices, dtype=jnp.float32)
+    edge_starts, edge_ends = prepare_polygon(vertices)
+    return distance_point_to_polygon_edges_ray_casting(
+        point, edge_starts, edge_ends, s=s, shift=shift, return_distance=return_distance
+    )
 
-    # Add the first vertex to the end to close the polygon loop
-    vertices = jnp.vstack([vertices, vertices[0]])
 
-    # Define a function to process a single edge
-    def process_edge(edge_start, edge_end, point):
-        # Check if the x-coordinate of the point is between the x-coordinates of the edge
-        x_condition = ((edge_start[0] <= point[0]) & (point[0] < edge_end[0])) | (
-            (edge_start[0] >= point[0]) & (point[0] > edge_end[0])
-        )
+distance_point_to_polygon_ray_casting = jax.jit(
+    distance_point_to_polygon_ray_casting, static_argnames=["return_distance"]
+)
 
-        # Calculate the y-coordinate of the edge at the x-coordinate of the point
-        y = (edge_end[1] - edge_start[1]) / (edge_end[0] - edge_start[0] + shift) * (
-            point[0] - edge_start[0]
-        ) + edge_start[1]
 
-        # Determine if the point is below the edge
-        is_below = x_condition & (point[1] < y)
+def prepare_polygon(vertices: jnp.ndarray) -> tuple[jnp.ndarray, jnp.ndarray]:
+    """
+    Close the loop of a polygon into its edges, once, for the ray-casting functions.
 
-        # Calculate the distance to the edge
-        distance = distance_point_to_lineseg_nd(point, edge_start, edge_end)
+    Args:
+        vertices (jnp.ndarray): Vertices of the polygon (Nx2 array) in counterclockwise order.
 
-        return is_below, distance
+    Returns:
+        tuple[jnp.ndarray, jnp.ndarray]: Start and end points of the N edges of the
+            polygon (Nx2 arrays), the last edge running back to the first vertex.
+    """
+    # Ensure inputs are JAX arrays with explicit data types
+    edge_starts = jnp.asarray(vertices, dtype=DTYPE)
+    edge_ends = jnp.roll(edge_starts, -1, axis=0)
+    return edge_starts, edge_ends
 
-    # Vectorize the edge processing function
-    process_edge_vec = jax.vmap(process_edge, in_axes=(0, 0, None))
 
-    edge_starts = vertices[:-1]
-    edge_ends = vertices[1:]
-    is_below, distances = process_edge_vec(edge_starts, edge_ends, point)
+def distance_point_to_polygon_edges_ray_casting(
+    point: jnp.ndarray,
+    edge_starts: jnp.ndarray,
+    edge_ends: jnp.ndarray,
+    s: float = 700,
+    shift: float = 1e-10,
+    return_distance: bool = True,
+    edge_mask: jnp.ndarray = None,
+):
+    """
+    Determines the signed distance from a point to a polygon given by its closed loop
+    of edges (see `prepare_polygon`), using the ray-casting approach of
+    `distance_point_to_polygon_ray_casting`.
 
-    # Count the number of intersections
+    Args:
+        point (jnp.ndarray): Point of interest (2D vector).
+        edge_starts (jnp.ndarray): Start points of the edges of the polygon (Nx2 array).
+        edge_ends (jnp.ndarray): End points of the edges of the polygon (Nx2 array).
+        s (float, optional): Smoothing factor for the smoothmin function. Defaults to 700.
+        shift (float, optional): Small shift to handle edge cases. Defaults to 1e-10.
+        return_distance (bool, optional): Whether to return the signed distance or just
+            inside/outside status. Defaults to True. When False, the function is not
+            differentiable.
+        edge_mask (jnp.ndarray, optional): Boolean mask of the edges that belong to the
+            polygon, to skip padding edges which must be zero-length. Defaults to None,
+            for all edges.
+
+    Returns:
+        float: Signed distance or inside/outside status. Negative if inside, positive if outside.
+    """
+    # Ensure inputs are JAX arrays with explicit data types
+    point = jnp.asarray(point, dtype=DTYPE)
+
+    # Check if the x-coordinate of the point is between the x-coordinates of each edge
+    x_condition = ((edge_starts[:, 0] <= point[0]) & (point[0] < edge_ends[:, 0])) | (
+        (edge_starts[:, 0] >= point[0]) & (point[0] > edge_ends[:, 0])
+    )
+
+    # Calculate the y-coordinate of each edge at the x-coordinate of the point
+    y = (edge_ends[:, 1] - edge_starts[:, 1]) / (
+        edge_ends[:, 0] - edge_starts[:, 0] + shift
+    ) * (point[0] - edge_starts[:, 0]) + edge_starts[:, 1]
+
+    # Determine if the point is below each edge
+    is_below = x_condition & (point[1] < y)
+
+    # Count the number of intersections, the point is inside if it is odd
     intersection_counter = jnp.sum(is_below)
+    sign = 1 - 2 * (intersection_counter % 2)
 
     # Compute the signed distance
     if return_distance:
-        c = smooth_min(distances, s=s)
-        c = jax.lax.cond(
-            intersection_counter % 2 == 1,
-            lambda _: -c,
-            lambda _: c,
-            operand=None,
-        )
+        distances = distance_point_to_lineseg_nd_vec(point, edge_starts, edge_ends)
+        if edge_mask is not None:
+            # padding edges are infinitely far away, dropping out of the smooth min
+            distances = jnp.where(edge_mask, distances, jnp.inf)
+        c = sign * smooth_min(distances, s=s)
     else:
-        c = jax.lax.cond(
-            intersection_counter % 2 == 1,
-            lambda _: -1.0,
-            lambda _: 1.0,
-            operand=None,
-        )
+        c = sign * 1.0
     return c
 
 
+distance_point_to_polygon_edges_ray_casting = jax.jit(
+    distance_point_to_polygon_edges_ray_casting, static_argnames=["return_distance"]
+)
+
+
 def polygon_normals_calculator(
     boundary_vertices: np.ndarray, n_polygons: int = 1
 ) -> list[np.ndarray]:
@@ -283,6 +678,9 @@ def single_polygon_normals_calculator(boundary_vertices: np.ndarray) -> jnp.ndar
         np.ndarray: m-by-2 array of unit vectors perpendicular to each edge of the polygon pointing into the polygon.
     """
 
+    # Ensure inputs are JAX arrays with explicit data types
+    boundary_vertices = jnp.asarray(boundary_vertices, dtype=DTYPE)
+
     # Add the first vertex to the end to form a closed loop
     boundary_vertices = jnp.vstack([boundary_vertices, boundary_vertices[0]])
 
@@ -389,136 +787,6 @@ def distance_lineseg_to_lineseg_nd(
         float: Distance between the two line segments
     """
 
-    def a_is_point(inputs0i) -> float:
-        line_a_start = inputs0i[0]
-        line_b_start = inputs0i[2]
-        line_b_end = inputs0i[3]
-        return distance_point_to_lineseg_nd(line_a_start, line_b_start, line_b_end)
-
-    def b_is_point(inputs0i) -> float:
-        line_a_start = inputs0i[0]
-        line_a_end = inputs0i[1]
-        line_b_start = inputs0i[2]
-        return distance_point_to_lineseg_nd(line_b_start, line_a_start, line_a_end)
-
-    def a_is_not_point(inputs0i) -> float:
-        line_b_vector = inputs0i[5]
-        return jax.lax.cond(
-            jnp.all(line_b_vector == 0.0), b_is_point, a_and_b_are_lines, inputs0i
-        )
-
-    def a_and_b_are_lines(inputs0i) -> float:
-
-        def denom_lt_tol(inputs1i) -> float:
-            line_a_start = inputs1i[0]
-            line_a_end = inputs1i[1]
-            line_b_start = inputs1i[2]
-            line_b_end = inputs1i[3]
-            return _distance_lineseg_to_lineseg_coplanar(
-                line_a_start=line_a_start,
-                line_a_end=line_a_end,
-                line_b_start=line_b_start,
-                line_b_end=line_b_end,
-            )
-
-        def denom_gt_tol(inputs1i) -> float:
-            line_a_start = inputs1i[0]
-            line_a_end = inputs1i[1]
-            line_b_start = inputs1i[2]
-            line_b_end = inputs1i[3]
-            line_a_vector = inputs1i[4]
-            line_b_vector = inputs1i[5]
-            denominator = inputs1i[6]
-
-            a = line_a_start
-            v = line_a_vector
-            x = line_b_start
-            u = line_b_vector
-
-            s_numerator = jnp.linalg.det(jnp.array([a - x, u, jnp.cross(u, v)]).T)
-            t_numerator = jnp.linalg.det(jnp.array([a - x, v, jnp.cross(u, v)]).T)
-
-            s = s_numerator / denominator
-            t = t_numerator / denominator
-
-            # Get closest point along the lines
-            # if s or t > 1, use end point of line
-            def st_gt_1(inputs23i) -> np.ndarray:
-                line_end = inputs23i[1]
-                return jnp.array(line_end, dtype=float)
-
-            # if s or t < 0, use start point of line
-            def st_lt_0(inputs23i) -> np.ndarray:
-                line_start = inputs23i[0]
-                return jnp.array(line_start, dtype=float)
-
-            # otherwise compute the closest point on line using the parametric form of the line segment
-            def st_gt_0_lt_1(inputs23i) -> np.ndarray:
-                line_start = inputs23i[0]
-                line_vector = inputs23i[2]
-                st = inputs23i[3]
-                return jnp.array(line_start + st * line_vector, dtype=float)
-
-            def st_lt_1(inputs23i) -> np.ndarray:
-                st = inputs23i[3]
-                return jax.lax.cond(st < 0, st_lt_0, st_gt_0_lt_1, inputs23i)
-
-            # get closest point on lines a and b to each other
-            inputs2o = [line_a_start, line_a_end, line_a_vector, s]
-            closest_point_line_a = jax.lax.cond(s > 1, st_gt_1, st_lt_1, inputs2o)
-            inputs3o = [line_b_start, line_b_end, line_b_vector, t]
-            closest_point_line_b = jax.lax.cond(t > 1, st_gt_1, st_lt_1, inputs3o)
-
-            # the distance between the line segments is the distance between the closest points (in many cases)
-            parametric_distance = smooth_norm(
-                closest_point_line_b - closest_point_line_a
-            )
-
-            # parametric approach can miss cases, so compare with point to line distances
-            distance_point_a_line_b = distance_point_to_lineseg_nd(
-                closest_point_line_a, line_b_start, line_b_end
-            )
-            distance_point_b_line_a = distance_point_to_lineseg_nd(
-                closest_point_line_b, line_a_start, line_a_end
-            )
-            distance = smooth_min(
-                jnp.array(
-                    [
-                        parametric_distance,
-                        distance_point_a_line_b,
-                        distance_point_b_line_a,
-                    ]
-                )
-            )
-
-            return distance
-
-        line_a_start = inputs0i[0]
-        line_a_end = inputs0i[1]
-        line_b_start = inputs0i[2]
-        line_b_end = inputs0i[3]
-        line_a_vector = inputs0i[4]
-        line_b_vector = inputs0i[5]
-
-        # find s and t (point along segment where the segments are closest to each other) using eq. 21.4.17 in [1]
-        denominator = smooth_norm(jnp.cross(line_b_vector, line_a_vector)) ** 2
-
-        inputs1o = [
-            line_a_start,
-            line_a_end,
-            line_b_start,
-            line_b_end,
-            line_a_vector,
-            line_b_vector,
-            denominator,
-        ]
-
-        distance = jax.lax.cond(
-            denominator <= tol, denom_lt_tol, denom_gt_tol, inputs1o
-        )
-
-        return distance
-
     # if 2d given, then pad with zeros to get 3d points
     pad_width = len(line_a_start)
     line_a_start = jnp.pad(line_a_start, (0, 3 - pad_width))
@@ -529,17 +797,73 @@ def distance_lineseg_to_lineseg_nd(
     line_a_vector = line_a_end - line_a_start
     line_b_vector = line_b_end - line_b_start
 
-    inputs0o = [
-        line_a_start,
-        line_a_end,
-        line_b_start,
-        line_b_end,
-        line_a_vector,
-        line_b_vector,
-    ]
+    # every case below is computed and the applicable one is selected with jnp.where,
+    # so that the function stays a single straight-line graph when vmapped
+
+    # find s and t (point along segment where the segments are closest to each other) using eq. 21.4.17 in [1],
+    # guarding the denominator for the coplanar case where the result is not used
+    denominator = smooth_norm(jnp.cross(line_b_vector, line_a_vector)) ** 2
+    is_coplanar = denominator <= tol
+    safe_denominator = jnp.where(is_coplanar, 1.0, denominator)
 
-    distance = jax.lax.cond(
-        jnp.all(line_a_vector == 0.0), a_is_point, a_is_not_point, inputs0o
+    a = line_a_start
+    v = line_a_vector
+    x = line_b_start
+    u = line_b_vector
+
+    s_numerator = jnp.linalg.det(jnp.array([a - x, u, jnp.cross(u, v)]).T)
+    t_numerator = jnp.linalg.det(jnp.array([a - x, v, jnp.cross(u, v)]).T)
+
+    s = s_numerator / safe_denominator
+    t = t_numerator / safe_denominator
+
+    # get closest point on lines a and b to each other: the start point if s or t < 0,
+    # the end point if s or t > 1, and the parametric form of the line segment otherwise
+    s = jnp.where(s < 0, 0.0, jnp.where(s > 1, 1.0, s))
+    t = jnp.where(t < 0, 0.0, jnp.where(t > 1, 1.0, t))
+    closest_point_line_a = line_a_start + s * line_a_vector
+    closest_point_line_b = line_b_start + t * line_b_vector
+
+    # the distance between the line segments is the distance between the closest points (in many cases)
+    parametric_distance = smooth_norm(closest_point_line_b - closest_point_line_a)
+
+    # parametric approach can miss cases, so compare with point to line distances
+    distance_point_a_line_b = distance_point_to_lineseg_nd(
+        closest_point_line_a, line_b_start, line_b_end
+    )
+    distance_point_b_line_a = distance_point_to_lineseg_nd(
+        closest_point_line_b, line_a_start, line_a_end
+    )
+    distance_lines = smooth_min(
+        jnp.array(
+            [
+                parametric_distance,
+                distance_point_a_line_b,
+                distance_point_b_line_a,
+            ]
+        )
+    )
+
+    # coplanar segments use the distances between the end points and the other segment
+    distance_coplanar = _distance_lineseg_to_lineseg_coplanar(
+        line_a_start=line_a_start,
+        line_a_end=line_a_end,
+        line_b_start=line_b_start,
+        line_b_end=line_b_end,
+    )
+    distance_lines = jnp.where(is_coplanar, distance_coplanar, distance_lines)
+
+    # if either segment is a point, use the distance from that point to the other segment
+    distance_a_point = distance_point_to_lineseg_nd(
+        line_a_start, line_b_start, line_b_end
+    )
+    distance_b_point = distance_point_to_lineseg_nd(
+        line_b_start, line_a_start, line_a_end
+    )
+    distance = jnp.where(
+        jnp.all(line_a_vector == 0.0),
+        distance_a_point,
+        jnp.where(jnp.all(line_b_vector == 0.0), distance_b_point, distance_lines),
     )
 
     return distance
@@ -566,40 +890,59 @@ def distance_point_to_lineseg_nd(
         distance (float): shortest distance between the point and finite line segment
     """
 
-    def if_point_to_point(inputs) -> float:
-        point = inputs[0]
-        segment_start = inputs[1]
-        return jnp.float64(smooth_norm(segment_start - point))
+    # get the vector of the line segment
+    segment_vector = segment_end - segment_start
 
-    def if_point_to_line_seg(inputs) -> float:
-        point = inputs[0]
-        segment_start = inputs[1]
-        segment_end = inputs[2]
-        segment_vector = inputs[3]
+    # get the closest point on the line segment to the point of interest, which is
+    # the start point if the segment is a point
+    closest_point = get_closest_point_on_line_seg(
+        point, segment_start, segment_end, segment_vector
+    )
 
-        # get the closest point on the line segment to the point of interest
-        closest_point = get_closest_point_on_line_seg(
-            point, segment_start, segment_end, segment_vector
-        )
+    # the distance from the point to the line is the distance from the point to the closest point on the line
+    return smooth_norm(point - closest_point)
 
-        # the distance from the point to the line is the distance from the point to the closest point on the line
-        return jnp.float64(smooth_norm(point - closest_point))
 
-    # get the vector of the line segment
-    segment_vector = segment_end - segment_start
+distance_point_to_lineseg_nd = jax.jit(distance_point_to_lineseg_nd)
+
+
+def distance_point_to_lineseg_nd_vec(
+    point: np.ndarray, segment_starts: np.ndarray, segment_ends: np.ndarray
+) -> np.ndarray:
+    """Find the distance from a point to each of a set of line segments in
+    N-Dimensions. Equivalent to `distance_point_to_lineseg_nd` applied to each
+    segment, but computed with broadcast array operations over all segments at once.
 
-    # if the segment is a point, then get the distance to that point
-    distance = jax.lax.cond(
-        jnp.all(segment_vector == 0),
-        if_point_to_point,
-        if_point_to_line_seg,
-        [point, segment_start, segment_end, segment_vector],
+    Args:
+        point (np.ndarray): point of interest [x,y,...]
+        segment_starts (np.ndarray): start points of the line segments, one per row
+        segment_ends (np.ndarray): end points of the line segments, one per row
+
+    Returns:
+        distances (np.ndarray): shortest distance between the point and each finite line segment
+    """
+
+    # get the vectors of the line segments and from their starts to the point
+    segment_vectors = segment_ends - segment_starts
+    start_to_point_vectors = point - segment_starts
+
+    # project the point onto each segment, guarding segments that are points
+    segment_lengths_squared = jnp.sum(segment_vectors**2, axis=1)
+    projection = jnp.sum(start_to_point_vectors * segment_vectors, axis=1) / jnp.where(
+        segment_lengths_squared == 0, 1.0, segment_lengths_squared
     )
 
-    return distance
+    # keep the closest point on the segment: its start, its end, or between them
+    projection = jnp.where(
+        projection < 0, 0.0, jnp.where(projection > 1, 1.0, projection)
+    )
+    closest_points = segment_starts + projection[:, None] * segment_vectors
 
+    # the distance from the point to a segment is the distance to its closest point
+    return smooth_norm_vec(point - closest_points)
 
-distance_point_to_lineseg_nd = jax.jit(distance_point_to_lineseg_nd)
+
+distance_point_to_lineseg_nd_vec = jax.jit(distance_point_to_lineseg_nd_vec)
 
 
 def get_closest_point_on_line_seg(
@@ -624,36 +967,20 @@ def get_closest_point_on_line_seg(
     # calculate the distance to the starting point
     start_to_point_vector = point - segment_start
 
-    # calculate the unit vector projection of the start to point vector on the line segment
+    # calculate the unit vector projection of the start to point vector on the line
+    # segment, guarding against segments that are points (which project onto the start)
+    segment_length_squared = jnp.dot(segment_vector, segment_vector)
     projection = jnp.divide(
         jnp.dot(start_to_point_vector, segment_vector),
-        jnp.dot(segment_vector, segment_vector),
+        jnp.where(segment_length_squared == 0, 1.0, segment_length_squared),
     )
 
-    def lt_0(inputs) -> np.ndarray:
-        segment_start = inputs[1]
-        return jnp.array(segment_start, dtype=jnp.float64)
-
-    def gt_1(inputs) -> np.ndarray:
-        segment_end = inputs[2]
-        return jnp.array(segment_end, dtype=jnp.float64)
-
-    def gt_0(inputs) -> np.ndarray:
-        projection = inputs[0]
-        return jax.lax.cond(projection > 1, gt_1, lt_1_gt_0, inputs)
-
-    def lt_1_gt_0(inputs) -> np.ndarray:
-        projection = inputs[0]
-        segment_start = inputs[1]
-        segment_vector = inputs[3]
-        return jnp.array(segment_start + projection * segment_vector, dtype=jnp.float64)
-
-    return jax.lax.cond(
-        projection < 0,
-        lt_0,
-        gt_0,
-        [projection, segment_start, segment_end, segment_vector],
+    # clamp to the segment: the start point if < 0, the end point if > 1
+    projection = jnp.where(
+        projection < 0, 0.0, jnp.where(projection > 1, 1.0, projection)
     )
 
+    return segment_start + projection * segment_vector
+
 
 get_closest_point_on_line_seg = jax.jit(get_closest_point_on_line_seg)
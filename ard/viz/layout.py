@@ -32,17 +32,24 @@ def get_limits(
         the two-valued limits for the y-axis based on the windIO
     """
 
+    # convert the boundary coordinates to arrays once
+    x_boundary = np.asarray(
+        windIOdict["site"]["boundaries"]["polygons"][0]["x"], dtype=np.float64
+    )
+    y_boundary = np.asarray(
+        windIOdict["site"]["boundaries"]["polygons"][0]["y"], dtype=np.float64
+    )
+
+    x_min, x_max = x_boundary.min(), x_boundary.max()
+    y_min, y_max = y_boundary.min(), y_boundary.max()
+
     x_lim = [
-        np.min(windIOdict["site"]["boundaries"]["polygons"][0]["x"])
-        - lim_buffer * np.ptp(windIOdict["site"]["boundaries"]["polygons"][0]["x"]),
-        np.max(windIOdict["site"]["boundaries"]["polygons"][0]["x"])
-        + lim_buffer * np.ptp(windIOdict["site"]["boundaries"]["polygons"][0]["x"]),
+        x_min - lim_buffer * (x_max - x_min),
+        x_max + lim_buffer * (x_max - x_min),
     ]
     y_lim = [
-        np.min(windIOdict["site"]["boundaries"]["polygons"][0]["y"])
-        - lim_buffer * np.ptp(windIOdict["site"]["boundaries"]["polygons"][0]["y"]),
-        np.max(windIOdict["site"]["boundaries"]["polygons"][0]["y"])
-        + lim_buffer * np.ptp(windIOdict["site"]["boundaries"]["polygons"][0]["y"]),
+        y_min - lim_buffer * (y_max - y_min),
+        y_max + lim_buffer * (y_max - y_min),
     ]
     return x_lim, y_lim
 
@@ -128,26 +135,23 @@ def plot_layout(
         x_anchors = ard_prob.get_val("x_anchors", units="m")
         y_anchors = ard_prob.get_val("y_anchors", units="m")
 
-        # loop over the anchors and plot from their originating turbine to each
-        for idx_turbine in range(
-            input_dict["modeling_options"]["layout"]["N_turbines"]
-        ):
-            for idx_anchor in range(
-                input_dict["modeling_options"]["platform"]["N_anchors"]
-            ):
-                ax.plot(
-                    [x_turbines[idx_turbine], x_anchors[idx_turbine, idx_anchor]],
-                    [y_turbines[idx_turbine], y_anchors[idx_turbine, idx_anchor]],
-                    "-r",
-                    alpha=0.25,
-                )
-            # plot the anchors as red circles
-            ax.plot(
-                x_anchors[idx_turbine, :],
-                y_anchors[idx_turbine, :],
-                "or",
-                alpha=0.25,
-            )
+        # plot a line from each anchor to its originating turbine, all in one call
+        # with one column per line
+        x_turbines_anchors = np.broadcast_to(x_turbines[:, None], x_anchors.shape)
+        y_turbines_anchors = np.broadcast_to(y_turbines[:, None], y_anchors.shape)
+        ax.plot(
+            np.stack([x_turbines_anchors.ravel(), x_anchors.ravel()]),
+            np.stack([y_turbines_anchors.ravel(), y_anchors.ravel()]),
+            "-r",
+            alpha=0.25,
+        )
+        # plot the anchors as red circles
+        ax.plot(
+            x_anchors.ravel(),
+            y_anchors.ravel(),
+            "or",
+            alpha=0.25,
+        )
 
     ax.axis("equal")
 
@@ -1,9 +1,11 @@
 from __future__ import annotations  # for type hinting annotation fix...
 
+from typing import TYPE_CHECKING
+
 import numpy as np
 
-from floris.wind_data import WindDataBase
-from floris.wind_data import TimeSeries
+if TYPE_CHECKING:  # FLORIS is heavy to import, so only import it when needed
+    from floris.wind_data import WindDataBase
 
 
 class WindQuery:
@@ -130,6 +132,8 @@ class WindQuery:
         Re-set the turbulence intensities using the FLORIS IEC method interface.
         """
 
+        from floris.wind_data import TimeSeries  # deferred, heavy to import
+
         assert self.directions.size != 0, "directions must be set"
         assert self.speeds.size != 0, "speeds must be set"
         # use a temporary FLORIS time series to get the IEC TIs
@@ -250,6 +250,188 @@ class TestOptiWindNetCollection12Turbines:
         cpJ = prob.check_partials(out_stream=None)
         assert_check_partials(cpJ, atol=1.0e-5, rtol=1.0e-3)
 
+    def test_accept_heuristic(self):
+
+        # accept any heuristic solution within 50% of the lower bound
+        modeling_options = copy.deepcopy(self.modeling_options)
+        modeling_options["collection"]["accept_heuristic_if_within_pct"] = 50.0
+
+        # create the OpenMDAO model
+        model = om.Group()
+        collection_heuristic = model.add_subsystem(
+            "collection",
+            ard_own.OptiwindnetCollection(
+                modeling_options=modeling_options,
+            ),
+        )
+        prob = om.Problem(model)
+        prob.setup()
+
+        # run optiwindnet with and without the MILP
+        prob.run_model()
+        self.prob.run_model()
+
+        total_length_heuristic = prob.get_val("collection.total_length_cables")
+        total_length_milp = self.prob.get_val("collection.total_length_cables")
+        ((_, A, _, _),) = collection_heuristic._problem_cache.values()
+        lower_bound = ard_own._own_length_lower_bound(A)
+        assert lower_bound <= total_length_milp + 1.0e-6
+        assert total_length_milp <= total_length_heuristic + 1.0e-6
+        assert total_length_heuristic <= 1.5 * lower_bound
+
+        cpJ = prob.check_partials(out_stream=None)
+        assert_check_partials(cpJ, atol=1.0e-5, rtol=1.0e-3)
+
+    def test_accept_heuristic_threshold(self, monkeypatch):
+        """
+        the MILP should be skipped if the heuristic is within the accepted gap of
+        the lower bound, and run otherwise
+        """
+
+        def run_collection(accept_pct):
+            modeling_options = copy.deepcopy(self.modeling_options)
+            modeling_options["collection"][
+                "accept_heuristic_if_within_pct"
+            ] = accept_pct
+            model = om.Group()
+            collection = model.add_subsystem(
+                "collection",
+                ard_own.OptiwindnetCollection(
+                    modeling_options=modeling_options,
+                ),
+            )
+            prob = om.Problem(model)
+            prob.setup()
+
+            # count the MILP solves
+            milp_calls = []
+            solve_milp = collection._solve_milp
+
+            def counting_solve_milp(*args, **kwargs):
+                milp_calls.append(args)
+                return solve_milp(*args, **kwargs)
+
+            monkeypatch.setattr(collection, "_solve_milp", counting_solve_milp)
+            prob.run_model()
+            return collection, prob, len(milp_calls)
+
+        # accepting any heuristic gives the heuristic length and its gap
+        collection, prob, milp_calls = run_collection(1.0e6)
+        assert milp_calls == 0
+        ((_, A, _, _),) = collection._problem_cache.values()
+        total_length_heuristic = prob.get_val("collection.total_length_cables")[0]
+        gap_pct = 100.0 * (
+            total_length_heuristic / ard_own._own_length_lower_bound(A) - 1.0
+        )
+
+        # just inside the gap, the heuristic is accepted
+        _, prob, milp_calls = run_collection(gap_pct + 1.0e-6)
+        assert milp_calls == 0
+        assert np.isclose(
+            prob.get_val("collection.total_length_cables"), total_length_heuristic
+        )
+
+        # just outside the gap, the MILP is run
+        _, prob, milp_calls = run_collection(gap_pct - 1.0e-6)
+        assert milp_calls == 1
+        assert prob.get_val("collection.total_length_cables") <= (
+            total_length_heuristic + 1.0e-6
+        )
+
+    def test_warmstart_fallback(self, monkeypatch):
+        """
+        if the previous solution cannot warm start the MILP for a moved layout,
+        the solve should fall back to the heuristic solution
+        """
+
+        self.prob.run_model()
+        S_previous = self.collection.S_previous
+        assert S_previous is not None
+
+        # reject the previous solution as a warm start
+        solver = self.collection._solvers[
+            self.modeling_options["collection"]["solver_name"]
+        ]
+        warmstarts = []
+        set_problem = solver.set_problem
+
+        def rejecting_set_problem(*args, warmstart=None, **kwargs):
+            warmstarts.append(warmstart)
+            if warmstart is S_previous:
+                raise ard_own.OWNWarmupFailed("infeasible warm start")
+            return set_problem(*args, warmstart=warmstart, **kwargs)
+
+        monkeypatch.setattr(solver, "set_problem", rejecting_set_problem)
+
+        # move a turbine, so that the cached solution does not apply
+        x_turbines = self.prob.get_val("collection.x_turbines").copy()
+        x_turbines[0] += 10.0
+        self.prob.set_val("collection.x_turbines", x_turbines)
+        self.prob.run_model()
+
+        # the previous solution is tried first, then the heuristic one
+        assert len(warmstarts) == 2
+        assert warmstarts[0] is S_previous
+        assert warmstarts[1] is not None
+        assert warmstarts[1] is not S_previous
+        assert self.collection.S_previous is not S_previous
+        assert np.isclose(
+            self.prob.get_val("collection.total_length_cables"),
+            np.sum(self.prob.get_val("collection.length_cables")),
+        )
+
+    def test_concurrent_solvers(self):
+        """
+        racing another MILP backend should return a valid topology that matches
+        the single-solver result
+        """
+
+        pytest.importorskip("ortools")
+
+        modeling_options = copy.deepcopy(self.modeling_options)
+        modeling_options["collection"]["concurrent_solvers"] = ["ortools"]
+        max_turbines_per_string = modeling_options["collection"][
+            "max_turbines_per_string"
+        ]
+        mip_gap = modeling_options["collection"]["solver_options"]["mip_gap"]
+
+        # create the OpenMDAO model
+        model = om.Group()
+        model.add_subsystem(
+            "collection",
+            ard_own.OptiwindnetCollection(
+                modeling_options=modeling_options,
+            ),
+        )
+        prob = om.Problem(model)
+        prob.setup()
+
+        x_turbines = prob.get_val("collection.x_turbines").copy()
+        for dx in [0.0, 10.0]:
+            # the second race first waits for the losers of the first one
+            prob.set_val("collection.x_turbines", x_turbines + dx)
+            self.prob.set_val("collection.x_turbines", x_turbines + dx)
+            prob.run_model()
+            self.prob.run_model()
+
+            # every turbine should be connected to a substation within capacity
+            terse_links = prob.get_val("collection.terse_links")
+            for turbine in range(len(terse_links)):
+                node = turbine
+                for _ in range(len(terse_links)):
+                    if node < 0:
+                        break
+                    node = terse_links[node]
+                assert node < 0
+            assert prob.get_val("collection.max_load_cables") <= max_turbines_per_string
+
+            # and the cable length should match the single-solver one
+            assert np.isclose(
+                prob.get_val("collection.total_length_cables"),
+                self.prob.get_val("collection.total_length_cables"),
+                rtol=2 * mip_gap,
+            )
+
 
 class TestOptiWindNetCollection5Turbines:
 
@@ -395,3 +577,69 @@ class TestOptiWindNetCollection5Turbines:
         # automated OpenMDAO fails because it re-runs the network work
         cpJ = prob.check_partials(out_stream=None)
         assert_check_partials(cpJ, atol=1.0e-5, rtol=1.0e-3)
+
+    def test_topology_cache(self):
+        """
+        re-running the same layout should reuse the cached solution, and the cache
+        should not grow beyond its bound as the layout moves
+        """
+
+        self.prob.run_model()
+        total_length_cables = self.prob.get_val("collection.total_length_cables")
+        assert len(self.collection._problem_cache) == 1
+
+        self.prob.run_model()
+        assert len(self.collection._problem_cache) == 1
+        assert np.isclose(
+            self.prob.get_val("collection.total_length_cables"), total_length_cables
+        )
+
+        x_turbines = self.prob.get_val("collection.x_turbines").copy()
+        for i in range(2 * ard_own._PROBLEM_CACHE_SIZE):
+            self.prob.set_val("collection.x_turbines", x_turbines + 1.0 + i)
+            self.prob.run_model()
+        assert len(self.collection._problem_cache) == ard_own._PROBLEM_CACHE_SIZE
+
+    def test_problem_cache_alternating_layouts(self, monkeypatch):
+        """
+        alternating between two layouts should reuse the mesh of each, also with
+        the solutions not cached
+        """
+
+        modeling_options = copy.deepcopy(self.modeling_options)
+        modeling_options["collection"]["cache_solutions"] = False
+
+        # create the OpenMDAO model
+        model = om.Group()
+        model.add_subsystem(
+            "collection",
+            ard_own.OptiwindnetCollection(
+                modeling_options=modeling_options,
+            ),
+        )
+        prob = om.Problem(model)
+        prob.setup()
+
+        # count the planar embeddings that are built
+        ard_own._import_optiwindnet()
+        calls = []
+        make_planar_embedding = ard_own.make_planar_embedding
+
+        def counting_make_planar_embedding(L):
+            calls.append(L)
+            return make_planar_embedding(L)
+
+        monkeypatch.setattr(
+            ard_own, "make_planar_embedding", counting_make_planar_embedding
+        )
+
+        x_turbines = prob.get_val("collection.x_turbines").copy()
+        total_length_cables = {}
+        for dx in [0.0, 50.0, 0.0, 50.0]:
+            prob.set_val("collection.x_turbines", x_turbines + dx)
+            prob.run_model()
+            length = float(prob.get_val("collection.total_length_cables")[0])
+            assert np.isclose(total_length_cables.setdefault(dx, length), length)
+
+        # one mesh per distinct layout
+        assert len(calls) == 2
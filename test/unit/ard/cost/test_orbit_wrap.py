@@ -1,3 +1,4 @@
+import copy
 from pathlib import Path
 import pytest
 
@@ -591,3 +592,80 @@ class TestORBITApproxBranch:
             assert np.isclose(bos_capex, bos_capex_ref, rtol=1e-3)
         with subtests.test(f"orbit_skew_total"):
             assert np.isclose(total_capex, total_capex_ref, rtol=1e-3)
+
+    def test_result_cache(self, subtests, monkeypatch):
+
+        # count the ORBIT project runs
+        project_managers = []
+        ProjectManager = ocost.orbit_wisdem.ProjectManager
+
+        def counting_project_manager(config):
+            project_managers.append(config)
+            return ProjectManager(config)
+
+        monkeypatch.setattr(
+            ocost.orbit_wisdem, "ProjectManager", counting_project_manager
+        )
+
+        self.prob.set_val(
+            "x_turbines", self.modeling_options["layout"]["x_turbines"], units="m"
+        )
+        self.prob.set_val(
+            "y_turbines", self.modeling_options["layout"]["y_turbines"], units="m"
+        )
+
+        self.prob.run_model()
+        bos_capex_first = float(self.prob.get_val("orbit.bos_capex", units="MUSD"))
+
+        # an unchanged configuration should reuse the previous ORBIT run
+        self.prob.run_model()
+        bos_capex_second = float(self.prob.get_val("orbit.bos_capex", units="MUSD"))
+
+        with subtests.test("orbit_cache_hit"):
+            assert len(project_managers) == 1
+        with subtests.test("orbit_cache_value"):
+            assert bos_capex_second == bos_capex_first
+
+        # moving a turbine changes the layout, so ORBIT has to run again
+        x_turbines = np.array(self.modeling_options["layout"]["x_turbines"])
+        x_turbines[0] += 10.0
+        self.prob.set_val("x_turbines", x_turbines, units="m")
+        self.prob.run_model()
+
+        with subtests.test("orbit_cache_miss"):
+            assert len(project_managers) == 2
+
+    def test_run_batch(self):
+
+        self.prob.set_val(
+            "x_turbines", self.modeling_options["layout"]["x_turbines"], units="m"
+        )
+        self.prob.set_val(
+            "y_turbines", self.modeling_options["layout"]["y_turbines"], units="m"
+        )
+        self.prob.run_model()
+        bos_capex = float(self.prob.get_val("orbit.bos_capex", units="USD"))
+
+        # make the config self-contained with the layout as a dataframe
+        orbit = self.prob.model.orbit.orbit.orbit
+        config = copy.deepcopy(orbit._orbit_config)
+        config["array_system_design"]["location_data"] = (
+            ocost.generate_orbit_location_from_graph(
+                self.prob.get_val("collection.graph"),
+                self.prob.get_val("x_turbines", units="km"),
+                self.prob.get_val("y_turbines", units="km"),
+                self.prob.get_val("x_substations", units="km"),
+                self.prob.get_val("y_substations", units="km"),
+                allow_branching_approximation=True,
+            )
+        )
+
+        results = ocost.ORBITWisdemDetail.run_batch(
+            [config, config],
+            path_library=orbit._path_library,
+            max_workers=2,
+        )
+
+        assert len(results) == 2
+        for result in results:
+            assert np.isclose(result["bos_capex"], bos_capex)
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import openmdao.api as om
 
@@ -59,3 +60,51 @@ class TestSpacingApproximations:
             ("primary_turbine_spacing_diameters", "total_length_cables")
         ]["J_fwd"]
         assert total_length_cables_partials == pytest.approx(0.01, abs=1e-12)
+
+
+class TestSpacingApproximationsBatch:
+
+    def setup_method(self):
+        # Create the problem
+        prob = om.Problem()
+
+        # set modeling options
+        modeling_options = {
+            "windIO_plant": {"wind_farm": {"turbine": {"rotor_diameter": 10.0}}},
+            "layout": {
+                "N_turbines": 10,
+            },
+        }
+
+        # Add the SpacingApproximations component with a batch of three
+        prob.model.add_subsystem(
+            "spacing_calc",
+            SpacingApproximations(modeling_options=modeling_options, n_batch=3),
+            promotes=["*"],
+        )
+
+        # Set up the problem
+        prob.setup()
+
+        # Set the input values
+        prob.set_val("total_length_cables", [500.0, 1000.0, 2000.0])
+
+        # Run the model
+        prob.run_model()
+
+        self.prob = prob
+
+    def test_turbine_spacing_calculation(self):
+        """Test the batched turbine spacing calculation."""
+
+        turbine_spacing = self.prob.get_val("primary_turbine_spacing_diameters")
+        assert np.allclose(turbine_spacing, [5.0, 10.0, 20.0], atol=1e-12)
+
+    def test_partial_derivatives(self):
+        """Test the batched partial derivatives are diagonal."""
+
+        partials = self.prob.check_partials(out_stream=None)
+        total_length_cables_partials = partials["spacing_calc"][
+            ("primary_turbine_spacing_diameters", "total_length_cables")
+        ]["J_fwd"]
+        assert np.allclose(total_length_cables_partials, 0.01 * np.eye(3), atol=1e-12)
@@ -2,6 +2,7 @@ from pathlib import Path
 
 import numpy as np
 import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_partials
 
 import ard
 import ard.utils.io
@@ -104,6 +105,36 @@ class TestLandBOSSE:
             # rewrite=True,  # uncomment to write new pyrite file
         )
 
+    def test_compute_cache(self, monkeypatch):
+
+        # count the underlying LandBOSSE computations
+        calls = []
+        compute_orig = wcost.LandBOSSE_API.compute
+
+        def counting_compute(comp, *args, **kwargs):
+            calls.append(comp)
+            return compute_orig(comp, *args, **kwargs)
+
+        monkeypatch.setattr(wcost.LandBOSSE_API, "compute", counting_compute)
+
+        self.prob.set_val("gridfarm.spacing_primary", 7.0)
+        self.prob.set_val("gridfarm.spacing_secondary", 7.0)
+
+        self.prob.run_model()
+        bos_capex_kW = self.prob.get_val("landbosse.bos_capex_kW", units="USD/kW")
+
+        # repeating the inputs should reuse the previous LandBOSSE run
+        self.prob.run_model()
+        assert len(calls) == 1
+        assert np.all(
+            self.prob.get_val("landbosse.bos_capex_kW", units="USD/kW") == bos_capex_kW
+        )
+
+        # changing the spacing should run LandBOSSE again
+        self.prob.set_val("gridfarm.spacing_primary", 8.0)
+        self.prob.run_model()
+        assert len(calls) == 2
+
 
 class TestORBIT:
 
@@ -239,10 +270,43 @@ class TestPlantFinance:
 class TestTurbineCapitalCosts:
 
     def setup_method(self):
-        pass
+        self.prob = om.Problem()
+        self.prob.model.add_subsystem(
+            "tcc", wcost.TurbineCapitalCosts(), promotes=["*"]
+        )
+        self.prob.setup(force_alloc_complex=True)
+
+        self.prob.set_val("machine_rating", 5000.0, units="kW")
+        self.prob.set_val("tcc_per_kW", 1300.0, units="USD/kW")
+        self.prob.set_val("offset_tcc_per_kW", 50.0, units="USD/kW")
+        self.prob.set_val("turbine_number", 25)
+        self.prob.run_model()
+
+    def test_tcc(self):
+        assert np.isclose(
+            self.prob.get_val("tcc", units="USD"), 25 * (1300.0 + 50.0) * 5000.0
+        )
+
+    def test_partials(self):
+        partials = self.prob.check_partials(out_stream=None, method="cs")
+        assert_check_partials(partials)
 
 
 class TestOperatingExpenses:
 
     def setup_method(self):
-        pass
+        self.prob = om.Problem()
+        self.prob.model.add_subsystem("opex", wcost.OperatingExpenses(), promotes=["*"])
+        self.prob.setup(force_alloc_complex=True)
+
+        self.prob.set_val("machine_rating", 5000.0, units="kW")
+        self.prob.set_val("opex_per_kW", 40.0, units="USD/kW/yr")
+        self.prob.set_val("turbine_number", 25)
+        self.prob.run_model()
+
+    def test_opex(self):
+        assert np.isclose(self.prob.get_val("opex", units="USD/yr"), 25 * 40.0 * 5000.0)
+
+    def test_partials(self):
+        partials = self.prob.check_partials(out_stream=None, method="cs")
+        assert_check_partials(partials)
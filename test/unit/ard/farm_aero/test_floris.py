@@ -1,4 +1,5 @@
 from pathlib import Path
+import copy
 
 import yaml
 
@@ -263,6 +264,31 @@ class TestFLORISAEP:
         ]:
             assert var_to_check in output_list
 
+    def test_operation_model(self):
+
+        # a peak shaving fraction is given, so peak shaving is bound at setup
+        assert self.FLORIS.fmodel.get_operation_model() == "peak-shaving"
+
+    def test_dump_yaml_at_cleanup(self, tmp_path):
+
+        self.FLORIS.dir_floris = tmp_path
+        path_yaml = Path(tmp_path, "batch.yaml")
+
+        x_turbines = 7.0 * 130.0 * np.arange(-2, 2.1, 1)
+        y_turbines = 7.0 * 130.0 * np.arange(-2, 2.1, 1)
+        X, Y = [v.flatten() for v in np.meshgrid(x_turbines, y_turbines)]
+        self.prob.set_val("aepFLORIS.x_turbines", X)
+        self.prob.set_val("aepFLORIS.y_turbines", Y)
+        self.prob.set_val("aepFLORIS.yaw_turbines", np.zeros_like(X))
+
+        # by default, the FLORIS inputs are not dumped during the run...
+        self.prob.run_model()
+        assert not path_yaml.exists()
+
+        # ... but once at cleanup
+        self.prob.cleanup()
+        assert path_yaml.exists()
+
     def test_compute_pyrite(self, subtests):
 
         x_turbines = 7.0 * 130.0 * np.arange(-2, 2.1, 1)
@@ -296,3 +322,179 @@ class TestFLORISAEP:
         for key in test_data:
             with subtests.test(key):
                 assert np.allclose(test_data[key], pyrite_data[key], rtol=5e-3)
+
+
+class TestFLORISBatchPowerSmallFarm:
+
+    def setup_method(self):
+
+        # create a small wind query so that FD checks stay cheap
+        directions = np.array([250.0, 270.0, 290.0])
+        speeds = np.array([8.0, 11.0])
+        WS, WD = np.meshgrid(speeds, directions)
+        wind_query = wq.WindQuery(WD.flatten(), WS.flatten())
+        wind_query.set_TI_using_IEC_method()
+
+        # set up the modeling options
+        path_turbine = (
+            Path(ard.__file__).parents[1]
+            / "examples"
+            / "data"
+            / "windIO-plant_turbine_IEA-3.4MW-130m-RWT.yaml"
+        )
+        with open(path_turbine) as f_yaml:
+            data_turbine_yaml = yaml.safe_load(f_yaml)
+        self.modeling_options = {
+            "windIO_plant": {
+                "wind_farm": {
+                    "name": "unit test farm",
+                    "turbine": data_turbine_yaml,
+                },
+                "site": {
+                    "energy_resource": {
+                        "wind_resource": {
+                            "wind_direction": wind_query.get_directions().tolist(),
+                            "wind_speed": wind_query.get_speeds().tolist(),
+                            "turbulence_intensity": wind_query.get_TIs().tolist(),
+                            "time": np.zeros_like(wind_query.get_speeds().tolist()),
+                            "shear": 0.585,
+                        },
+                        "reference_height": 90.0,
+                    },
+                },
+            },
+            "layout": {
+                "N_turbines": 4,
+            },
+            "aero": {
+                "return_turbine_output": True,
+            },
+        }
+
+        # create the OpenMDAO model
+        model = om.Group()
+        self.FLORIS = model.add_subsystem(
+            "batchFLORIS",
+            farmaero_floris.FLORISBatchPower(
+                modeling_options=self.modeling_options,
+                case_title="letsgo",
+                data_path="",
+            ),
+        )
+
+        self.prob = om.Problem(model)
+        self.prob.setup()
+
+    def test_compute_partials(self):
+
+        self.prob.set_val(
+            "batchFLORIS.x_turbines", np.array([0.0, 650.0, 1300.0, 1950.0])
+        )
+        self.prob.set_val("batchFLORIS.y_turbines", np.array([0.0, 40.0, -40.0, 0.0]))
+        self.prob.set_val("batchFLORIS.yaw_turbines", np.array([5.0, 0.0, -5.0, 0.0]))
+
+        self.prob.run_model()
+
+        # the in-component FD must match OpenMDAO's FD of the full compute
+        cpJ = self.prob.check_partials(method="fd", out_stream=None)
+        for (name_of, name_wrt), data in cpJ["batchFLORIS"].items():
+            assert np.allclose(
+                data["J_fwd"], data["J_fd"], rtol=1.0e-6, atol=1.0e-3
+            ), f"partials of {name_of} wrt {name_wrt} do not match"
+
+    def test_turbine_output_layout(self):
+
+        self.prob.run_model()
+
+        # turbine outputs are turbine-major and contiguous
+        for getter in [
+            self.FLORIS.get_power_turbines,
+            self.FLORIS.get_thrust_turbines,
+        ]:
+            values = getter()
+            assert values.shape == (4, self.FLORIS.fmodel.n_findex)
+            assert values.flags["C_CONTIGUOUS"]
+
+    def test_compute_skips_unchanged_inputs(self, monkeypatch):
+
+        # count the FLORIS wake solves
+        n_runs = []
+        run_orig = self.FLORIS.fmodel.run
+        monkeypatch.setattr(
+            self.FLORIS.fmodel, "run", lambda: n_runs.append(1) or run_orig()
+        )
+
+        self.prob.set_val(
+            "batchFLORIS.x_turbines", np.array([0.0, 650.0, 1300.0, 1950.0])
+        )
+        self.prob.run_model()
+        power_farm = self.prob.get_val("batchFLORIS.power_farm").copy()
+        assert len(n_runs) == 1
+
+        # an unchanged layout and yaw must reuse the last run
+        self.prob.run_model()
+        assert len(n_runs) == 1
+        assert np.all(self.prob.get_val("batchFLORIS.power_farm") == power_farm)
+
+        # a changed layout must trigger a new run
+        self.prob.set_val(
+            "batchFLORIS.x_turbines", np.array([0.0, 650.0, 1300.0, 2600.0])
+        )
+        self.prob.run_model()
+        assert len(n_runs) == 2
+
+    def test_compute_parallel(self):
+
+        # split the wind conditions across two FLORIS workers
+        modeling_options_parallel = copy.deepcopy(self.modeling_options)
+        modeling_options_parallel["floris"] = {"n_workers": 2}
+        model = om.Group()
+        FLORIS_parallel = model.add_subsystem(
+            "batchFLORIS",
+            farmaero_floris.FLORISBatchPower(
+                modeling_options=modeling_options_parallel,
+                case_title="letsgo",
+                data_path="",
+            ),
+        )
+        prob_parallel = om.Problem(model)
+        prob_parallel.setup()
+        assert isinstance(FLORIS_parallel.fmodel, floris.ParFlorisModel)
+
+        # the parallel and serial runs must agree
+        for prob in [self.prob, prob_parallel]:
+            prob.set_val(
+                "batchFLORIS.x_turbines", np.array([0.0, 650.0, 1300.0, 1950.0])
+            )
+            prob.run_model()
+        for name in ["AEP_farm", "power_farm", "power_turbines", "thrust_turbines"]:
+            assert np.allclose(
+                prob_parallel.get_val(f"batchFLORIS.{name}"),
+                self.prob.get_val(f"batchFLORIS.{name}"),
+            )
+
+    def test_no_dump_yaml(self, tmp_path):
+
+        self.FLORIS.dir_floris = tmp_path
+        path_yaml = Path(tmp_path, "batch.yaml")
+
+        # by default, the batch FLORIS inputs are not dumped at all
+        self.prob.run_model()
+        self.prob.cleanup()
+        assert not path_yaml.exists()
+
+    def test_switch_operation_model(self):
+
+        # no peak shaving fraction is given, so the turbine's model is kept
+        assert self.FLORIS.fmodel.get_operation_model() == "cosine-loss"
+
+        # yaw the turbines, which only the cosine loss model penalizes
+        self.prob.set_val("batchFLORIS.yaw_turbines", np.full((4,), 20.0))
+        self.prob.run_model()
+        power_farm = self.prob.get_val("batchFLORIS.power_farm").copy()
+
+        # switching the operation model must force a re-run
+        self.FLORIS.switch_operation_model("simple")
+        assert self.FLORIS.fmodel.get_operation_model() == "simple"
+        self.prob.run_model()
+        assert not np.allclose(self.prob.get_val("batchFLORIS.power_farm"), power_farm)
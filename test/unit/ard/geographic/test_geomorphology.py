@@ -141,6 +141,58 @@ class TestGeomorphologyGridData:
                 self.geomorphology.check_valid_material()
             )  # check if the data is valid
 
+    def test_set_data_values_dtype(self, subtests):
+
+        # create a (non-contiguous) mesh and try to upload it
+        y_data, x_data = np.meshgrid([-1.0, 0.0, 1.0], [0.0, 2.0])
+        z_data = np.asfortranarray(np.ones_like(x_data))
+
+        # set up a geomorphology grid data object
+        self.geomorphology = ard.geographic.GeomorphologyGridData()
+
+        for dtype in [np.float32, np.float64]:
+            # set the precision and the values
+            self.geomorphology.dtype = dtype
+            self.geomorphology.set_data_values(
+                x_data_in=x_data,
+                y_data_in=y_data,
+                z_data_in=z_data,
+            )
+
+            # make sure the values are stored contiguously at that precision
+            for name in ["x_data", "y_data", "z_data"]:
+                with subtests.test(f"set_data_values dtype test, {name}, {dtype}"):
+                    data = getattr(self.geomorphology, name)
+                    assert data.dtype == dtype
+                    assert data.flags["C_CONTIGUOUS"]
+
+    def test_set_data_values_copy(self, subtests):
+
+        # create a contiguous mesh at the storage precision
+        y_data, x_data = np.meshgrid(
+            np.array([-1.0, 0.0, 1.0], dtype=np.float32),
+            np.array([0.0, 2.0], dtype=np.float32),
+        )
+        z_data = np.ones_like(x_data)
+
+        # set up a geomorphology grid data object
+        self.geomorphology = ard.geographic.GeomorphologyGridData()
+
+        for copy in [True, False]:
+            # set the values, either copied or handed over
+            self.geomorphology.set_data_values(
+                x_data_in=x_data,
+                y_data_in=y_data,
+                z_data_in=z_data,
+                copy=copy,
+            )
+
+            # make sure the values are aliased only when ownership is handed over
+            for name, data_in in [("x_data", x_data), ("z_data", z_data)]:
+                with subtests.test(f"set_data_values copy test, {name}, {copy}"):
+                    data = getattr(self.geomorphology, name)
+                    assert np.shares_memory(data, data_in) == (not copy)
+
     def test_set_data_values_material(self, subtests):
 
         # create a mesh and try to upload it
@@ -175,6 +227,12 @@ class TestGeomorphologyGridData:
             assert np.allclose(self.geomorphology.get_z_data(), z_data)
         with subtests.test(f"set_data_values data equivalence tests, material"):
             assert np.all(self.geomorphology.material_data == material_data)
+        with subtests.test(f"set_data_values data equivalence tests, material codes"):
+            assert self.geomorphology.material_labels == ["rock", "soil"]
+            assert self.geomorphology.material_codes.dtype == np.uint8
+            assert np.all(
+                self.geomorphology.material_codes == (material_data == "soil")
+            )
         with subtests.test(f"set_data_values data equivalence tests, get_shape"):
             assert np.all(self.geomorphology.get_shape() == x_data.shape)
 
@@ -252,6 +310,55 @@ class TestGeomorphologyGridData:
                 self.geomorphology._interpolator_device
             )  # same identity
 
+    def test_evaluate_bilinear(self, subtests):
+
+        # create a mesh of a bilinear function, which should be reproduced
+        y_data, x_data = np.meshgrid(
+            np.linspace(-1.0, 1.0, 5), np.linspace(0.0, 2.0, 4) ** 2
+        )
+        fun_data = lambda x, y: 1.0 + 2.0 * x - 3.0 * y + 0.5 * x * y
+        z_data = fun_data(x_data, y_data)
+
+        # set up a geomorphology grid data object
+        self.geomorphology = ard.geographic.GeomorphologyGridData()
+        # set the values
+        self.geomorphology.set_data_values(
+            x_data_in=x_data,
+            y_data_in=y_data,
+            z_data_in=z_data,
+        )
+
+        # grab the depth at points in (and, extrapolating, out of) the domain
+        x_sample = np.array([0.0, 0.3, 1.7, 4.0, -0.5, 4.5])
+        y_sample = np.array([-1.0, 0.2, -0.6, 1.0, 0.0, 1.5])
+
+        with subtests.test(f"evaluate bilinear exactness test"):
+            depth_sample = self.geomorphology.evaluate(
+                x_sample, y_sample, interp_method="bilinear"
+            )
+            assert np.allclose(depth_sample, fun_data(x_sample, y_sample), atol=1e-5)
+
+        with subtests.test(f"evaluate bilinear derivatives test"):
+            dx_depth_sample, dy_depth_sample = self.geomorphology.evaluate(
+                x_sample,
+                y_sample,
+                return_derivs=True,
+                interp_method="bilinear",
+            )
+            assert np.allclose(dx_depth_sample, 2.0 + 0.5 * y_sample, atol=1e-5)
+            assert np.allclose(dy_depth_sample, -3.0 + 0.5 * x_sample, atol=1e-5)
+
+        with subtests.test(f"evaluate bilinear non-rectilinear test"):
+            self.geomorphology.set_data_values(
+                x_data_in=x_data + 0.1 * y_data,
+                y_data_in=y_data,
+                z_data_in=z_data,
+            )
+            with pytest.raises(AssertionError):
+                self.geomorphology.evaluate(
+                    x_sample, y_sample, interp_method="bilinear"
+                )
+
     def test_evaluate_gaussian(self, subtests):
 
         # create a mesh and try to upload it
@@ -357,3 +464,24 @@ class TestBathymetryGridData(TestGeomorphologyGridData):
             assert np.isclose(np.mean(self.bathymetry.z_data), 172.50993464646467)
         with subtests.test(f"moorpy load statistics test: std"):
             assert np.isclose(np.std(self.bathymetry.z_data), 4.555364127422273)
+
+        # the grid is rectilinear, so only its 1D coordinates should be stored
+        with subtests.test(f"moorpy load rectilinear coordinates test"):
+            assert self.bathymetry.x_coord.shape == (100,)
+            assert self.bathymetry.y_coord.shape == (99,)
+            y_data, x_data = np.meshgrid(
+                self.bathymetry.y_coord, self.bathymetry.x_coord
+            )
+            assert np.all(self.bathymetry.x_data == x_data)
+            assert np.all(self.bathymetry.y_data == y_data)
+            assert self.bathymetry.x_data.strides[1] == 0  # zero-copy view
+            assert self.bathymetry.y_data.strides[0] == 0  # zero-copy view
+
+        # the bilinear interpolant must reproduce the grid at its nodes
+        with subtests.test(f"moorpy load bilinear nodes test"):
+            depth_nodes = self.bathymetry.evaluate(
+                self.bathymetry.x_data.flatten(),
+                self.bathymetry.y_data.flatten(),
+                interp_method="bilinear",
+            )
+            assert np.allclose(depth_nodes, self.bathymetry.z_data.flatten())
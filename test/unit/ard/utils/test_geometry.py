@@ -42,6 +42,43 @@ class TestGetNearestPolygons:
 
         assert np.allclose(test_result, expected_regions)
 
+    def test_get_nearest_polygons_outside_all_regions(self):
+
+        points = np.array([[-0.5, 0.5], [2.25, 0.5], [0.5, 0.5]], dtype=float)
+        polygons = [
+            np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=float),
+            np.array([[1, 0], [2, 0], [2, 1]], dtype=float),
+        ]
+        expected_regions = np.array([0, 1, 0], dtype=int)
+
+        test_result = geo_utils.get_nearest_polygons(
+            boundary_vertices=polygons,
+            points_x=points[:, 0],
+            points_y=points[:, 1],
+        )
+
+        assert np.all(test_result == expected_regions)
+
+
+@pytest.mark.usefixtures("subtests")
+class TestDistanceMultiPointToPolygonRayCasting:
+    """
+    Test for distance_multi_point_to_polygon_ray_casting
+    """
+
+    def test_distance_multi_point_to_polygon_inside_outside(self):
+
+        points = np.array([[0.25, 0.5], [1.5, 0.5], [0.5, -0.25]])
+        polygon = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+
+        expected_distance = [-0.25, 0.5, 0.25]
+
+        test_result = geo_utils.distance_multi_point_to_polygon_ray_casting(
+            points, polygon
+        )
+
+        assert np.allclose(test_result, expected_distance)
+
 
 @pytest.mark.usefixtures("subtests")
 class TestDistancePointToMultiPolygonRayCasting:
@@ -92,6 +129,96 @@ class TestDistancePointToMultiPolygonRayCasting:
 
         assert np.allclose(test_result, expected_distance)
 
+    def test_distance_multi_point_to_multi_polygon_different_sizes(self):
+
+        # polygons away from the origin, with different numbers of vertices
+        points = np.array([[10.5, 0.5], [12.5, 0.25], [6.0, 0.0]])
+        polygons = [
+            np.array([[10, 0], [11, 0], [11, 1], [10, 1]], dtype=float),
+            np.array([[12, 0], [13, 0], [13, 1]], dtype=float),
+        ]
+        regions = np.array([0, 1, 1])
+
+        expected_distance = [-0.5, -0.25 / np.sqrt(2.0), 6.0]
+
+        test_result = geo_utils.distance_multi_point_to_multi_polygon_ray_casting(
+            boundary_vertices=polygons,
+            points_x=points[:, 0],
+            points_y=points[:, 1],
+            regions=regions,
+        )
+
+        assert np.allclose(test_result, expected_distance, atol=2e-3)
+
+    def test_distance_multi_point_to_multi_polygon_numba(self, subtests):
+
+        points = np.array([[0.25, 0.5], [2.5, 0.5], [1.75, 0.5], [0.5, 1.5]])
+        polygons = [
+            np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=float),
+            np.array([[1, 0], [2, 0], [2, 1]], dtype=float),
+        ]
+        regions = np.array([0, 1, 1, 0])
+
+        expected_distance = [-0.25, 0.5, -0.25 / np.sqrt(2.0), 0.5]
+
+        c = np.zeros(len(points))
+        test_result = geo_utils.distance_multi_point_to_multi_polygon_ray_casting(
+            boundary_vertices=polygons,
+            points_x=points[:, 0],
+            points_y=points[:, 1],
+            regions=regions,
+            backend="numba",
+            c=c,
+        )
+
+        with subtests.test("values"):
+            assert np.allclose(test_result, expected_distance)
+
+        with subtests.test("preallocated output"):
+            assert test_result is c
+
+        with subtests.test("invalid backend"):
+            with pytest.raises(ValueError):
+                geo_utils.distance_multi_point_to_multi_polygon_ray_casting(
+                    boundary_vertices=polygons,
+                    points_x=points[:, 0],
+                    points_y=points[:, 1],
+                    regions=regions,
+                    backend="fortran",
+                )
+
+    def test_distance_multi_point_to_multi_polygon_batched(self, subtests):
+
+        points = np.array([[0.25, 0.5], [2.5, 0.5], [1.75, 0.5], [0.5, 1.5]])
+        polygons = [
+            np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=float),
+            np.array([[1, 0], [2, 0], [2, 1]], dtype=float),
+        ]
+        regions = np.array([0, 1, 1, 0])
+
+        def distances(points_x, points_y, batch_size):
+            return geo_utils.distance_multi_point_to_multi_polygon_ray_casting(
+                boundary_vertices=polygons,
+                points_x=points_x,
+                points_y=points_y,
+                regions=regions,
+                batch_size=batch_size,
+            )
+
+        expected_result = distances(points[:, 0], points[:, 1], None)
+        expected_jac = jax.jacrev(distances, [0, 1])(points[:, 0], points[:, 1], None)
+
+        for batch_size in [1, 3, 4]:
+            with subtests.test("values", batch_size=batch_size):
+                test_result = distances(points[:, 0], points[:, 1], batch_size)
+                assert np.allclose(test_result, expected_result)
+
+            with subtests.test("jacobian", batch_size=batch_size):
+                test_jac = jax.jacrev(distances, [0, 1])(
+                    points[:, 0], points[:, 1], batch_size
+                )
+                assert np.allclose(test_jac, expected_jac)
+
     def test_distance_multi_point_to_multi_polygon_inside_outside_multiple_regions_jac(
         self, subtests
     ):
@@ -216,6 +343,46 @@ class TestDistancePointToPolygonRayCasting:
                 )
 
 
+@pytest.mark.usefixtures("subtests")
+class TestPolygonEdges:
+    """
+    Test for polygon_edges
+    """
+
+    def test_polygon_edges(self, subtests):
+
+        polygons = [
+            np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=float),
+            np.array([[1, 0], [2, 0], [2, 0], [2, 1]], dtype=float),
+        ]
+
+        (
+            starts_x,
+            starts_y,
+            ends_x,
+            ends_y,
+            vectors_x,
+            vectors_y,
+            inv_lengths_squared,
+            slopes,
+            offsets,
+        ) = geo_utils.polygon_edges(polygons)
+
+        with subtests.test("offsets"):
+            assert np.all(offsets == [0, 4, 8])
+
+        with subtests.test("closed loops"):
+            assert np.all(ends_x == [1, 1, 0, 0, 2, 2, 2, 1])
+            assert np.all(ends_y == [0, 1, 1, 0, 0, 0, 1, 0])
+
+        with subtests.test("edge vectors"):
+            assert np.all(vectors_x == ends_x - starts_x)
+            assert np.all(vectors_y == ends_y - starts_y)
+
+        with subtests.test("inverse squared lengths, zero for a zero-length edge"):
+            assert np.allclose(inv_lengths_squared, [1, 1, 1, 1, 1, 0, 1, 0.5])
+
+
 @pytest.mark.usefixtures("subtests")
 class TestPolygonNormalsCalculator:
     """
@@ -247,6 +414,14 @@ class TestPolygonNormalsCalculator:
             with subtests.test(f"polygon {i}"):
                 assert np.allclose(r, expected_normals[i])
 
+    def test_polygon_normals_calculator_dtype(self):
+
+        polygon = np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=np.float64)
+
+        test_result = geo_utils.polygon_normals_calculator(polygon, n_polygons=1)
+
+        assert test_result[0].dtype == geo_utils.DTYPE
+
 
 @pytest.mark.usefixtures("subtests")
 class TestMultiPolygonNormalsCalculator:
@@ -533,6 +708,22 @@ class TestGetClosestPointOnLineSeg:
 
         assert np.all(test_result == np.array([0, 0, 2]))
 
+    def test_get_closest_point_on_line_seg_zero_length(self):
+        """
+        Test for a line segment that is a single point
+        """
+
+        test_point = np.array([5, 5, 2], dtype=float)
+        test_start = np.array([1, 1, 1], dtype=float)
+        test_end = np.array([1, 1, 1], dtype=float)
+        line_vector = test_end - test_start
+
+        test_result = geo_utils.get_closest_point_on_line_seg(
+            test_point, test_start, test_end, line_vector
+        )
+
+        assert np.all(test_result == test_start)
+
     def test_get_closest_point_on_line_seg_jac(self, subtests):
         """
         Test for gradient for a point near the middle of the line segment
@@ -711,6 +902,27 @@ class TestPointToLineSeg:
                 "Unexpected AssertionError when checking gradients, gradients may be incorrect"
             )
 
+    def test_distance_point_to_lineseg_nd_vec(self):
+        """
+        Test that the vectorized version matches the single segment version
+        """
+
+        test_point = np.array([5, 5, 2], dtype=float)
+        test_starts = np.array(
+            [[0, 0, 0], [0, 0, 0], [0, 0, 0], [1, 1, 1]], dtype=float
+        )
+        test_ends = np.array([[0, 0, 5], [5, 5, 5], [-5, 0, 0], [1, 1, 1]], dtype=float)
+
+        test_result = geo_utils.distance_point_to_lineseg_nd_vec(
+            test_point, test_starts, test_ends
+        )
+        expected_result = [
+            geo_utils.distance_point_to_lineseg_nd(test_point, start, end)
+            for start, end in zip(test_starts, test_ends)
+        ]
+
+        assert np.allclose(test_result, expected_result)
+
 
 class TestLineSegToLineSeg:
     def setup_method(self):
@@ -1176,3 +1388,48 @@ class TestLineSegToLineSeg:
             pytest.fail(
                 "Unexpected AssertionError when checking gradients, gradients may be incorrect"
             )
+
+    def test_distance_lineseg_to_lineseg_nd_point_segments(self):
+        """
+        Test distance between line segments 3d when one of the segments is a point
+        """
+
+        point = np.array([0.0, 3.0, 0.0])
+        line = np.array([np.array([0.0, 0.0, 0.0]), np.array([5.0, 0.0, 0.0])])
+
+        test_result_a = geo_utils.distance_lineseg_to_lineseg_nd(
+            line_a_start=point,
+            line_a_end=point,
+            line_b_start=line[0],
+            line_b_end=line[1],
+        )
+        test_result_b = geo_utils.distance_lineseg_to_lineseg_nd(
+            line_a_start=line[0],
+            line_a_end=line[1],
+            line_b_start=point,
+            line_b_end=point,
+        )
+
+        assert test_result_a == pytest.approx(3.0)
+        assert test_result_b == pytest.approx(3.0)
+
+    def test_distance_lineseg_to_lineseg_nd_vmap(self):
+        """
+        Test distance between line segments 3d vectorized over segment pairs
+        """
+
+        line_a_starts = np.array([[0, 0, 0], [0, 0, 0], [0, 3, 0]], dtype=float)
+        line_a_ends = np.array([[0, 0, 5], [0, 5, 0], [0, 3, 0]], dtype=float)
+        line_b_starts = np.array([[5, 0, 0], [-1, 1, 1], [0, 0, 0]], dtype=float)
+        line_b_ends = np.array([[5, 0, 5], [1, 1, 1], [5, 0, 0]], dtype=float)
+
+        test_result = jax.vmap(geo_utils.distance_lineseg_to_lineseg_nd)(
+            line_a_starts, line_a_ends, line_b_starts, line_b_ends
+        )
+
+        expected_result = [
+            geo_utils.distance_lineseg_to_lineseg_nd(*segments)
+            for segments in zip(line_a_starts, line_a_ends, line_b_starts, line_b_ends)
+        ]
+
+        assert np.allclose(test_result, expected_result)